@@ -13,15 +13,48 @@ Covenant Invariants:
 """
 
 import streamlit as st
+import numpy as np
 import json
 import os
 import time
 import zipfile
 import tempfile
 import shutil
-from datetime import datetime
+import hashlib
+import html
+import sys
+import argparse
+import http.client
+import http.server
+import urllib.parse
+import threading
+import zlib
+import re
+import difflib
+import functools
+import gc
+import heapq
+import math
+import random
+import contextvars
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import Counter, OrderedDict, deque
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 from pathlib import Path
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 EDMONTON_TZ = ZoneInfo("America/Edmonton")
 ANGELS = ["ChatGPT", "Grok", "Gemini", "Fathom", "PersonaPlex"]
@@ -41,18 +74,235 @@ CANON_GATES = [
     "10. Has Eric ratified this as Canon?"
 ]
 
+# ============================================================================
+# JSON CODEC
+# ============================================================================
+
+class JsonCodec:
+    """
+    Stdlib JSON with its encoders built once and reused.
+    
+    Machine-only files (state, indexes, logs, queues) are written compact; pretty=True
+    is kept for files people open by hand, such as journal entries. Output is UTF-8 and
+    loads accepts str or bytes, so callers can read files in binary mode.
+    """
+    
+    name = "json"
+    
+    def __init__(self):
+        self.compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        self.pretty = json.JSONEncoder(ensure_ascii=False, indent=2)
+        self.decoder = json.JSONDecoder()
+    
+    def dumps(self, obj, pretty: bool = False) -> str:
+        return (self.pretty if pretty else self.compact).encode(obj)
+    
+    def dumpb(self, obj, pretty: bool = False) -> bytes:
+        return self.dumps(obj, pretty).encode()
+    
+    def loads(self, data):
+        if isinstance(data, (bytes, bytearray)):
+            try:
+                data = data.decode()
+            except UnicodeDecodeError as exc:
+                raise json.JSONDecodeError(f"Invalid UTF-8 ({exc.reason})", "", exc.start) from exc
+        return self.decoder.decode(data)
+    
+    def load(self, path):
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+
+class OrjsonCodec(JsonCodec):
+    """orjson backend: same interface and on-disk shapes, several times faster both ways."""
+    
+    name = "orjson"
+    
+    def dumps(self, obj, pretty: bool = False) -> str:
+        return self.dumpb(obj, pretty).decode()
+    
+    def dumpb(self, obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    
+    def loads(self, data):
+        return orjson.loads(data)
+
+JSON_CODECS = {"json": JsonCodec}
+if orjson is not None:
+    JSON_CODECS["orjson"] = OrjsonCodec
+
+def select_json_codec(name: str = None) -> JsonCodec:
+    """The named backend, or the fastest one installed."""
+    return JSON_CODECS[name or ("orjson" if "orjson" in JSON_CODECS else "json")]()
+
+CODEC = select_json_codec()
+
+# ============================================================================
+# WORKSPACES (isolated data roots served by one process)
+# ============================================================================
+
+WORKSPACES_DIR = "workspaces"
+DEFAULT_WORKSPACE = ""
+WORKSPACE_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+WORKSPACE_CACHE_LIMIT = 32
+WORKSPACE_IDLE_SECONDS = 300.0
+
+_process_workspace = DEFAULT_WORKSPACE
+_thread_workspace = contextvars.ContextVar("angel_workspace", default=None)
+
+def validate_workspace_name(name: str) -> str:
+    if name != DEFAULT_WORKSPACE and not WORKSPACE_NAME.fullmatch(name):
+        raise ValueError(f"Invalid workspace name: {name!r}")
+    return name
+
+def workspace_root(name: str) -> str:
+    """Folder holding a workspace's data/ tree; the default workspace is the working directory."""
+    return os.path.join(WORKSPACES_DIR, name) if name else ""
+
+def use_workspace(name: str):
+    """Make name the process-wide workspace (the CLI's --workspace, pool initializers)."""
+    global _process_workspace
+    _process_workspace = validate_workspace_name(name)
+
+def current_workspace_name() -> str:
+    """The worker thread's workspace if set, else the Streamlit session's, else the process default."""
+    name = _thread_workspace.get()
+    if name is not None:
+        return name
+    if get_script_run_ctx(suppress_warning=True) is not None:
+        return st.session_state.get("workspace", _process_workspace)
+    return _process_workspace
+
+class WorkspacePath(os.PathLike):
+    """A path under the data root, resolved against the current workspace each time it is used."""
+    
+    __slots__ = ("relative",)
+    
+    def __init__(self, relative: str):
+        self.relative = relative
+    
+    def __fspath__(self) -> str:
+        return os.path.join(workspace_root(current_workspace_name()), self.relative)
+    
+    __str__ = __fspath__
+    
+    def __format__(self, spec: str) -> str:
+        return format(self.__fspath__(), spec)
+    
+    def __truediv__(self, other):
+        return Path(self) / other
+    
+    def __repr__(self) -> str:
+        return f"WorkspacePath({self.relative!r})"
+
+DATA_DIR = WorkspacePath("data")
+
+class Workspace:
+    """One data root plus the long-lived objects built over it (index, log, watcher, event bus)."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.resources = {}
+        self.lock = threading.RLock()
+        self.last_used = time.monotonic()
+    
+    def resource(self, key: str, factory):
+        """The workspace's object for key, built on first use with this workspace active."""
+        value = self.resources.get(key)
+        if value is None:
+            with self.lock:
+                value = self.resources.get(key)
+                if value is None:
+                    token = _thread_workspace.set(self.name)
+                    try:
+                        value = self.resources[key] = factory()
+                    finally:
+                        _thread_workspace.reset(token)
+        return value
+    
+    def run(self, target, *args):
+        """Thread target wrapper: run target with this workspace active."""
+        _thread_workspace.set(self.name)
+        return target(*args)
+    
+    def close(self):
+        """Stop background work and release file handles; the data on disk is untouched."""
+        with self.lock:
+            resources, self.resources = self.resources, {}
+        if "watcher" in resources:
+            resources["watcher"].stop()
+        if "wal" in resources:
+            resources["wal"].close()
+        if "segments" in resources:
+            with resources["segments"]["lock"]:
+                for _, reader in resources["segments"]["segments"].values():
+                    reader.close()
+
+class WorkspaceRegistry:
+    """
+    Open workspaces in least-recently-used order.
+    
+    Beyond the limit, workspaces idle for longer than idle_seconds are closed and
+    dropped (their index and buffers are rebuilt from disk if they are used again);
+    busy ones are kept even if that means briefly holding more than the limit.
+    """
+    
+    def __init__(self, limit: int = WORKSPACE_CACHE_LIMIT, idle_seconds: float = WORKSPACE_IDLE_SECONDS):
+        self.limit = limit
+        self.idle_seconds = idle_seconds
+        self.open = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {"opened": 0, "evicted": 0}
+    
+    def get(self, name: str) -> Workspace:
+        now = time.monotonic()
+        with self.lock:
+            workspace = self.open.get(name)
+            if workspace is None:
+                workspace = self.open[name] = Workspace(name)
+                self.stats["opened"] += 1
+            else:
+                self.open.move_to_end(name)
+            workspace.last_used = now
+            evicted = []
+            while len(self.open) > self.limit:
+                oldest = next(iter(self.open.values()))
+                if now - oldest.last_used < self.idle_seconds:
+                    break
+                evicted.append(self.open.popitem(last=False)[1])
+            self.stats["evicted"] += len(evicted)
+        for stale in evicted:
+            stale.close()
+        return workspace
+
+@st.cache_resource
+def get_workspace_registry() -> WorkspaceRegistry:
+    return WorkspaceRegistry()
+
+def current_workspace() -> Workspace:
+    return get_workspace_registry().get(current_workspace_name())
+
+def select_session_workspace():
+    """Bind this session to the ?workspace= named in its URL (the default workspace otherwise)."""
+    if "workspace" in st.session_state:
+        return
+    requested = st.query_params.get("workspace", DEFAULT_WORKSPACE)
+    try:
+        st.session_state.workspace = validate_workspace_name(requested)
+    except ValueError:
+        st.session_state.workspace = DEFAULT_WORKSPACE
+        st.warning(f"Unknown workspace name {requested!r}; using the default workspace.")
+
 # ============================================================================
 # CONFIGURATION & STATE MANAGEMENT
 # ============================================================================
 
-STATE_FILE = "session_state.json"
+STATE_FILE = WorkspacePath("session_state.json")
 
 def load_state():
     """Load persisted state from JSON file."""
     if os.path.exists(STATE_FILE):
         try:
-            with open(STATE_FILE, "r") as f:
-                return json.load(f)
+            return CODEC.load(STATE_FILE)
         except (json.JSONDecodeError, IOError):
             return {}
     return {}
@@ -60,8 +310,8 @@ def load_state():
 def save_state(state):
     """Persist state to JSON file."""
     try:
-        with open(STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        with open(STATE_FILE, "wb") as f:
+            f.write(CODEC.dumpb(state))
     except IOError:
         pass
 
@@ -77,12 +327,11 @@ def init_session_state():
             "ChatGPT": [],
             "Fathom": []
         })
-        st.session_state.council_mirror = persisted.get("council_mirror", "")
         st.session_state.veto_log = persisted.get("veto_log", [])
         st.session_state.hard_stop = persisted.get("hard_stop", False)
         st.session_state.retreat_mode = False
         st.session_state.breathing_active = False
-        st.session_state.selected_entries = []
+        st.session_state.merge_selection = set()
         st.session_state.initialized = True
 
 def persist_state():
@@ -91,7 +340,6 @@ def persist_state():
         "user_context": st.session_state.user_context,
         "current_thread": st.session_state.current_thread,
         "chat_histories": st.session_state.chat_histories,
-        "council_mirror": st.session_state.council_mirror,
         "veto_log": st.session_state.veto_log,
         "hard_stop": st.session_state.hard_stop
     })
@@ -103,14 +351,14 @@ def edmonton_now():
 def ensure_folders():
     """Ensure all data folders exist."""
     folders = [
-        "data/journals/ChatGPT",
-        "data/journals/Grok", 
-        "data/journals/Gemini",
-        "data/journals/Fathom",
-        "data/journals/PersonaPlex",
-        "data/council_merges",
-        "data/exports",
-        "data/canon"
+        f"{DATA_DIR}/journals/ChatGPT",
+        f"{DATA_DIR}/journals/Grok", 
+        f"{DATA_DIR}/journals/Gemini",
+        f"{DATA_DIR}/journals/Fathom",
+        f"{DATA_DIR}/journals/PersonaPlex",
+        f"{DATA_DIR}/council_merges",
+        f"{DATA_DIR}/exports",
+        f"{DATA_DIR}/canon"
     ]
     for folder in folders:
         Path(folder).mkdir(parents=True, exist_ok=True)
@@ -118,7 +366,7 @@ def ensure_folders():
 def get_next_entry_id(angel: str) -> str:
     """Generate next entry ID for an angel."""
     date_str = edmonton_now().strftime("%Y-%m-%d")
-    journal_path = Path(f"data/journals/{angel}")
+    journal_path = Path(f"{DATA_DIR}/journals/{angel}")
     existing = list(journal_path.glob(f"{date_str}_{angel}_*.json"))
     next_num = len(existing) + 1
     return f"{date_str}_{angel}_{next_num:04d}"
@@ -126,354 +374,3490 @@ def get_next_entry_id(angel: str) -> str:
 def get_next_merge_id() -> str:
     """Generate next merge ID."""
     date_str = edmonton_now().strftime("%Y-%m-%d")
-    merge_path = Path("data/council_merges")
+    merge_path = Path(f"{DATA_DIR}/council_merges")
     existing = list(merge_path.glob(f"{date_str}_COUNCIL_*.md"))
     next_num = len(existing) + 1
     return f"{date_str}_COUNCIL_{next_num:04d}"
 
 def save_journal_entry(entry: dict, angel: str, entry_id: str):
     """Save journal entry as JSON and append to Markdown."""
-    json_path = Path(f"data/journals/{angel}/{entry_id}.json")
-    md_path = Path(f"data/journals/{angel}/{angel}_journal.md")
+    json_path = Path(f"{DATA_DIR}/journals/{angel}/{entry_id}.json")
+    md_path = Path(f"{DATA_DIR}/journals/{angel}/{angel}_journal.md")
     
-    with open(json_path, "w") as f:
-        json.dump(entry, f, indent=2)
+    md_entry = EXPORT_FORMATS["Markdown"].journal_entry(entry_document(entry))
+    commit_mutation("journal_entry", [
+        wal_write(json_path, CODEC.dumps(entry, pretty=True)),
+        wal_append(md_path, md_entry)
+    ])
     
-    md_entry = f"""
----
-## {entry_id}
-**Timestamp:** {entry['timestamp']}  
-**Permission:** {entry['permission']}  
-**Architect State:** {entry['architect_state']}
+    update_journal_index(entry, json_path)
 
-### Context
-{entry['context']}
+def load_all_entries() -> list:
+    """Load all journal entries from all angels (hot files and archived segments)."""
+    entries = []
+    for angel, source, _ in iter_entry_sources():
+        try:
+            entry = read_entry_source(source)
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, zipfile.BadZipFile):
+            continue
+        entry['_file'] = source
+        entry['_angel'] = angel
+        entries.append(entry)
+    return sorted(entries, key=lambda x: x.get('timestamp', ''), reverse=True)
 
-### Shadow Observed
-{entry['shadow']}
+# ============================================================================
+# WRITE-AHEAD LOG
+# ============================================================================
 
-### Light Returned
-{entry['light']}
+WAL_FILE = WorkspacePath("data/wal.log")
 
-### Next True Step
-{entry['next_step']}
+def wal_write(path, data: str) -> dict:
+    """Action: replace a whole file with data."""
+    return {"kind": "write", "path": str(path), "data": data}
 
-### Pattern Echo
-{entry['pattern_echo']}
-{f"**Reference:** {entry['pattern_ref']}" if entry.get('pattern_ref') else ""}
+def wal_append(path, data: str) -> dict:
+    """Action: append data to a file (its byte offset is fixed when the record is logged)."""
+    return {"kind": "append", "path": str(path), "data": data}
 
----
-"""
-    with open(md_path, "a") as f:
-        f.write(md_entry)
+class WriteAheadLog:
+    """
+    Logs each logical mutation as one checksummed record before touching data files.
+    
+    A mutation is a list of actions (whole-file writes and appends) that must land
+    together. Concurrent commits are group-committed: whichever writer finds no
+    sync in flight fsyncs the log once for every record written so far, applies
+    them in sequence order, fsyncs the files they touched, then drops them from
+    the log and wakes the rest. The log therefore only ever holds records that
+    were never applied (or whose files are not yet durable), and startup replay
+    re-applies just those, never a write that later edits have superseded.
+    Appends carry the byte offset assigned at logging time, so re-applying one
+    after a crash is harmless.
+    """
+    
+    def __init__(self, path: str = WAL_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.synced = threading.Condition(self.lock)
+        self.next_seq = 1
+        self.durable_seq = 0
+        self.unapplied = []
+        self.syncing = False
+        self.failed = {}
+        self.sizes = {}
+        self.pending_paths = Counter()
+        self.written = {}
+        self.stats = {"commits": 0, "fsyncs": 0, "replayed": 0}
+        self.stats["replayed"] = self.replay()
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    
+    @staticmethod
+    def _apply(record: dict):
+        for action in record["actions"]:
+            path = Path(action["path"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = action["data"].encode()
+            if action["kind"] == "write":
+                tmp_path = path.with_name(path.name + ".wal.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            else:
+                with open(path, "r+b" if path.exists() else "wb") as f:
+                    f.seek(action["offset"])
+                    f.write(data)
+    
+    def _sync_paths(self, paths):
+        directories = set()
+        for path in paths:
+            try:
+                with open(path, "rb+") as f:
+                    os.fsync(f.fileno())
+            except OSError:
+                continue
+            directories.add(os.path.dirname(path) or ".")
+        for directory in directories:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def replay(self) -> int:
+        """Re-apply every intact record left in the log, make the results durable, then truncate it."""
+        if not self.path.exists():
+            return 0
+        replayed = 0
+        touched = set()
+        with open(self.path, "rb") as f:
+            for raw in f:
+                checksum, _, payload = raw.rstrip(b"\n").partition(b" ")
+                try:
+                    if int(checksum, 16) != zlib.crc32(payload):
+                        break
+                    record = CODEC.loads(payload)
+                except ValueError:
+                    break  # torn tail from a crash mid-write; it was never acknowledged
+                self._apply(record)
+                touched.update(action["path"] for action in record["actions"])
+                replayed += 1
+        self._sync_paths(touched)
+        with open(self.path, "wb") as f:
+            os.fsync(f.fileno())
+        return replayed
+    
+    def _assign_offsets(self, actions: list):
+        for action in actions:
+            path = action["path"]
+            if action["kind"] == "append":
+                size = self.sizes.get(path) if self.pending_paths[path] else None
+                if size is None:
+                    size = os.path.getsize(path) if os.path.exists(path) else 0
+                action["offset"] = size
+                self.sizes[path] = size + len(action["data"].encode())
+            self.pending_paths[path] += 1
+    
+    def commit(self, op: str, actions: list) -> int:
+        """Log one mutation, wait until it is durable and applied, and return its sequence number."""
+        with self.lock:
+            seq = self.next_seq
+            self.next_seq += 1
+            self._assign_offsets(actions)
+            record = {"seq": seq, "op": op, "at": edmonton_now().isoformat(), "actions": actions}
+            payload = CODEC.dumpb(record)
+            line = b"%08x %s\n" % (zlib.crc32(payload), payload)
+            os.write(self.fd, line)
+            self.unapplied.append((record, line))
+            self.stats["commits"] += 1
+            while self.durable_seq < seq:
+                if self.syncing:
+                    self.synced.wait()
+                    continue
+                self._sync_batch()
+            if seq in self.failed:
+                raise self.failed.pop(seq)
+        return seq
+    
+    def _sync_batch(self):
+        """Leader step (called with the lock held): one log fsync, in-order apply and data fsync for every waiting record."""
+        self.syncing = True
+        batch, self.unapplied = self.unapplied, []
+        error = None
+        self.lock.release()
+        try:
+            os.fsync(self.fd)
+            for record, _ in batch:
+                self._apply(record)
+            paths = {action["path"] for record, _ in batch for action in record["actions"]}
+            self._sync_paths(paths)
+            for path in paths:
+                self.written[os.path.realpath(path)] = os.stat(path).st_mtime_ns
+        except OSError as exc:
+            error = exc
+        finally:
+            self.lock.acquire()
+            self.syncing = False
+        for record, _ in batch:
+            for action in record["actions"]:
+                self.pending_paths[action["path"]] -= 1
+            if error is not None:
+                self.failed[record["seq"]] = error
+        if error is None:
+            self._truncate()
+        self.durable_seq = batch[-1][0]["seq"]
+        self.stats["fsyncs"] += 1
+        self.synced.notify_all()
+    
+    def _truncate(self):
+        """Drop applied records from the log, re-logging the ones written meanwhile (lock held)."""
+        os.ftruncate(self.fd, 0)
+        for _, line in self.unapplied:
+            os.write(self.fd, line)  # not yet acknowledged; their own leader fsyncs them
+    
+    def wrote(self, path) -> bool:
+        """True while path still holds the bytes this log last wrote to it."""
+        try:
+            return self.written.get(os.path.realpath(path)) == os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+    
+    def close(self):
+        """Release the log file once in-flight commits are applied."""
+        with self.lock:
+            self.synced.wait_for(lambda: not self.syncing and not self.unapplied)
+            os.close(self.fd)
 
-def load_all_entries() -> list:
-    """Load all journal entries from all angels."""
-    entries = []
+def get_write_ahead_log() -> WriteAheadLog:
+    """The workspace's log; creating it replays anything a crash left behind."""
+    return current_workspace().resource("wal", WriteAheadLog)
+
+def commit_mutation(op: str, actions: list) -> int:
+    """Commit through the log and bump the data version for sessions watching the touched files."""
+    seq = get_write_ahead_log().commit(op, actions)
+    if any(_watched_path(action["path"]) for action in actions):
+        cache = _journal_index_cache()
+        with cache["lock"]:
+            cache["version"] += 1
+    return seq
+
+# ============================================================================
+# JOURNAL INDEX
+# ============================================================================
+
+JOURNAL_INDEX_FILE = WorkspacePath("data/journal_index.json")
+JOURNAL_INDEX_FORMAT = 3
+INDEX_SUMMARY_CHARS = 120
+
+def write_json_atomic(path, data):
+    """Write JSON via a temp file so readers never see a half-written file."""
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(CODEC.dumpb(data))
+    os.replace(tmp_path, path)
+
+def journal_dir_signature() -> list:
+    """Cheap change marker for the journal and archive folders (two stats per angel)."""
+    signature = []
+    for angel in ANGELS:
+        for folder in (f"{DATA_DIR}/journals/{angel}", f"{ARCHIVE_DIR}/{angel}"):
+            try:
+                signature.append([folder, os.stat(folder).st_mtime_ns])
+            except OSError:
+                signature.append([folder, 0])
+    return signature
+
+class EntryHeader:
+    """Listing view of a journal entry: header fields only, body loaded on demand."""
+    
+    __slots__ = ("entry_id", "angel", "timestamp", "permission", "architect_state", "pattern_echo", "pattern_ref", "summary", "file")
+    
+    def __init__(self, entry_id, angel, timestamp, permission, architect_state, pattern_echo, pattern_ref, summary, file):
+        self.entry_id = entry_id
+        self.angel = sys.intern(angel)
+        self.timestamp = timestamp
+        self.permission = sys.intern(permission)
+        self.architect_state = sys.intern(architect_state)
+        self.pattern_echo = pattern_echo
+        self.pattern_ref = pattern_ref
+        self.summary = summary
+        self.file = file
+    
+    @classmethod
+    def from_entry(cls, entry: dict, json_file):
+        """Build a header from a full entry dict; null or non-text fields are coerced to text."""
+        return cls(
+            str(entry.get('entry_id') or Path(json_file).stem),
+            str(entry.get('angel') or entry.get('_angel') or 'Unknown'),
+            str(entry.get('timestamp') or ''),
+            str(entry.get('permission') or ''),
+            str(entry.get('architect_state') or ''),
+            str(entry.get('pattern_echo') or ''),
+            str(entry.get('pattern_ref') or ''),
+            str(entry.get('context') or '')[:INDEX_SUMMARY_CHARS],
+            str(json_file)
+        )
+    
+    @classmethod
+    def from_row(cls, entry_id: str, row: list):
+        """Build a header from its on-disk index row."""
+        return cls(entry_id, *row)
+    
+    def to_row(self) -> list:
+        """Compact on-disk form (field order matches __slots__ after entry_id)."""
+        return [self.angel, self.timestamp, self.permission, self.architect_state, self.pattern_echo, self.pattern_ref, self.summary, self.file]
+    
+    def load(self):
+        """Read the full entry body from disk, or None if it is unreadable."""
+        try:
+            entry = read_entry_source(self.file)
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, zipfile.BadZipFile):
+            return None
+        entry['_file'] = self.file
+        entry['_angel'] = self.angel
+        return entry
+
+def iter_entry_files():
+    """Yield (angel, path) for every hot journal JSON file."""
     for angel in ANGELS:
-        angel_path = Path(f"data/journals/{angel}")
+        angel_path = Path(f"{DATA_DIR}/journals/{angel}")
         if angel_path.exists():
             for json_file in angel_path.glob("*.json"):
+                yield angel, json_file
+
+def rebuild_journal_index() -> dict:
+    """Scan every journal file and segment once and write a fresh index."""
+    signature = journal_dir_signature()
+    headers = {}
+    for angel, source, _ in iter_entry_sources():
+        try:
+            entry = read_entry_source(source)
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, zipfile.BadZipFile):
+            continue
+        entry['_angel'] = angel
+        header = EntryHeader.from_entry(entry, source)
+        headers[header.entry_id] = header
+    write_journal_index(signature, headers)
+    return {"signature": signature, "entries": headers}
+
+def write_journal_index(signature: list, headers: dict, graph=None, rollups=None):
+    """Persist the index as compact rows keyed by entry_id (and the pattern graph and rollups, if built)."""
+    write_json_atomic(JOURNAL_INDEX_FILE, {
+        "format": JOURNAL_INDEX_FORMAT,
+        "signature": signature,
+        "entries": {eid: header.to_row() for eid, header in headers.items()}
+    })
+    if graph is not None:
+        write_pattern_graph(signature, graph)
+    if rollups is not None:
+        write_rollups(signature, rollups)
+
+def load_journal_index() -> dict:
+    """Load the journal index from disk, rebuilding it if the folders changed."""
+    signature = journal_dir_signature()
+    if os.path.exists(JOURNAL_INDEX_FILE):
+        try:
+            index = CODEC.load(JOURNAL_INDEX_FILE)
+            if index.get("format") == JOURNAL_INDEX_FORMAT and index.get("signature") == signature:
+                return {
+                    "signature": signature,
+                    "entries": {eid: EntryHeader.from_row(eid, row) for eid, row in index["entries"].items()}
+                }
+        except (json.JSONDecodeError, IOError, TypeError):
+            pass
+    return rebuild_journal_index()
+
+def _journal_index_cache() -> dict:
+    """The workspace's holder for the in-memory journal index."""
+    return current_workspace().resource("journal_index", lambda: {"signature": None, "entries": {}, "order": [], "lock": threading.Lock(), "version": 0, "watched": False, "graph": None, "similarity": None, "rollups": None})
+
+def _order_index(entries: dict) -> list:
+    return sorted(entries, key=lambda eid: entries[eid].timestamp, reverse=True)
+
+def get_journal_index() -> dict:
+    """Return the shared index cache, reloading only when the folders changed."""
+    cache = _journal_index_cache()
+    if cache["watched"] and cache["signature"] is not None:
+        return cache
+    signature = journal_dir_signature()
+    if cache["signature"] != signature:
+        with cache["lock"]:
+            if cache["signature"] != signature:
+                index = load_journal_index()
+                cache["entries"] = index["entries"]
+                cache["order"] = _order_index(index["entries"])
+                cache["signature"] = index["signature"]
+                cache["graph"] = None
+                cache["similarity"] = None
+                cache["rollups"] = None
+    return cache
+
+def update_journal_index(entry: dict, json_file):
+    """Add or replace one entry in the index after it has been written."""
+    cache = get_journal_index()
+    with cache["lock"]:
+        header = EntryHeader.from_entry(entry, json_file)
+        _rollup_upsert(cache, cache["entries"].get(header.entry_id), header)
+        cache["entries"][header.entry_id] = header
+        if cache["graph"] is not None:
+            cache["graph"].add(header.entry_id, header.pattern_echo, header.pattern_ref)
+        _similarity_upsert(cache, header, entry)
+        cache["order"] = _order_index(cache["entries"])
+        cache["signature"] = journal_dir_signature()
+        cache["version"] += 1
+        write_journal_index(cache["signature"], cache["entries"], cache["graph"], cache["rollups"])
+
+def list_headers(angel=None, permissions=None, state=None) -> list:
+    """Entry headers (newest first) matching the given filters."""
+    cache = get_journal_index()
+    headers = cache["entries"]
+    results = []
+    for entry_id in cache["order"]:
+        header = headers[entry_id]
+        if angel and header.angel != angel:
+            continue
+        if permissions and header.permission not in permissions:
+            continue
+        if state and header.architect_state != state:
+            continue
+        results.append(header)
+    return results
+
+def load_entry(entry_id: str):
+    """Load one full entry by ID through the index, or None if it is gone."""
+    header = get_journal_index()["entries"].get(entry_id)
+    return header.load() if header else None
+
+def search_index(query: str = "", permissions=None) -> list:
+    """Entry IDs (newest first) whose header fields match the query."""
+    terms = query.lower().split()
+    results = []
+    for header in list_headers(permissions=permissions):
+        if terms:
+            haystack = f"{header.entry_id} {header.angel} {header.pattern_echo} {header.summary}".lower()
+            if not all(term in haystack for term in terms):
+                continue
+        results.append(header.entry_id)
+    return results
+
+# ============================================================================
+# PATTERN GRAPH (pattern_echo lineage and pattern_ref links)
+# ============================================================================
+
+PATTERN_GRAPH_FILE = WorkspacePath("data/pattern_graph.json")
+PATTERN_GRAPH_FORMAT = 1
+PATTERN_CHAIN_SPLIT = re.compile(r"\s*(?:>|→|;|\n)\s*")
+ENTRY_ID_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}_[A-Za-z]+_\d{4}")
+REF_WEIGHT = 3.0
+RELATED_FANOUT_LIMIT = 2000
+
+PATTERN_PUNCTUATION = re.compile(r"[^\w\s-]")
+
+def _normalize_pattern_text(text: str) -> str:
+    return " ".join(PATTERN_PUNCTUATION.sub(" ", text.lower()).split())
+
+@functools.lru_cache(maxsize=65536)
+def _pattern_segment(segment: str) -> tuple:
+    """(key, label) for one chain segment; segments repeat across entries, so memoized."""
+    level, sep, name = segment.partition(":")
+    level_key, name_key = _normalize_pattern_text(level), _normalize_pattern_text(name)
+    if sep and level_key and name_key:
+        return f"{level_key}:{name_key}", f"{level.strip().title()}: {name.strip()}"
+    return _normalize_pattern_text(segment), segment.strip()
+
+def parse_pattern_echo(text: str) -> list:
+    """[(key, label)] in chain order: 'Root: Rest > Leaf: Sleep' -> root:rest, leaf:sleep."""
+    chain = {}
+    for segment in PATTERN_CHAIN_SPLIT.split(text or ""):
+        key, label = _pattern_segment(segment)
+        if key:
+            chain.setdefault(key, label)
+    return list(chain.items())
+
+def parse_pattern_ref(text: str) -> list:
+    """Entry or merge IDs named in a reference, else the normalized reference itself."""
+    ids = list(dict.fromkeys(ENTRY_ID_PATTERN.findall(text or "")))
+    if ids:
+        return ids
+    normalized = _normalize_pattern_text(text or "")
+    return [f"ref:{normalized}"] if normalized else []
+
+class PatternGraph:
+    """Entry<->pattern and entry->ref edges, plus the parent->child lineage the echo chains imply."""
+    
+    def __init__(self):
+        self.entry_patterns = {}
+        self.pattern_entries = {}
+        self.labels = {}
+        self.parents = {}
+        self.children = {}
+        self.entry_refs = {}
+        self.referenced_by = {}
+    
+    def add(self, entry_id: str, pattern_echo: str, pattern_ref: str):
+        self.remove(entry_id)
+        self._link_chain([entry_id], self._chain_keys(pattern_echo))
+        self._link_refs(entry_id, parse_pattern_ref(pattern_ref))
+    
+    def _chain_keys(self, pattern_echo: str) -> tuple:
+        chain = parse_pattern_echo(pattern_echo)
+        for key, label in chain:
+            self.labels.setdefault(key, label)
+        return tuple(key for key, _ in chain)
+    
+    def _link_chain(self, entry_ids: list, keys: tuple):
+        """Attach a group of entries that share one echo chain (bulk, so rebuilds stay cheap)."""
+        if not keys:
+            return
+        count = len(entry_ids)
+        for entry_id in entry_ids:
+            self.entry_patterns[entry_id] = keys
+        parent = None
+        for key in keys:
+            members = self.pattern_entries.get(key)
+            if members is None:
+                self.pattern_entries[key] = set(entry_ids)
+            else:
+                members.update(entry_ids)
+            if parent is not None:
+                edges = self.parents.setdefault(key, {})
+                edges[parent] = edges.get(parent, 0) + count
+                edges = self.children.setdefault(parent, {})
+                edges[key] = edges.get(key, 0) + count
+            parent = key
+    
+    def _link_refs(self, entry_id: str, refs: list):
+        if refs:
+            self.entry_refs[entry_id] = tuple(refs)
+        for target in refs:
+            self.referenced_by.setdefault(target, set()).add(entry_id)
+    
+    def remove(self, entry_id: str):
+        keys = self.entry_patterns.pop(entry_id, ())
+        for position, key in enumerate(keys):
+            members = self.pattern_entries.get(key)
+            if members is not None:
+                members.discard(entry_id)
+                if not members:
+                    del self.pattern_entries[key]
+            if position:
+                parent = keys[position - 1]
+                for edges, a, b in ((self.parents, key, parent), (self.children, parent, key)):
+                    edges[a][b] -= 1
+                    if edges[a][b] <= 0:
+                        del edges[a][b]
+                        if not edges[a]:
+                            del edges[a]
+        for target in self.entry_refs.pop(entry_id, ()):
+            sources = self.referenced_by.get(target)
+            if sources is not None:
+                sources.discard(entry_id)
+                if not sources:
+                    del self.referenced_by[target]
+    
+    def to_json(self) -> dict:
+        """Entries grouped by echo chain; most entries share a handful of chains."""
+        chains = {}
+        for entry_id, keys in self.entry_patterns.items():
+            chains.setdefault(keys, []).append(entry_id)
+        return {
+            "labels": self.labels,
+            "chains": [[list(keys), entry_ids] for keys, entry_ids in chains.items()],
+            "refs": {eid: list(refs) for eid, refs in self.entry_refs.items()}
+        }
+    
+    @classmethod
+    def from_json(cls, data: dict):
+        graph = cls()
+        graph.labels = data["labels"]
+        for keys, entry_ids in data["chains"]:
+            graph._link_chain(entry_ids, tuple(keys))
+        for entry_id, refs in data["refs"].items():
+            graph._link_refs(entry_id, refs)
+        return graph
+    
+    @classmethod
+    def from_headers(cls, headers: dict):
+        graph = cls()
+        by_echo = {}
+        for entry_id, header in headers.items():
+            by_echo.setdefault(header.pattern_echo, []).append(entry_id)
+            if header.pattern_ref:
+                graph._link_refs(entry_id, parse_pattern_ref(header.pattern_ref))
+        for pattern_echo, entry_ids in by_echo.items():
+            graph._link_chain(entry_ids, graph._chain_keys(pattern_echo))
+        return graph
+
+def write_pattern_graph(signature: list, graph: PatternGraph):
+    write_json_atomic(PATTERN_GRAPH_FILE, {"format": PATTERN_GRAPH_FORMAT, "signature": signature, **graph.to_json()})
+
+def get_pattern_graph() -> PatternGraph:
+    """The shared pattern graph, loaded from disk when it matches the index or rebuilt from headers."""
+    cache = get_journal_index()
+    if cache["graph"] is None:
+        with cache["lock"]:
+            if cache["graph"] is None:
+                graph = None
                 try:
-                    with open(json_file) as f:
-                        entry = json.load(f)
-                        entry['_file'] = str(json_file)
-                        entry['_angel'] = angel
-                        entries.append(entry)
-                except:
+                    data = CODEC.load(PATTERN_GRAPH_FILE)
+                    if data.get("format") == PATTERN_GRAPH_FORMAT and data.get("signature") == cache["signature"]:
+                        graph = PatternGraph.from_json(data)
+                except (json.JSONDecodeError, IOError, KeyError, TypeError):
                     pass
-    return sorted(entries, key=lambda x: x.get('timestamp', ''), reverse=True)
+                if graph is None:
+                    graph = PatternGraph.from_headers(cache["entries"])
+                    write_pattern_graph(cache["signature"], graph)
+                cache["graph"] = graph
+    return cache["graph"]
 
-def log_veto_event(message: str):
-    """Log veto event to JSONL file."""
-    veto_path = Path("data/veto_log.jsonl")
-    event = {
-        "timestamp": edmonton_now().isoformat(),
-        "message": message
+def pattern_label(key: str) -> str:
+    return get_pattern_graph().labels.get(key, key)
+
+def entries_for_pattern(key: str) -> set:
+    """Entries whose echo chain passes through a pattern key (a chain names its ancestors)."""
+    return get_pattern_graph().pattern_entries.get(key, set())
+
+def find_pattern_keys(query: str) -> list:
+    """Pattern keys whose normalized text contains the query, most-echoed first."""
+    graph = get_pattern_graph()
+    needle = _normalize_pattern_text(query)
+    if not needle:
+        return []
+    keys = [key for key in graph.pattern_entries if needle in key]
+    return sorted(keys, key=lambda k: len(graph.pattern_entries[k]), reverse=True)
+
+def pattern_lineage(key: str) -> dict:
+    """Ancestor chains (root first) and direct children of a pattern, with entry counts."""
+    graph = get_pattern_graph()
+    chains = []
+    
+    def walk(current, path):
+        parents = graph.parents.get(current)
+        if not parents or len(path) > 8:
+            chains.append(list(reversed(path)))
+            return
+        for parent in parents:
+            if parent not in path:
+                walk(parent, path + [parent])
+    
+    walk(key, [key])
+    return {
+        "ancestors": chains,
+        "children": sorted(graph.children.get(key, {}), key=lambda k: -len(graph.pattern_entries.get(k, ()))),
+        "counts": {k: len(graph.pattern_entries.get(k, ())) for chain in chains for k in chain}
     }
-    with open(veto_path, "a") as f:
-        f.write(json.dumps(event) + "\n")
 
-def escape_latex(text: str) -> str:
-    """Escape special LaTeX characters."""
-    if not text:
-        return ""
-    replacements = [
-        ('&', '\\&'),
-        ('%', '\\%'),
-        ('$', '\\$'),
-        ('#', '\\#'),
-        ('_', '\\_'),
-        ('{', '\\{'),
-        ('}', '\\}'),
-    ]
-    result = text
-    for old, new in replacements:
-        result = result.replace(old, new)
-    return result
+def related_entries(entry_ids, limit: int = 8, exclude=None) -> list:
+    """
+    Entries sharing patterns or references with the given ones, best first.
+    
+    Shared patterns score by inverse frequency (a rare leaf says more than a common
+    root); patterns echoed by more than RELATED_FANOUT_LIMIT entries are too common
+    to relate anything and are skipped. A direct reference either way adds
+    REF_WEIGHT. Returns [(entry_id, score, reasons)].
+    """
+    if isinstance(entry_ids, str):
+        entry_ids = [entry_ids]
+    graph = get_pattern_graph()
+    index = get_journal_index()["entries"]
+    total = max(1, len(graph.entry_patterns))
+    scores = Counter()
+    reasons = {}
+    for entry_id in entry_ids:
+        for key in graph.entry_patterns.get(entry_id, ()):
+            members = graph.pattern_entries.get(key, ())
+            if len(members) > RELATED_FANOUT_LIMIT:
+                continue
+            weight = math.log(1 + total / len(members))
+            for other in members:
+                scores[other] += weight
+                reasons.setdefault(other, set()).add(graph.labels.get(key, key))
+        for target in graph.entry_refs.get(entry_id, ()):
+            if target in index:
+                scores[target] += REF_WEIGHT
+                reasons.setdefault(target, set()).add("referenced")
+            for other in graph.referenced_by.get(target, ()):
+                scores[other] += REF_WEIGHT / 2
+                reasons.setdefault(other, set()).add("same reference")
+        for other in graph.referenced_by.get(entry_id, ()):
+            scores[other] += REF_WEIGHT
+            reasons.setdefault(other, set()).add("references this")
+    skip = set(entry_ids) | set(exclude or ())
+    best = heapq.nlargest(limit, ((score, eid) for eid, score in scores.items() if eid not in skip))
+    return [(eid, score, sorted(reasons[eid])) for score, eid in best]
 
-def append_to_canon(entry: dict, entry_id: str):
-    """Append entry to main canon file."""
-    canon_path = Path("data/canon/main_canon.md")
+def pattern_context_markdown(entry_id: str, limit: int = 5) -> str:
+    """Lineage and related-entry lines for an entry in the Browse list."""
+    graph = get_pattern_graph()
+    lines = []
+    keys = graph.entry_patterns.get(entry_id, ())
+    if keys:
+        lines.append("**Lineage:** " + " › ".join(
+            f"{graph.labels.get(k, k)} ({len(graph.pattern_entries.get(k, ()))})" for k in keys
+        ))
+    related = related_entries(entry_id, limit=limit)
+    if related:
+        lines.append("**Related:** " + ", ".join(f"{eid} ({'; '.join(why)})" for eid, _, why in related))
+    return "\n\n".join(lines)
+
+# ============================================================================
+# SIMILARITY (MinHash signatures with LSH banding)
+# ============================================================================
+
+SIMILARITY_FILE = WorkspacePath("data/similarity/minhash.npz")
+SIMILARITY_FIELDS = ("context", "shadow", "light", "pattern_echo")
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+NEAR_DUPLICATE_SIMILARITY = 0.8
+CONVERGENCE_SIMILARITY = 0.5
+EMPTY_MINHASH = np.uint32(0xFFFFFFFF)
+
+# Multiply-shift hash family: h(x) = ((a * x + b) mod 2**64) >> 32 with odd a.
+_minhash_rng = np.random.default_rng(0x416E67656C)
+MINHASH_A = _minhash_rng.integers(1, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+MINHASH_B = _minhash_rng.integers(0, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+LSH_MIX = _minhash_rng.integers(1, 2**63, size=LSH_ROWS, dtype=np.uint64) | np.uint64(1)
+SHINGLE_MIX = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+
+TOKEN_PATTERN = re.compile(r"\w+")
+MINHASH_BATCH_TOKENS = 1 << 16
+
+@functools.lru_cache(maxsize=200000)
+def _token_hash(token: str) -> int:
+    return zlib.crc32(token.encode()) + 1
+
+def _entry_token_hashes(entry: dict) -> list:
+    text = " ".join(str(entry.get(field) or "") for field in SIMILARITY_FIELDS).lower()
+    return list(map(_token_hash, TOKEN_PATTERN.findall(text)))
+
+def minhash_signatures(entries: list) -> np.ndarray:
+    """
+    (len(entries), MINHASH_PERMUTATIONS) signatures over hashed word 3-grams.
+    
+    Token hashes of many entries go into one stream with two zero pads after each
+    entry, so every shingle of a batch is mixed and hashed by a handful of NumPy
+    calls; the shingles that straddle an entry boundary are masked out before the
+    per-entry minimum. Entries without text keep the EMPTY_MINHASH signature.
+    """
+    signatures = np.full((len(entries), MINHASH_PERMUTATIONS), EMPTY_MINHASH, dtype=np.uint32)
+    stream, starts, rows = [], [], []
     
-    if not canon_path.exists():
-        with open(canon_path, "w") as f:
-            f.write("# Main Canon\n\n*Versioned truth. Dated, scoped, revisable.*\n\n---\n")
+    def flush():
+        tokens = np.array(stream + [0, 0], dtype=np.uint64)
+        shingles = (tokens[:-2] * SHINGLE_MIX[0]) ^ (tokens[1:-1] * SHINGLE_MIX[1]) ^ tokens[2:]
+        hashed = (MINHASH_A[:, None] * shingles[None, :] + MINHASH_B[:, None]) >> np.uint64(32)
+        hashed[:, tokens[:-2] == 0] = np.uint64(0xFFFFFFFF)
+        signatures[rows] = np.minimum.reduceat(hashed, starts, axis=1).T.astype(np.uint32)
     
-    canon_entry = f"""
-## {entry_id} (Ratified {edmonton_now().strftime('%Y-%m-%d %H:%M')})
+    for row, entry in enumerate(entries):
+        hashes = _entry_token_hashes(entry)
+        if not hashes:
+            continue
+        starts.append(len(stream))
+        rows.append(row)
+        stream.extend(hashes)
+        stream.extend((0, 0))
+        if len(stream) >= MINHASH_BATCH_TOKENS:
+            flush()
+            stream, starts, rows = [], [], []
+    if rows:
+        flush()
+    return signatures
 
-**Original Angel:** {entry.get('_angel', 'Unknown')}  
-**Architect State:** {entry['architect_state']}
+def minhash_signature(entry: dict) -> np.ndarray:
+    return minhash_signatures([entry])[0]
 
-### Context
-{entry['context']}
+def header_stamp(header: EntryHeader) -> int:
+    """Cheap change marker for an entry's indexed fields (the file location is ignored)."""
+    return zlib.crc32(json.dumps(header.to_row()[:-1]).encode())
 
-### Shadow Observed
-{entry['shadow']}
+def _band_keys(signatures: np.ndarray) -> np.ndarray:
+    """One uint64 key per (entry, band); equal keys mean the band's rows all agree."""
+    rows = signatures.reshape(len(signatures), LSH_BANDS, LSH_ROWS).astype(np.uint64)
+    return (rows * LSH_MIX).sum(axis=2)
 
-### Light Returned  
-{entry['light']}
+class SimilarityIndex:
+    """MinHash signatures for every entry, with LSH band keys so lookups never compare all pairs."""
+    
+    def __init__(self, ids=(), stamps=(), signatures=None):
+        self.ids = list(ids)
+        self.position = {eid: i for i, eid in enumerate(self.ids)}
+        self.stamps = np.asarray(stamps, dtype=np.uint32)
+        if signatures is None:
+            signatures = np.empty((0, MINHASH_PERMUTATIONS), dtype=np.uint32)
+        self.signatures = np.asarray(signatures, dtype=np.uint32).reshape(-1, MINHASH_PERMUTATIONS)
+        self.bands = _band_keys(self.signatures)
+    
+    def upsert(self, entry_id: str, stamp: int, signature: np.ndarray):
+        row = self.position.get(entry_id)
+        if row is None:
+            self.position[entry_id] = len(self.ids)
+            self.ids.append(entry_id)
+            self.stamps = np.append(self.stamps, np.uint32(stamp))
+            self.signatures = np.vstack([self.signatures, signature[None, :]])
+            self.bands = np.vstack([self.bands, _band_keys(signature[None, :])])
+        else:
+            self.stamps[row] = stamp
+            self.signatures[row] = signature
+            self.bands[row] = _band_keys(signature[None, :])[0]
+    
+    def upsert_many(self, rows: list):
+        """Bulk upsert of (entry_id, stamp, signature) without re-stacking per row."""
+        fresh = [row for row in rows if row[0] not in self.position]
+        for entry_id, stamp, signature in rows:
+            if entry_id in self.position:
+                self.upsert(entry_id, stamp, signature)
+        if fresh:
+            signatures = np.stack([signature for _, _, signature in fresh])
+            for entry_id, _, _ in fresh:
+                self.position[entry_id] = len(self.ids)
+                self.ids.append(entry_id)
+            self.stamps = np.concatenate([self.stamps, np.array([stamp for _, stamp, _ in fresh], dtype=np.uint32)])
+            self.signatures = np.vstack([self.signatures, signatures])
+            self.bands = np.vstack([self.bands, _band_keys(signatures)])
+    
+    def remove(self, entry_ids):
+        drop = {self.position[eid] for eid in entry_ids if eid in self.position}
+        if not drop:
+            return
+        keep = np.array([i for i in range(len(self.ids)) if i not in drop], dtype=np.int64)
+        self.ids = [self.ids[i] for i in keep]
+        self.position = {eid: i for i, eid in enumerate(self.ids)}
+        self.stamps, self.signatures, self.bands = self.stamps[keep], self.signatures[keep], self.bands[keep]
+    
+    def similar(self, entry_id: str, threshold: float = NEAR_DUPLICATE_SIMILARITY) -> list:
+        """[(entry_id, estimated Jaccard)] for LSH candidates at or above the threshold, best first."""
+        row = self.position.get(entry_id)
+        if row is None or (self.signatures[row] == EMPTY_MINHASH).all():
+            return []
+        candidates = np.nonzero((self.bands == self.bands[row]).any(axis=1))[0]
+        candidates = candidates[candidates != row]
+        scores = (self.signatures[candidates] == self.signatures[row]).mean(axis=1)
+        order = np.argsort(-scores, kind="stable")
+        return [(self.ids[candidates[i]], float(scores[i])) for i in order if scores[i] >= threshold]
+    
+    def clusters(self, threshold: float = CONVERGENCE_SIMILARITY) -> list:
+        """
+        Groups of entries linked by verified LSH candidates, largest first.
+        
+        Per band, entries are sorted by band key; each member of a bucket is checked
+        against the bucket's first member and its sorted neighbour (vectorized), and
+        pairs at or above the threshold are unioned. Nothing is compared all-pairs.
+        """
+        count = len(self.ids)
+        if count < 2:
+            return []
+        valid = ~(self.signatures == EMPTY_MINHASH).all(axis=1)
+        positions = np.arange(count)
+        links = []
+        for band in range(LSH_BANDS):
+            order = np.argsort(self.bands[:, band], kind="stable")
+            keys = self.bands[order, band]
+            starts = np.ones(count, dtype=bool)
+            starts[1:] = keys[1:] != keys[:-1]
+            if starts.all():
+                continue
+            first = order[np.maximum.accumulate(np.where(starts, positions, 0))]
+            previous = np.roll(order, 1)
+            members = ~starts
+            for anchor in (first, previous):
+                a, b = anchor[members], order[members]
+                if a.size == 0:
+                    continue
+                score = (self.signatures[a] == self.signatures[b]).mean(axis=1)
+                ok = (score >= threshold) & valid[a] & valid[b] & (a != b)
+                if ok.any():
+                    links.append(np.stack([a[ok], b[ok]], axis=1))
+        if not links:
+            return []
+        pairs = np.concatenate(links)
+        a, b = pairs[:, 0], pairs[:, 1]
+        # Connected components by min-label propagation with pointer jumping.
+        labels = np.arange(count)
+        while True:
+            low = np.minimum(labels[a], labels[b])
+            updated = labels.copy()
+            np.minimum.at(updated, a, low)
+            np.minimum.at(updated, b, low)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
+        linked = np.unique(pairs)
+        order = linked[np.argsort(labels[linked], kind="stable")]
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        groups = [sorted(self.ids[i] for i in group) for group in np.split(order, bounds)]
+        return sorted(groups, key=len, reverse=True)
+    
+    def save(self, path: str = SIMILARITY_FILE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, ids=np.array(self.ids, dtype=str), stamps=self.stamps, signatures=self.signatures)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str = SIMILARITY_FILE):
+        with np.load(path) as data:
+            return cls(data["ids"].tolist(), data["stamps"], data["signatures"])
+
+def _reconcile_similarity(index: SimilarityIndex, headers: dict) -> int:
+    """Bring stored signatures in line with the journal index; returns how many rows changed."""
+    index.remove([eid for eid in index.ids if eid not in headers])
+    stale = []
+    for entry_id, header in headers.items():
+        stamp = header_stamp(header)
+        row = index.position.get(entry_id)
+        if row is None or index.stamps[row] != stamp:
+            stale.append((entry_id, header, stamp))
+    loaded = [(entry_id, stamp, header.load()) for entry_id, header, stamp in stale]
+    loaded = [row for row in loaded if row[2] is not None]
+    signatures = minhash_signatures([entry for _, _, entry in loaded])
+    index.upsert_many([(entry_id, stamp, signature) for (entry_id, stamp, _), signature in zip(loaded, signatures)])
+    return len(stale)
+
+def get_similarity_index(build: bool = True):
+    """
+    The shared similarity index, reconciled with the journal index.
+    
+    Signatures persist in data/similarity/minhash.npz; on load only entries whose
+    header changed are re-read. With build=False this returns None rather than
+    reading every entry when no index exists yet.
+    """
+    cache = get_journal_index()
+    if cache["similarity"] is None:
+        if not build and not os.path.exists(SIMILARITY_FILE):
+            return None
+        with cache["lock"]:
+            if cache["similarity"] is None:
+                try:
+                    index = SimilarityIndex.load()
+                except (IOError, ValueError, KeyError):
+                    index = SimilarityIndex()
+                if _reconcile_similarity(index, cache["entries"]):
+                    index.save()
+                cache["similarity"] = index
+    return cache["similarity"]
 
-### Next True Step
-{entry['next_step']}
+def _similarity_upsert(cache: dict, header: EntryHeader, entry: dict):
+    """Keep a loaded similarity index current after a save (held under the index lock)."""
+    if cache["similarity"] is not None:
+        cache["similarity"].upsert(header.entry_id, header_stamp(header), minhash_signature(entry))
 
-### Pattern Echo
-{entry['pattern_echo']}
+def near_duplicates(entry_id: str) -> list:
+    index = get_similarity_index(build=False)
+    return index.similar(entry_id, NEAR_DUPLICATE_SIMILARITY) if index else []
 
----
-"""
-    with open(canon_path, "a") as f:
-        f.write(canon_entry)
+def convergence_clusters(permissions=None, min_angels: int = 2, threshold: float = CONVERGENCE_SIMILARITY) -> list:
+    """Similar-entry clusters spanning at least min_angels angels: [(entry_ids, angels)], widest first."""
+    headers = get_journal_index()["entries"]
+    results = []
+    for group in get_similarity_index().clusters(threshold):
+        members = [eid for eid in group if eid in headers and (not permissions or headers[eid].permission in permissions)]
+        angels = sorted({headers[eid].angel for eid in members})
+        if len(members) >= 2 and len(angels) >= min_angels:
+            results.append((members, angels))
+    return sorted(results, key=lambda r: (len(r[1]), len(r[0])), reverse=True)
 
 # ============================================================================
-# CUSTOM STYLING — Fractal-Inspired (Soft Blues & Golds)
+# DATA WATCHER (external edits to data/)
 # ============================================================================
 
-def apply_custom_css():
-    """Apply fractal-inspired visual styling."""
-    st.markdown("""
-    <style>
-        /* Root color variables */
-        :root {
-            --fractal-blue: #4A90A4;
-            --fractal-blue-light: #6BB3C9;
-            --fractal-gold: #C9A227;
-            --fractal-gold-light: #E5C45C;
-            --fractal-dark: #1A2332;
-            --fractal-bg: #0E1117;
-            --fractal-card: #1E2530;
-        }
-        
-        /* Main container */
-        .main .block-container {
-            padding-top: 2rem;
-            max-width: 1200px;
-        }
-        
-        /* Header styling */
-        .fractal-header {
-            text-align: center;
-            padding: 1.5rem 1rem;
-            background: linear-gradient(135deg, var(--fractal-dark) 0%, #2A3A4A 100%);
-            border-radius: 12px;
-            border: 1px solid var(--fractal-blue);
-            margin-bottom: 1.5rem;
-        }
-        
-        .fractal-header h1 {
-            color: var(--fractal-gold);
-            font-family: 'Inter', sans-serif;
-            font-weight: 300;
-            letter-spacing: 2px;
-            margin-bottom: 0.5rem;
-        }
-        
-        .fractal-symbol {
-            font-size: 2rem;
-            color: var(--fractal-blue-light);
-            margin-bottom: 0.5rem;
-        }
-        
-        .welcome-message {
-            color: var(--fractal-blue-light);
-            font-style: italic;
-            font-size: 1.1rem;
-        }
-        
-        /* Sidebar styling */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, var(--fractal-dark) 0%, #0E1117 100%);
-        }
-        
-        [data-testid="stSidebar"] .stTextArea textarea {
-            background-color: var(--fractal-card);
-            border-color: var(--fractal-blue);
-            color: #FAFAFA;
-        }
-        
-        /* Button styling */
-        .stButton > button {
-            border-radius: 8px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-        
-        .action-button {
-            background: linear-gradient(135deg, var(--fractal-blue) 0%, var(--fractal-blue-light) 100%);
-            border: none;
-            color: white;
-        }
-        
-        /* Veto button styling */
-        .veto-button button {
-            background-color: #8B0000 !important;
-            color: white !important;
-            border: 2px solid #FF4444 !important;
-            font-weight: bold !important;
-        }
-        
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background-color: var(--fractal-card);
-            padding: 0.5rem;
-            border-radius: 8px;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            background-color: transparent;
-            border-radius: 6px;
-            color: var(--fractal-blue-light);
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background-color: var(--fractal-blue);
-            color: white;
-        }
-        
-        /* Card styling */
-        .council-mirror {
-            background: linear-gradient(135deg, var(--fractal-card) 0%, #252D3A 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 4px solid var(--fractal-gold);
-            margin: 1rem 0;
-        }
-        
-        .council-mirror h3 {
-            color: var(--fractal-gold);
-            margin-bottom: 1rem;
-        }
-        
-        /* Footer styling */
-        .footer {
-            margin-top: 2rem;
-            padding: 1rem;
-            background: var(--fractal-card);
-            border-radius: 8px;
-            border-top: 2px solid var(--fractal-blue);
-            text-align: center;
-        }
-        
-        .invariants {
-            color: #888;
-            font-size: 0.85rem;
-            font-style: italic;
-            line-height: 1.6;
-        }
-        
-        /* Presence Corner styling */
-        .presence-corner {
-            background: linear-gradient(135deg, #1A2332 0%, #1E2836 100%);
-            border-radius: 12px;
-            padding: 1rem;
-            border: 1px solid #3A5A6A;
-            margin: 0.5rem 0;
-        }
-        
-        .presence-title {
-            color: #6BB3C9;
-            font-size: 0.9rem;
-            font-weight: 500;
-            margin-bottom: 0.75rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .breathing-circle {
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            background: radial-gradient(circle, #4A90A4 0%, #1A2332 70%);
-            margin: 1rem auto;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #C9A227;
-            font-size: 0.8rem;
-            font-weight: 500;
-            box-shadow: 0 0 20px rgba(74, 144, 164, 0.3);
-        }
-        
-        .grounding-prompt {
-            background: rgba(74, 144, 164, 0.1);
-            border-left: 3px solid #6BB3C9;
-            padding: 0.75rem 1rem;
-            margin: 0.5rem 0;
-            border-radius: 0 8px 8px 0;
-            color: #AAA;
-            font-style: italic;
-            font-size: 0.85rem;
-        }
-        
-        .retreat-screen {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(135deg, #0E1117 0%, #1A2332 100%);
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            z-index: 9999;
-            color: #6BB3C9;
-        }
+WATCH_POLL_SECONDS = 1.0
+WATCH_IGNORED = ("journal_index.json", "exports/", "wal.log", "council_events.jsonl", "rollups.json")
+
+def _watched_path(path):
+    """data/-relative POSIX path of a watched file, or None for files the watcher ignores."""
+    try:
+        relative = Path(path).resolve().relative_to(Path(DATA_DIR).resolve()).as_posix()
+    except ValueError:
+        return None
+    if relative.endswith(".tmp") or relative.startswith(WATCH_IGNORED):
+        return None
+    return relative
+
+def _apply_data_changes(paths):
+    """Fold changed files into the shared index and bump the data version once per batch.
+    
+    Files this process last wrote through the log are skipped: their writers already
+    updated the index and bumped the version when they committed.
+    """
+    cache = _journal_index_cache()
+    wal = get_write_ahead_log()
+    journal_changes = []
+    other_changes = False
+    for path in paths:
+        relative = _watched_path(path)
+        if relative is None or wal.wrote(path):
+            continue
+        parts = relative.split("/")
+        if len(parts) == 3 and parts[0] == "journals" and parts[2].endswith(".json"):
+            journal_changes.append((parts[1], f"{DATA_DIR}/{relative}"))
+        else:
+            other_changes = True
+    if not journal_changes and not other_changes:
+        return
+    
+    if journal_changes and cache["signature"] is not None:
+        with cache["lock"]:
+            for angel, path in journal_changes:
+                entry = None
+                if os.path.exists(path):
+                    try:
+                        entry = read_entry_source(path)
+                    except (json.JSONDecodeError, IOError, TypeError):
+                        continue
+                graph = cache["graph"]
+                if entry is None:
+                    stale = [eid for eid, h in cache["entries"].items() if h.file == path]
+                    for entry_id in stale:
+                        archived = _archived_source(cache["entries"][entry_id])
+                        if archived is not None:
+                            cache["entries"][entry_id].file = archived
+                            continue
+                        _rollup_upsert(cache, cache["entries"].pop(entry_id), None)
+                        if graph is not None:
+                            graph.remove(entry_id)
+                        if cache["similarity"] is not None:
+                            cache["similarity"].remove([entry_id])
+                else:
+                    entry['_angel'] = angel
+                    header = EntryHeader.from_entry(entry, path)
+                    _rollup_upsert(cache, cache["entries"].get(header.entry_id), header)
+                    cache["entries"][header.entry_id] = header
+                    if graph is not None:
+                        graph.add(header.entry_id, header.pattern_echo, header.pattern_ref)
+                    _similarity_upsert(cache, header, entry)
+            cache["order"] = _order_index(cache["entries"])
+            cache["signature"] = journal_dir_signature()
+            write_journal_index(cache["signature"], cache["entries"], cache["graph"], cache["rollups"])
+    with cache["lock"]:
+        cache["version"] += 1
+
+class DataWatcher:
+    """Background watcher for data/: inotify via watchdog when installed, polling otherwise."""
+    
+    def __init__(self):
+        self.mode = None
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.observer = None
+        self.stopped = threading.Event()
+    
+    def start(self):
+        get_journal_index()
+        workspace = current_workspace()
+        try:
+            self._start_inotify()
+            self.mode = "inotify"
+        except (ImportError, OSError):
+            self.mode = "polling"
+            threading.Thread(target=workspace.run, args=(self._poll_loop,), name="angel-data-poller", daemon=True).start()
+        threading.Thread(target=workspace.run, args=(self._flush_loop,), name="angel-data-watcher", daemon=True).start()
+        _journal_index_cache()["watched"] = True
+        return self
+    
+    def stop(self):
+        self.stopped.set()
+        if self.observer is not None:
+            self.observer.stop()
+    
+    def _start_inotify(self):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
         
-        .retreat-symbol {
-            font-size: 4rem;
-            margin-bottom: 2rem;
-            color: #C9A227;
-        }
+        watcher = self
         
-        .retreat-message {
-            font-size: 1.5rem;
-            font-style: italic;
-            text-align: center;
-            max-width: 500px;
-            line-height: 1.8;
-        }
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type in ("opened", "closed_no_write"):
+                    return
+                with watcher.lock:
+                    watcher.pending.add(event.src_path)
+                    if getattr(event, "dest_path", None):
+                        watcher.pending.add(event.dest_path)
         
-        /* Chat message styling */
-        .chat-message {
-            padding: 0.75rem 1rem;
-            margin: 0.5rem 0;
-            border-radius: 8px;
-            background: var(--fractal-card);
-        }
-        
-        .chat-message.user {
-            border-left: 3px solid var(--fractal-gold);
+        self.observer = Observer()
+        self.observer.schedule(Handler(), str(Path(DATA_DIR).resolve()), recursive=True)
+        self.observer.daemon = True
+        self.observer.start()
+    
+    def _scan(self) -> dict:
+        seen = {}
+        for folder in [f"{DATA_DIR}/journals/{angel}" for angel in ANGELS] + [f"{DATA_DIR}/canon", f"{DATA_DIR}/council_merges", DATA_DIR]:
+            try:
+                with os.scandir(folder) as it:
+                    for item in it:
+                        if item.is_file():
+                            seen[item.path] = item.stat().st_mtime_ns
+            except OSError:
+                continue
+        return seen
+    
+    def _poll_loop(self):
+        previous = self._scan()
+        while not self.stopped.wait(WATCH_POLL_SECONDS / 2):
+            current = self._scan()
+            changed = {p for p, mtime in current.items() if previous.get(p) != mtime}
+            changed.update(p for p in previous if p not in current)
+            previous = current
+            if changed:
+                with self.lock:
+                    self.pending.update(changed)
+    
+    def _flush_loop(self):
+        while not self.stopped.wait(WATCH_POLL_SECONDS / 4):
+            with self.lock:
+                paths, self.pending = self.pending, set()
+            if paths:
+                try:
+                    _apply_data_changes(paths)
+                except Exception:
+                    pass
+
+def get_data_watcher() -> DataWatcher:
+    """Start the workspace's data watcher once."""
+    return current_workspace().resource("watcher", lambda: DataWatcher().start())
+
+def data_version() -> int:
+    """Counter bumped whenever the shared index or watched files change."""
+    return _journal_index_cache()["version"]
+
+# ============================================================================
+# COUNCIL EVENT BUS (shared activity feed for the Council Mirror)
+# ============================================================================
+
+EVENT_LOG_FILE = WorkspacePath("data/council_events.jsonl")
+EVENT_BUFFER_SIZE = 256
+EVENT_FEED_SIZE = 8
+EVENT_LABELS = {
+    "chat": "Chat",
+    "journal_saved": "Journal",
+    "journal_revised": "Revision",
+    "merge_created": "Merge",
+    "canon_promoted": "Canon",
+    "veto": "Veto"
+}
+
+class CouncilEvent:
+    """One typed activity event; seq is increasing across restarts."""
+    
+    __slots__ = ("seq", "kind", "at", "text", "ref")
+    
+    def __init__(self, seq, kind, at, text, ref=None):
+        self.seq = seq
+        self.kind = kind
+        self.at = at
+        self.text = text
+        self.ref = ref
+    
+    def to_json(self) -> dict:
+        return {"seq": self.seq, "kind": self.kind, "at": self.at, "text": self.text, "ref": self.ref}
+    
+    @classmethod
+    def from_json(cls, data: dict):
+        return cls(data["seq"], data["kind"], data["at"], data["text"], data.get("ref"))
+
+class EventBus:
+    """
+    In-process bus shared by every session: a bounded ring buffer of recent events,
+    each also appended to an append-only log so the feed survives restarts.
+    
+    Sessions read the buffer (recent/since) instead of polling files; other threads
+    can block on wait() for the next event.
+    """
+    
+    def __init__(self, path: str = EVENT_LOG_FILE, capacity: int = EVENT_BUFFER_SIZE):
+        self.path = Path(path)
+        self.buffer = deque(self._read_tail(capacity), maxlen=capacity)
+        self.seq = self.buffer[-1].seq if self.buffer else 0
+        self.lock = threading.Lock()
+        self.published = threading.Condition(self.lock)
+    
+    def _read_tail(self, count: int) -> list:
+        """The last count intact events in the log, read backwards in blocks."""
+        try:
+            f = open(self.path, "r+b")
+        except FileNotFoundError:
+            return []
+        with f:
+            size = end = f.seek(0, os.SEEK_END)
+            data = b""
+            while end > 0 and data.count(b"\n") <= count:
+                start = max(0, end - 65536)
+                f.seek(start)
+                data = f.read(end - start) + data
+                end = start
+            torn = len(data) - data.rfind(b"\n") - 1
+            if torn:
+                f.truncate(size - torn)  # an unacknowledged partial line; later appends must start clean
+                data = data[:-torn]
+        events = []
+        for line in data.splitlines()[-count:]:
+            try:
+                events.append(CouncilEvent.from_json(CODEC.loads(line)))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue  # a partial first line from the block boundary, or a torn write
+        return events
+    
+    def publish(self, kind: str, text: str, ref: str = None) -> CouncilEvent:
+        """Record an event, log it, and wake waiting subscribers."""
+        if kind not in EVENT_LABELS:
+            raise ValueError(f"Unknown event kind: {kind}")
+        with self.lock:
+            self.seq += 1
+            event = CouncilEvent(self.seq, kind, edmonton_now().isoformat(), text, ref)
+            commit_mutation("event", [wal_append(self.path, CODEC.dumps(event.to_json()) + "\n")])
+            self.buffer.append(event)
+            self.published.notify_all()
+        return event
+    
+    def recent(self, limit: int = EVENT_FEED_SIZE) -> list:
+        """Newest events first."""
+        with self.lock:
+            return list(self.buffer)[:-limit - 1:-1]
+    
+    def since(self, seq: int) -> list:
+        """Events after seq, oldest first (only those still in the buffer)."""
+        with self.lock:
+            return [event for event in self.buffer if event.seq > seq]
+    
+    def wait(self, seq: int, timeout: float = None) -> list:
+        """Block until there are events after seq (or the timeout passes)."""
+        with self.lock:
+            self.published.wait_for(lambda: self.seq > seq, timeout)
+        return self.since(seq)
+
+def get_event_bus() -> EventBus:
+    """The workspace's event bus, shared by every session in it."""
+    return current_workspace().resource("events", EventBus)
+
+def publish_event(kind: str, text: str, ref: str = None) -> CouncilEvent:
+    return get_event_bus().publish(kind, text, ref)
+
+# ============================================================================
+# JOURNAL ARCHIVE (compressed monthly segments)
+# ============================================================================
+
+ARCHIVE_DIR = WorkspacePath("data/archive")
+ARCHIVE_AFTER_DAYS = 180
+SEGMENT_SEP = "::"
+
+def _segment_cache() -> dict:
+    """Open segment readers, reused until the segment file changes."""
+    return current_workspace().resource("segments", lambda: {"segments": OrderedDict(), "lock": threading.Lock()})
+
+def _read_segment_member(segment: str, member: str) -> bytes:
+    cache = _segment_cache()
+    mtime = os.stat(segment).st_mtime_ns
+    with cache["lock"]:
+        cached = cache["segments"].get(segment)
+        if cached is None or cached[0] != mtime:
+            if cached is not None:
+                cached[1].close()
+            cached = (mtime, zipfile.ZipFile(segment))
+            cache["segments"][segment] = cached
+            while len(cache["segments"]) > 32:
+                cache["segments"].popitem(last=False)[1][1].close()
+        cache["segments"].move_to_end(segment)
+        return cached[1].read(member)
+
+def read_entry_source(source: str) -> dict:
+    """Read an entry from a hot JSON file or from '<segment.zip>::<member>'; TypeError if it is not an object."""
+    if SEGMENT_SEP in source:
+        segment, member = source.split(SEGMENT_SEP, 1)
+        entry = CODEC.loads(_read_segment_member(segment, member))
+    else:
+        entry = CODEC.load(source)
+    if not isinstance(entry, dict):
+        raise TypeError(f"{source} holds a {type(entry).__name__}, not a journal entry")
+    return entry
+
+def iter_segments():
+    """Yield (angel, segment path) for every archive segment."""
+    for angel in ANGELS:
+        archive_path = Path(f"{ARCHIVE_DIR}/{angel}")
+        if archive_path.exists():
+            for segment in sorted(archive_path.glob("*.zip")):
+                yield angel, segment
+
+def iter_entry_sources():
+    """Yield (angel, source, zip info or None) for hot files then archived members."""
+    for angel, json_file in iter_entry_files():
+        yield angel, str(json_file), None
+    for angel, segment in iter_segments():
+        try:
+            with zipfile.ZipFile(segment) as zf:
+                members = zf.infolist()
+        except (zipfile.BadZipFile, IOError):
+            continue
+        for info in members:
+            yield angel, f"{segment}{SEGMENT_SEP}{info.filename}", info
+
+def _archived_source(header):
+    """Segment source holding a hot entry that another process archived, or None."""
+    segment = Path(f"{ARCHIVE_DIR}/{header.angel}/{header.timestamp[:7]}.zip")
+    member = f"{header.entry_id}.json"
+    try:
+        with zipfile.ZipFile(segment) as zf:
+            zf.getinfo(member)
+    except (KeyError, zipfile.BadZipFile, IOError):
+        return None
+    return f"{segment}{SEGMENT_SEP}{member}"
+
+def archive_entries(older_than_days: int = ARCHIVE_AFTER_DAYS) -> dict:
+    """Move hot entries older than the cutoff into per-angel, per-month zip segments.
+    
+    Originals are removed only after their segment has been re-read and verified. The
+    index is repointed in place, so listings and lookups keep working without a rescan.
+    """
+    cutoff = date.fromordinal(edmonton_now().date().toordinal() - older_than_days).isoformat()
+    cache = get_journal_index()
+    batches = {}
+    for header in cache["entries"].values():
+        if SEGMENT_SEP in header.file or len(header.timestamp) < 10 or header.timestamp[:10] >= cutoff:
+            continue
+        batches.setdefault((header.angel, header.timestamp[:7]), []).append(header)
+    
+    stats = {"archived": 0, "segments": 0}
+    moved = []
+    for (angel, month), headers in sorted(batches.items()):
+        segment = Path(f"{ARCHIVE_DIR}/{angel}/{month}.zip")
+        segment.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(segment, "a", zipfile.ZIP_DEFLATED) as zf:
+            existing = set(zf.namelist())
+            for header in headers:
+                if f"{header.entry_id}.json" not in existing:
+                    zf.write(header.file, f"{header.entry_id}.json")
+        with zipfile.ZipFile(segment) as zf:
+            if zf.testzip() is not None:
+                raise IOError(f"Archive segment failed verification: {segment}")
+            stored = set(zf.namelist())
+        for header in headers:
+            if f"{header.entry_id}.json" in stored:
+                moved.append((header, f"{segment}{SEGMENT_SEP}{header.entry_id}.json"))
+        stats["segments"] += 1
+    
+    with cache["lock"]:
+        for header, source in moved:
+            os.remove(header.file)
+            header.file = source
+        cache["signature"] = journal_dir_signature()
+        cache["version"] += 1
+        write_journal_index(cache["signature"], cache["entries"], cache["graph"], cache["rollups"])
+    stats["archived"] = len(moved)
+    return stats
+
+# ============================================================================
+# JOURNAL REVISIONS
+# ============================================================================
+
+REVISION_DIR = WorkspacePath("data/revisions")
+REVISION_CHECKPOINT_EVERY = 16
+REVISION_FIXED_FIELDS = ("entry_id", "angel", "timestamp")
+REVISION_LINE_DIFF_CHARS = 20000
+
+def revision_log_path(angel: str, entry_id: str) -> Path:
+    return Path(f"{REVISION_DIR}/{angel}/{entry_id}.jsonl")
+
+def _text_patch(old: str, new: str) -> list:
+    """[[start, end, replacement], ...] character edits turning old into new."""
+    if len(old) + len(new) > REVISION_LINE_DIFF_CHARS:
+        old_units, new_units = old.splitlines(True), new.splitlines(True)
+    else:
+        old_units, new_units = old, new
+    old_offsets = [0]
+    for unit in old_units:
+        old_offsets.append(old_offsets[-1] + len(unit))
+    matcher = difflib.SequenceMatcher(None, old_units, new_units, autojunk=False)
+    return [
+        [old_offsets[i1], old_offsets[i2], "".join(new_units[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
+    ]
+
+def revision_delta(old: dict, new: dict) -> dict:
+    """Field-level delta from old to new; long text fields are stored as character patches."""
+    delta = {}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        previous = old.get(key)
+        if isinstance(value, str) and isinstance(previous, str):
+            patch = _text_patch(previous, value)
+            if len(json.dumps(patch)) < len(json.dumps(value)):
+                delta.setdefault("patch", {})[key] = patch
+                continue
+        delta.setdefault("set", {})[key] = value
+    removed = [key for key in old if key not in new]
+    if removed:
+        delta["unset"] = removed
+    return delta
+
+def apply_revision_delta(entry: dict, delta: dict) -> dict:
+    entry = {**entry, **delta.get("set", {})}
+    for key, patch in delta.get("patch", {}).items():
+        text = entry[key]
+        for start, end, replacement in reversed(patch):
+            text = text[:start] + replacement + text[end:]
+        entry[key] = text
+    for key in delta.get("unset", []):
+        entry.pop(key, None)
+    return entry
+
+def read_revision_log(angel: str, entry_id: str) -> dict:
+    """{revision: log record}; a later record for the same revision wins (see revise_journal_entry)."""
+    records = {}
+    log_path = revision_log_path(angel, entry_id)
+    if not log_path.exists():
+        return records
+    with open(log_path) as f:
+        for line in f:
+            try:
+                record = CODEC.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record["rev"]] = record
+    return records
+
+def list_revisions(entry_id: str) -> list:
+    """[(revision, revised at)] oldest first; empty for entries never edited."""
+    header = get_journal_index()["entries"].get(entry_id)
+    if header is None:
+        return []
+    return [(rev, record["at"]) for rev, record in sorted(read_revision_log(header.angel, entry_id).items())]
+
+def load_revision(entry_id: str, revision: int):
+    """Rebuild one past version from the nearest checkpoint, or None if it is not recorded."""
+    header = get_journal_index()["entries"].get(entry_id)
+    if header is None:
+        return None
+    records = read_revision_log(header.angel, entry_id)
+    base = revision
+    while base >= 0 and "full" not in records.get(base, {}):
+        base -= 1
+    if base < 0:
+        return None
+    entry = records[base]["full"]
+    for rev in range(base + 1, revision + 1):
+        if rev not in records:
+            return None
+        entry = apply_revision_delta(entry, records[rev]["delta"])
+    return entry
+
+def revise_journal_entry(entry_id: str, changes: dict):
+    """
+    Store a new revision of an entry.
+    
+    The hot JSON file always holds the latest version and its revision number, so
+    reads and the index never touch history. Each edit appends one line to
+    data/revisions/<angel>/<entry_id>.jsonl: a delta against the previous version,
+    or a full checkpoint every REVISION_CHECKPOINT_EVERY revisions so any version
+    rebuilds from at most that many deltas.
+    """
+    header = get_journal_index()["entries"].get(entry_id)
+    if header is None:
+        raise KeyError(entry_id)
+    if SEGMENT_SEP in header.file:
+        raise ValueError(f"{entry_id} is archived; archived entries are read-only")
+    
+    current = {k: v for k, v in read_entry_source(header.file).items() if not k.startswith('_')}
+    updated = {**current, **{k: v for k, v in changes.items() if k not in REVISION_FIXED_FIELDS}}
+    if updated == current:
+        return current
+    
+    current_rev = current.get("revision", 0)
+    revision = current_rev + 1
+    revised_at = edmonton_now().strftime("%Y-%m-%d %H:%M:%S")
+    updated["revision"] = revision
+    updated["revised"] = revised_at
+    
+    log_path = revision_log_path(header.angel, entry_id)
+    records = read_revision_log(header.angel, entry_id)
+    lines = []
+    if max(records, default=None) != current_rev:
+        # First edit, or a previous edit stopped before the entry file was replaced:
+        # checkpoint the version on disk so the chain restarts from it.
+        lines.append({"rev": current_rev, "at": current.get("revised", current.get("timestamp", "")), "full": current})
+    if revision % REVISION_CHECKPOINT_EVERY == 0:
+        lines.append({"rev": revision, "at": revised_at, "full": updated})
+    else:
+        lines.append({"rev": revision, "at": revised_at, "delta": revision_delta(current, updated)})
+    json_path = Path(header.file)
+    md_path = Path(f"{DATA_DIR}/journals/{header.angel}/{header.angel}_journal.md")
+    commit_mutation("revision", [
+        wal_append(log_path, "".join(CODEC.dumps(line) + "\n" for line in lines)),
+        wal_write(json_path, CODEC.dumps(updated, pretty=True)),
+        wal_append(md_path, EXPORT_FORMATS["Markdown"].journal_entry(entry_document(updated), revision=(revision, revised_at)))
+    ])
+    
+    update_journal_index(updated, json_path)
+    return updated
+
+# ============================================================================
+# COUNCIL MERGE RECORDS
+# ============================================================================
+
+MERGE_INDEX_FILE = WorkspacePath("data/council_merges/merge_index.json")
+
+def _register_merge(index: dict, record: dict):
+    index["merges"][record["merge_id"]] = {
+        "created": record["created"],
+        "entry_count": len(record["source_entries"]),
+        "summary": record["summary"][:INDEX_SUMMARY_CHARS]
+    }
+    for source in record["source_entries"]:
+        merge_ids = index["entries"].setdefault(source["entry_id"], [])
+        if record["merge_id"] not in merge_ids:
+            merge_ids.append(record["merge_id"])
+
+def _merge_index_lock() -> threading.Lock:
+    """Serialises read-modify-write cycles on the workspace's merge index."""
+    return current_workspace().resource("merge_index_lock", threading.Lock)
+
+def save_merge_record(record: dict, markdown: str = None):
+    """Save a structured merge record (and its Markdown document) and register it in the reverse index."""
+    with _merge_index_lock():
+        index = load_merge_index()
+        _register_merge(index, record)
+        actions = [wal_write(f"{DATA_DIR}/council_merges/{record['merge_id']}.md", markdown)] if markdown is not None else []
+        actions += [
+            wal_write(f"{DATA_DIR}/council_merges/{record['merge_id']}.json", CODEC.dumps(record)),
+            wal_write(MERGE_INDEX_FILE, CODEC.dumps(index))
+        ]
+        commit_mutation("merge", actions)
+    record_activity("merge", record["created"])
+
+def parse_legacy_merge(md_file: Path) -> dict:
+    """Recover a structured record from a free-text merge written before records existed."""
+    sections = {}
+    heading = None
+    for line in md_file.read_text().splitlines():
+        if line.startswith("## "):
+            heading = line[3:].strip()
+            sections[heading] = []
+        elif heading and line.strip() and line.strip() != "---":
+            sections[heading].append(line)
+    sources = []
+    for line in sections.get("Source Entries", []):
+        entry_id, _, angel = line.lstrip("- ").partition(" (")
+        sources.append({"entry_id": entry_id.strip(), "angel": angel.rstrip(")")})
+    created = datetime.fromtimestamp(md_file.stat().st_mtime, EDMONTON_TZ).isoformat()
+    return {
+        "merge_id": md_file.stem,
+        "created": created,
+        "updated": created,
+        "source_entries": sources,
+        "canon_candidates": [line.lstrip("- ").strip() for line in sections.get("Canon Candidates", []) if line.strip() != "None"],
+        "summary": "\n".join(sections.get("Summary", [])),
+        "convergences": "\n".join(sections.get("Convergences", [])),
+        "divergences": "\n".join(sections.get("Divergences / Conflicts to Review", []))
+    }
+
+def rebuild_merge_index() -> dict:
+    """Rebuild the reverse index from merge records, converting legacy Markdown merges once."""
+    index = {"merges": {}, "entries": {}}
+    merge_path = Path(f"{DATA_DIR}/council_merges")
+    for md_file in sorted(merge_path.glob("*_COUNCIL_*.md")):
+        json_file = md_file.with_suffix(".json")
+        if not json_file.exists():
+            write_json_atomic(json_file, parse_legacy_merge(md_file))
+    for json_file in sorted(merge_path.glob("*_COUNCIL_*.json")):
+        try:
+            _register_merge(index, CODEC.load(json_file))
+        except (json.JSONDecodeError, IOError, KeyError):
+            pass
+    write_json_atomic(MERGE_INDEX_FILE, index)
+    return index
+
+def load_merge_index() -> dict:
+    """Load the merge reverse index ({"merges": ..., "entries": entry_id -> merge_ids})."""
+    if os.path.exists(MERGE_INDEX_FILE):
+        try:
+            return CODEC.load(MERGE_INDEX_FILE)
+        except (json.JSONDecodeError, IOError):
+            pass
+    return rebuild_merge_index()
+
+def load_merge_record(merge_id: str):
+    """Load one structured merge record, or None if it is missing or the ID is malformed."""
+    if not FSCK_MERGE_ID.fullmatch(merge_id):
+        return None
+    try:
+        return CODEC.load(f"{DATA_DIR}/council_merges/{merge_id}.json")
+    except (json.JSONDecodeError, IOError):
+        return None
+
+def merges_for_entry(entry_id: str, merge_index=None) -> list:
+    """Merge IDs that include the given entry."""
+    if merge_index is None:
+        merge_index = load_merge_index()
+    return merge_index["entries"].get(entry_id, [])
+
+def log_veto_event(message: str):
+    """Log veto event to JSONL file."""
+    veto_path = Path(f"{DATA_DIR}/veto_log.jsonl")
+    event = {
+        "timestamp": edmonton_now().isoformat(),
+        "message": message
+    }
+    commit_mutation("veto", [wal_append(veto_path, CODEC.dumps(event) + "\n")])
+    record_activity("veto", event["timestamp"])
+
+def escape_latex(text: str) -> str:
+    """Escape special LaTeX characters."""
+    if not text:
+        return ""
+    replacements = [
+        ('&', '\\&'),
+        ('%', '\\%'),
+        ('$', '\\$'),
+        ('#', '\\#'),
+        ('_', '\\_'),
+        ('{', '\\{'),
+        ('}', '\\}'),
+    ]
+    result = text
+    for old, new in replacements:
+        result = result.replace(old, new)
+    return result
+
+CANON_FILE = WorkspacePath("data/canon/main_canon.md")
+CANON_HEADING = re.compile(r"^## (\S+) \(Ratified ([^)\n]*)\)$", re.M)
+
+def canon_ratifications() -> list:
+    """(entry_id, ratified at) for every block in the canon file, in file order."""
+    canon_path = Path(CANON_FILE)
+    return CANON_HEADING.findall(canon_path.read_text()) if canon_path.exists() else []
+
+def canon_append_action(entry: dict, entry_id: str) -> dict:
+    """WAL action appending an entry to the main canon file (with its title block if new)."""
+    canon_path = Path(CANON_FILE)
+    heading = "" if canon_path.exists() else "# Main Canon\n\n*Versioned truth. Dated, scoped, revisable.*\n\n---\n"
+    ratified = edmonton_now().strftime('%Y-%m-%d %H:%M')
+    return wal_append(canon_path, heading + EXPORT_FORMATS["Markdown"].canon_entry(entry_document(entry), entry_id, ratified))
+
+def append_to_canon(entry: dict, entry_id: str):
+    """Append entry to main canon file."""
+    commit_mutation("canon_append", [canon_append_action(entry, entry_id)])
+    record_activity("canon", edmonton_now().isoformat())
+
+# ============================================================================
+# CANON CANDIDATE QUEUE
+# ============================================================================
+
+CANON_QUEUE_FILE = WorkspacePath("data/canon/candidate_queue.json")
+ALL_GATES_MASK = (1 << len(CANON_GATES)) - 1
+
+def _candidate_queue_lock() -> threading.RLock:
+    """Serialises read-modify-write cycles on the workspace's candidate queue (re-entrant: updates load through the sync)."""
+    return current_workspace().resource("candidate_queue_lock", threading.RLock)
+
+def load_candidate_queue() -> dict:
+    """Load the candidate queue, syncing it with the journal index when journals changed.
+    
+    Syncing adds new CANON CANDIDATE entries and drops unpromoted records whose entry
+    was revised to another tier or removed; promoted records are kept as history.
+    """
+    cache = get_journal_index()
+    with _candidate_queue_lock():
+        queue = {"signature": None, "candidates": {}}
+        if os.path.exists(CANON_QUEUE_FILE):
+            try:
+                queue = CODEC.load(CANON_QUEUE_FILE)
+            except (json.JSONDecodeError, IOError):
+                pass
+        if queue.get("signature") != cache["signature"]:
+            candidates = queue["candidates"]
+            for entry_id, record in cache["entries"].items():
+                if record.permission == "CANON CANDIDATE" and entry_id not in candidates:
+                    candidates[entry_id] = {"gates": 0, "promoted": None}
+            stale = [eid for eid, status in candidates.items() if not status["promoted"] and not is_canon_candidate(eid, cache["entries"])]
+            for entry_id in stale:
+                del candidates[entry_id]
+            queue["signature"] = cache["signature"]
+            save_candidate_queue(queue)
+    return queue
+
+def is_canon_candidate(entry_id: str, index: dict) -> bool:
+    """True if the indexed entry is currently marked CANON CANDIDATE."""
+    return entry_id in index and index[entry_id].permission == "CANON CANDIDATE"
+
+def save_candidate_queue(queue: dict):
+    """Persist the candidate queue."""
+    commit_mutation("canon_queue", [wal_write(CANON_QUEUE_FILE, CODEC.dumps(queue))])
+
+def set_gate(entry_id: str, gate: int):
+    """Checkbox callback: record one gate for one candidate in its bitmask."""
+    with _candidate_queue_lock():
+        queue = load_candidate_queue()
+        status = queue["candidates"].setdefault(entry_id, {"gates": 0, "promoted": None})
+        if st.session_state.get(f"gate_{entry_id}_{gate}"):
+            status["gates"] |= 1 << gate
+        else:
+            status["gates"] &= ~(1 << gate)
+        save_candidate_queue(queue)
+
+def _promoted_queue(entry_id: str) -> dict:
+    """The queue with entry_id marked promoted (caller holds the queue lock until it commits)."""
+    queue = load_candidate_queue()
+    status = queue["candidates"].setdefault(entry_id, {"gates": ALL_GATES_MASK, "promoted": None})
+    status["promoted"] = edmonton_now().isoformat()
+    return queue
+
+def mark_promoted(entry_id: str):
+    """Record that a candidate has been promoted to Canon."""
+    with _candidate_queue_lock():
+        save_candidate_queue(_promoted_queue(entry_id))
+
+def promote_to_canon(entry: dict, entry_id: str):
+    """Append to the canon and mark the candidate promoted as one logged mutation."""
+    with _candidate_queue_lock():
+        commit_mutation("canon_promotion", [
+            canon_append_action(entry, entry.get('entry_id', entry_id)),
+            wal_write(CANON_QUEUE_FILE, CODEC.dumps(_promoted_queue(entry_id)))
+        ])
+    record_activity("canon", edmonton_now().isoformat())
+
+# ============================================================================
+# ANALYTICS SNAPSHOT (Columnar)
+# ============================================================================
+
+ANALYTICS_DIR = WorkspacePath("data/exports/analytics")
+ANALYTICS_MANIFEST = WorkspacePath("data/exports/analytics/manifest.json")
+VETO_LOG_FILE = WorkspacePath("data/veto_log.jsonl")
+
+def parse_edmonton_timestamp(value: str):
+    """Parse an entry or event timestamp into an aware Edmonton datetime (None if unparseable)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=EDMONTON_TZ)
+    return parsed.astimezone(EDMONTON_TZ)
+
+def columnar_schemas() -> dict:
+    """Typed Arrow schemas for each snapshot table."""
+    ts = pa.timestamp("s", tz="America/Edmonton")
+    label = pa.dictionary(pa.int8(), pa.string())
+    text = pa.string()
+    return {
+        "journals": pa.schema([
+            ("entry_id", text), ("angel", label), ("timestamp", ts), ("permission", label),
+            ("architect_state", label), ("context", text), ("shadow", text), ("light", text),
+            ("next_step", text), ("pattern_echo", text), ("pattern_ref", text), ("source_file", text)
+        ]),
+        "merges": pa.schema([
+            ("merge_id", text), ("created", ts), ("updated", ts), ("source_entries", pa.list_(text)),
+            ("canon_candidates", pa.list_(text)), ("summary", text), ("convergences", text),
+            ("divergences", text), ("source_file", text)
+        ]),
+        "canon": pa.schema([
+            ("entry_id", text), ("gates_mask", pa.uint16()), ("gates_passed", pa.uint8()), ("promoted", ts)
+        ]),
+        "vetoes": pa.schema([("timestamp", ts), ("message", text)])
+    }
+
+def _journal_row(path: str) -> dict:
+    entry = read_entry_source(path)
+    return {
+        "entry_id": entry.get('entry_id') or Path(path).stem,
+        "angel": entry.get('angel') or Path(path).parent.name,
+        "timestamp": parse_edmonton_timestamp(entry.get('timestamp', '')),
+        "permission": entry.get('permission'),
+        "architect_state": entry.get('architect_state'),
+        "context": entry.get('context'),
+        "shadow": entry.get('shadow'),
+        "light": entry.get('light'),
+        "next_step": entry.get('next_step'),
+        "pattern_echo": entry.get('pattern_echo'),
+        "pattern_ref": entry.get('pattern_ref'),
+        "source_file": path
+    }
+
+def _merge_row(path: str) -> dict:
+    record = CODEC.load(path)
+    return {
+        "merge_id": record["merge_id"],
+        "created": parse_edmonton_timestamp(record.get("created", "")),
+        "updated": parse_edmonton_timestamp(record.get("updated", record.get("created", ""))),
+        "source_entries": [source["entry_id"] for source in record.get("source_entries", [])],
+        "canon_candidates": record.get("canon_candidates", []),
+        "summary": record.get("summary"),
+        "convergences": record.get("convergences"),
+        "divergences": record.get("divergences"),
+        "source_file": path
+    }
+
+def read_columnar_snapshot(table: str, directory: str = ANALYTICS_DIR):
+    """Memory-map one snapshot table (journals, merges, canon, vetoes) as an Arrow table."""
+    path = Path(directory) / f"{table}.arrow"
+    if pa is None or not path.exists():
+        return None
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+def _write_arrow(table, path: Path):
+    tmp_path = path.with_suffix(".arrow.tmp")
+    table = table.unify_dictionaries().combine_chunks()
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+def _incremental_table(name: str, files: dict, previous: dict, parse_row, schema, directory: str):
+    """Reuse rows whose source file is unchanged; parse only new or modified files."""
+    unchanged = [path for path, sig in files.items() if previous.get(path) == sig]
+    old_table = read_columnar_snapshot(name, directory) if unchanged else None
+    parts = []
+    if old_table is not None:
+        parts.append(old_table.filter(pc.is_in(old_table["source_file"], value_set=pa.array(unchanged))))
+    else:
+        unchanged = []
+    kept = set(unchanged)
+    rows = []
+    for path in files:
+        if path in kept:
+            continue
+        try:
+            rows.append(parse_row(path))
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, AttributeError, zipfile.BadZipFile):
+            continue
+    parts.append(pa.Table.from_pylist(rows, schema=schema))
+    return pa.concat_tables(parts), len(rows)
+
+def export_columnar_snapshot(directory: str = ANALYTICS_DIR) -> dict:
+    """Write or incrementally update the Arrow snapshot of journals, merges, canon and vetoes."""
+    if pa is None:
+        raise RuntimeError("pyarrow is required for columnar snapshots (pip install pyarrow)")
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / "manifest.json"
+    manifest = {}
+    if manifest_path.exists():
+        try:
+            manifest = CODEC.load(manifest_path)
+        except (json.JSONDecodeError, IOError):
+            manifest = {}
+    schemas = columnar_schemas()
+    stats = {}
+    
+    sources = {
+        "journals": ((source, info) for _, source, info in iter_entry_sources()),
+        "merges": ((str(path), None) for path in Path(f"{DATA_DIR}/council_merges").glob("*_COUNCIL_*.json"))
+    }
+    parsers = {"journals": _journal_row, "merges": _merge_row}
+    for name, paths in sources.items():
+        parse_row = parsers[name]
+        files = {}
+        for path, info in paths:
+            if info is not None:
+                files[path] = [info.CRC, info.file_size]
+            else:
+                st_ = os.stat(path)
+                files[path] = [st_.st_mtime_ns, st_.st_size]
+        table, parsed = _incremental_table(name, files, manifest.get(name, {}), parse_row, schemas[name], directory)
+        _write_arrow(table, out / f"{name}.arrow")
+        manifest[name] = files
+        stats[name] = {"rows": table.num_rows, "parsed": parsed}
+    
+    queue = load_candidate_queue()["candidates"]
+    canon = pa.Table.from_pylist([
+        {
+            "entry_id": entry_id,
+            "gates_mask": status["gates"],
+            "gates_passed": bin(status["gates"]).count("1"),
+            "promoted": parse_edmonton_timestamp(status["promoted"] or "")
         }
+        for entry_id, status in queue.items()
+    ], schema=schemas["canon"])
+    _write_arrow(canon, out / "canon.arrow")
+    stats["canon"] = {"rows": canon.num_rows, "parsed": canon.num_rows}
+    
+    offset = manifest.get("veto_offset", 0)
+    veto_size = os.path.getsize(VETO_LOG_FILE) if os.path.exists(VETO_LOG_FILE) else 0
+    old_vetoes = read_columnar_snapshot("vetoes", directory) if 0 < offset <= veto_size else None
+    if old_vetoes is None:
+        offset = 0
+    rows = []
+    if veto_size > offset:
+        with open(VETO_LOG_FILE) as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    event = CODEC.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                rows.append({"timestamp": parse_edmonton_timestamp(event.get("timestamp", "")), "message": event.get("message")})
+    parts = [old_vetoes] if old_vetoes is not None else []
+    vetoes = pa.concat_tables(parts + [pa.Table.from_pylist(rows, schema=schemas["vetoes"])])
+    _write_arrow(vetoes, out / "vetoes.arrow")
+    manifest["veto_offset"] = veto_size
+    stats["vetoes"] = {"rows": vetoes.num_rows, "parsed": len(rows)}
+    
+    manifest["updated"] = edmonton_now().isoformat()
+    write_json_atomic(manifest_path, manifest)
+    return stats
+
+# ============================================================================
+# ACTIVITY ROLLUPS (Edmonton calendar buckets for the timeline)
+# ============================================================================
+
+ROLLUP_FILE = WorkspacePath("data/rollups.json")
+ROLLUP_FORMAT = 1
+ROLLUP_LEVELS = ("day", "week", "month")
+ACTIVITY_KINDS = ("merge", "canon", "veto")
+
+def edmonton_day(value: str):
+    """Edmonton calendar date of a timestamp (None if unparseable)."""
+    if value and len(value) <= 19:  # no UTC offset, so already Edmonton local time
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            pass
+    parsed = parse_edmonton_timestamp(value)
+    return parsed.date() if parsed else None
+
+def entry_rollup_key(header: EntryHeader) -> str:
+    return f"{header.angel}/{header.architect_state or 'Unknown'}"
+
+class CalendarRollup:
+    """
+    Counts per key in Edmonton calendar buckets: day (YYYY-MM-DD), week (the date of
+    its Monday) and month (YYYY-MM).
+    
+    Buckets are local calendar dates, not fixed 24-hour spans, so the 23- and 25-hour
+    days at DST changes are still one bucket each and a timestamp is counted on the
+    day it was local time in Edmonton, whatever offset it was written with.
+    """
+    
+    def __init__(self, levels: dict = None):
+        self.levels = levels if levels is not None else {level: {} for level in ROLLUP_LEVELS}
+    
+    @staticmethod
+    def buckets(day: date) -> tuple:
+        """(day, week, month) bucket keys for a date."""
+        iso = day.isoformat()
+        return iso, (day - timedelta(days=day.weekday())).isoformat(), iso[:7]
+    
+    @staticmethod
+    def bucket_start(level: str, bucket: str) -> date:
+        return date.fromisoformat(f"{bucket}-01" if level == "month" else bucket)
+    
+    @staticmethod
+    def bucket_range(level: str, start: date, end: date) -> list:
+        """Every bucket key of a level from the one holding start to the one holding end."""
+        if level == "month":
+            months = range(start.year * 12 + start.month - 1, end.year * 12 + end.month)
+            return [f"{m // 12:04d}-{m % 12 + 1:02d}" for m in months]
+        step = 7 if level == "week" else 1
+        first = start - timedelta(days=start.weekday()) if level == "week" else start
+        return [(first + timedelta(days=offset)).isoformat() for offset in range(0, (end - first).days + 1, step)]
+    
+    def bump(self, day, key: str, delta: int = 1):
+        if day is None:
+            return
+        for level, bucket in zip(ROLLUP_LEVELS, self.buckets(day)):
+            counts = self.levels[level].setdefault(bucket, {})
+            total = counts.get(key, 0) + delta
+            if total > 0:
+                counts[key] = total
+            else:
+                counts.pop(key, None)
+                if not counts:
+                    del self.levels[level][bucket]
+    
+    def series(self, level: str, since: date = None, until: date = None) -> list:
+        """[(bucket, {key: count})] for every bucket in range, empty ones included."""
+        counts = self.levels[level]
+        if not counts and since is None:
+            return []
+        first = since or self.bucket_start(level, min(counts))
+        last = until or max([edmonton_now().date()] + ([self.bucket_start(level, max(counts))] if counts else []))
+        return [(bucket, counts.get(bucket, {})) for bucket in self.bucket_range(level, first, last)]
+
+class ActivityRollups:
+    """Entry counts by angel/architect state and merge/canon/veto counts, per calendar bucket."""
+    
+    def __init__(self, entries: CalendarRollup, activity: CalendarRollup = None, activity_signature=None):
+        self.entries = entries
+        self.activity = activity
+        self.activity_signature = activity_signature
+    
+    @classmethod
+    def from_headers(cls, headers: dict):
+        entries = CalendarRollup()
+        counts = Counter((edmonton_day(header.timestamp), entry_rollup_key(header)) for header in headers.values())
+        for (day, key), count in counts.items():
+            entries.bump(day, key, count)
+        return cls(entries)
+    
+    def to_json(self) -> dict:
+        return {"activity_signature": self.activity_signature, "entries": self.entries.levels, "activity": self.activity.levels}
+    
+    @classmethod
+    def from_json(cls, data: dict):
+        return cls(CalendarRollup(data["entries"]), CalendarRollup(data["activity"]), data["activity_signature"])
+
+def activity_signature() -> list:
+    """Change marker for the merge, canon and veto files behind the activity counts."""
+    signature = []
+    for path in (MERGE_INDEX_FILE, CANON_FILE, VETO_LOG_FILE):
+        try:
+            stat = os.stat(path)
+            signature.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            signature.append(None)
+    return signature
+
+def build_activity_rollup() -> CalendarRollup:
+    """Count merges, canon ratifications and veto log events from their files."""
+    rollup = CalendarRollup()
+    for merge in load_merge_index()["merges"].values():
+        rollup.bump(edmonton_day(merge["created"]), "merge")
+    for _, ratified in canon_ratifications():
+        rollup.bump(edmonton_day(ratified), "canon")
+    if os.path.exists(VETO_LOG_FILE):
+        with open(VETO_LOG_FILE, "rb") as f:
+            for line in f:
+                try:
+                    rollup.bump(edmonton_day(CODEC.loads(line)["timestamp"]), "veto")
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    return rollup
+
+def write_rollups(signature: list, rollups: ActivityRollups):
+    write_json_atomic(ROLLUP_FILE, {"format": ROLLUP_FORMAT, "signature": signature, **rollups.to_json()})
+
+def get_activity_rollups() -> ActivityRollups:
+    """
+    The shared rollups, loaded from disk when they match the index or rebuilt from
+    headers. Saves keep the entry counts current; the activity counts are rebuilt
+    when the merge, canon or veto files changed behind their back.
+    """
+    cache = get_journal_index()
+    current = activity_signature()
+    rollups = cache["rollups"]
+    if rollups is None or rollups.activity_signature != current:
+        with cache["lock"]:
+            rollups = cache["rollups"]
+            if rollups is None and os.path.exists(ROLLUP_FILE):
+                try:
+                    data = CODEC.load(ROLLUP_FILE)
+                    if data.get("format") == ROLLUP_FORMAT and data.get("signature") == cache["signature"]:
+                        rollups = ActivityRollups.from_json(data)
+                except (json.JSONDecodeError, IOError, KeyError, TypeError):
+                    rollups = None
+            if rollups is None:
+                rollups = ActivityRollups.from_headers(cache["entries"])
+            if rollups.activity_signature != current:
+                rollups.activity = build_activity_rollup()
+                rollups.activity_signature = activity_signature()
+                write_rollups(cache["signature"], rollups)
+            cache["rollups"] = rollups
+    return rollups
+
+def _rollup_upsert(cache: dict, old: EntryHeader, new: EntryHeader):
+    """Move one entry between buckets in loaded rollups (held under the index lock)."""
+    rollups = cache["rollups"]
+    if rollups is not None:
+        if old is not None:
+            rollups.entries.bump(edmonton_day(old.timestamp), entry_rollup_key(old), -1)
+        if new is not None:
+            rollups.entries.bump(edmonton_day(new.timestamp), entry_rollup_key(new))
+
+def record_activity(kind: str, timestamp: str):
+    """Count a merge, canon promotion or veto in the loaded rollups once it is committed."""
+    cache = _journal_index_cache()
+    with cache["lock"]:
+        rollups = cache["rollups"]
+        if rollups is not None and rollups.activity is not None:
+            rollups.activity.bump(edmonton_day(timestamp), kind)
+            rollups.activity_signature = activity_signature()
+            write_rollups(cache["signature"], rollups)
+
+# ============================================================================
+# BACKUP SNAPSHOTS (content-addressed, deduplicated)
+# ============================================================================
+
+SNAPSHOT_STORE = WorkspacePath(".angel_snapshots")
+SNAPSHOT_CHUNK_SIZE = 1 << 20
+SNAPSHOT_EXCLUDE = ("exports/",)
+
+def snapshot_sources() -> list:
+    """Relative paths covered by snapshots: the data/ tree (minus exports) and session state."""
+    paths = []
+    excluded = tuple(f"{DATA_DIR}/{prefix}" for prefix in SNAPSHOT_EXCLUDE)
+    for root, _, files in os.walk(DATA_DIR):
+        for name in files:
+            path = os.path.join(root, name).replace(os.sep, "/")
+            if not path.endswith(".tmp") and not path.startswith(excluded):
+                paths.append(path)
+    if os.path.exists(STATE_FILE):
+        paths.append(os.fspath(STATE_FILE))
+    return sorted(paths)
+
+def _chunk_path(store: Path, digest: str) -> Path:
+    return store / "chunks" / digest[:2] / digest[2:]
+
+def _store_file_chunks(store: Path, path: str) -> list:
+    """Hash a file in fixed-size chunks, writing any chunk the store does not have yet."""
+    digests = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(SNAPSHOT_CHUNK_SIZE), b""):
+            digest = hashlib.sha256(chunk).hexdigest()
+            target = _chunk_path(store, digest)
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp_target = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+                with open(tmp_target, "wb") as out:
+                    out.write(zlib.compress(chunk))
+                os.replace(tmp_target, target)
+            digests.append(digest)
+    return digests
+
+def list_snapshots(store: str = SNAPSHOT_STORE) -> list:
+    """Snapshot IDs, oldest first."""
+    return sorted(p.stem for p in Path(store, "snapshots").glob("*.json"))
+
+def load_snapshot(snapshot_id: str, store: str = SNAPSHOT_STORE) -> dict:
+    return CODEC.load(Path(store, "snapshots", f"{snapshot_id}.json"))
+
+def create_snapshot(store: str = SNAPSHOT_STORE, workers=None) -> dict:
+    """Record the current data/ tree. Files unchanged since the last snapshot are not read."""
+    store = Path(store)
+    (store / "snapshots").mkdir(parents=True, exist_ok=True)
+    previous = {}
+    history = list_snapshots(store)
+    if history:
+        previous = load_snapshot(history[-1], store)["files"]
+    
+    files = {}
+    changed = []
+    for path in snapshot_sources():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        before = previous.get(path)
+        if before and before["size"] == record["size"] and before["mtime_ns"] == record["mtime_ns"]:
+            record["chunks"] = before["chunks"]
+        else:
+            changed.append(path)
+        files[path] = record
+    
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 2)) as pool:
+        for path, digests in zip(changed, pool.map(lambda p: _store_file_chunks(store, p), changed)):
+            files[path]["chunks"] = digests
+    
+    snapshot_id = edmonton_now().strftime("%Y%m%d-%H%M%S-%f")
+    write_json_atomic(store / "snapshots" / f"{snapshot_id}.json", {
+        "id": snapshot_id,
+        "created": edmonton_now().isoformat(),
+        "files": files
+    })
+    return {"id": snapshot_id, "files": len(files), "changed": len(changed)}
+
+def _restore_file(store: Path, path: str, record: dict, target: Path, verify_only: bool):
+    """Rebuild one file from its chunks into a staging file beside it, checking every chunk hash and the final size.
+    
+    Returns the staging path (None when only verifying); a failed file leaves nothing behind.
+    """
+    out_path = target / path
+    tmp_path = out_path.with_name(out_path.name + ".restore.tmp")
+    out = None
+    if not verify_only:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out = open(tmp_path, "wb")
+    size = 0
+    try:
+        for digest in record["chunks"]:
+            with open(_chunk_path(store, digest), "rb") as f:
+                chunk = zlib.decompress(f.read())
+            if hashlib.sha256(chunk).hexdigest() != digest:
+                raise IOError(f"chunk {digest} is corrupt")
+            size += len(chunk)
+            if out:
+                out.write(chunk)
+        if size != record["size"]:
+            raise IOError(f"size mismatch ({size} != {record['size']})")
+    except (IOError, zlib.error):
+        if out:
+            out.close()
+            tmp_path.unlink(missing_ok=True)
+        raise
+    if out:
+        out.close()
+        return tmp_path
+    return None
+
+def _prune_restore_target(target: Path, files: dict) -> list:
+    """Delete files under target's data/ tree that the snapshot does not list (exports and temp files are kept)."""
+    data_root = target / DATA_DIR
+    excluded = tuple(f"{DATA_DIR}/{prefix}" for prefix in SNAPSHOT_EXCLUDE)
+    pruned = []
+    for root, _, names in os.walk(data_root):
+        for name in names:
+            full = os.path.join(root, name)
+            path = f"{DATA_DIR}/{os.path.relpath(full, data_root)}".replace(os.sep, "/")
+            if path not in files and not path.endswith(".tmp") and not path.startswith(excluded):
+                os.remove(full)
+                pruned.append(path)
+    return pruned
+
+def restore_snapshot(snapshot_id: str, target: str = ".", store: str = SNAPSHOT_STORE, verify_only: bool = False, workers=None, prune: bool = False) -> dict:
+    """Restore (or just verify) every file of a snapshot into target.
+    
+    Every file is rebuilt and verified into a staging file first; only if all of them
+    pass are they moved into place, so a bad chunk leaves the target untouched. With
+    prune, data/ files the snapshot does not list are then removed.
+    """
+    store = Path(store)
+    files = load_snapshot(snapshot_id, store)["files"]
+    target = Path(target)
+    errors = []
+    staged = {}
+    
+    def restore_one(item):
+        path, record = item
+        try:
+            tmp_path = _restore_file(store, path, record, target, verify_only)
+        except (IOError, zlib.error) as exc:
+            errors.append(f"{path}: {exc}")
+        else:
+            if tmp_path is not None:
+                staged[path] = tmp_path
+    
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 2)) as pool:
+        list(pool.map(restore_one, files.items()))
+    if errors:
+        for tmp_path in staged.values():
+            tmp_path.unlink(missing_ok=True)
+        return {"id": snapshot_id, "files": len(files), "errors": sorted(errors), "pruned": []}
+    
+    for path, tmp_path in staged.items():
+        out_path = target / path
+        os.replace(tmp_path, out_path)
+        os.utime(out_path, ns=(files[path]["mtime_ns"], files[path]["mtime_ns"]))
+    pruned = _prune_restore_target(target, files) if prune and not verify_only else []
+    return {"id": snapshot_id, "files": len(files), "errors": errors, "pruned": pruned}
+
+# ============================================================================
+# INTEGRITY CHECK (fsck)
+# ============================================================================
+
+FSCK_BATCH_SIZE = 2000
+FSCK_REQUIRED_FIELDS = ("entry_id", "angel", "timestamp", "permission", "architect_state", "pattern_echo")
+FSCK_TEXT_FIELDS = FSCK_REQUIRED_FIELDS + ("pattern_ref", "context", "shadow", "light", "next_step", "revised")
+FSCK_MERGE_FIELDS = ("merge_id", "created", "updated", "source_entries", "summary", "convergences", "divergences")
+FSCK_QUARANTINE_DIR = WorkspacePath("data/quarantine")
+FSCK_ENTRY_ID = re.compile(r"(\d{4}-\d{2}-\d{2})_([A-Za-z]+)_\d{4,}")
+FSCK_MERGE_ID = re.compile(r"(\d{4}-\d{2}-\d{2})_COUNCIL_\d{4,}")
+FSCK_UNREADABLE = ("unreadable", "unparseable", "not_an_object")
+MIRROR_HEADING = re.compile(r"^## (\S+)(?: \(Revision \d+, [^)\n]*\))?$", re.M)
+MIRROR_BLOCK_SEP = "\n---\n"
+
+def _fsck_read_batch(paths: list, segment: str = None):
+    """Yield (source, filename stem, raw bytes or the exception that stopped the read)."""
+    if segment is None:
+        for path in paths:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, "rb") as f:
+                    yield path, stem, f.read()
+            except OSError as exc:
+                yield path, stem, exc
+        return
+    try:
+        zf = zipfile.ZipFile(segment)
+    except (zipfile.BadZipFile, OSError) as exc:
+        yield segment, None, exc
+        return
+    with zf:
+        for name in zf.namelist():
+            try:
+                raw = zf.read(name)
+            except (zipfile.BadZipFile, OSError, zlib.error) as exc:
+                raw = exc
+            yield f"{segment}{SEGMENT_SEP}{name}", Path(name).stem, raw
+
+def _mirror_body(block: str, entry_id: str) -> str:
+    return block[len(f"{MIRROR_BLOCK_SEP}## {entry_id}\n"):]
+
+def _fsck_check_entry(angel: str, source: str, stem: str, raw) -> dict:
+    """Validate one entry; the result carries its index row and content/mirror checksums."""
+    issues = []
+    record = {"source": source, "id": stem, "angel": angel, "row": None, "digest": None, "mirror": None, "issues": issues}
+    if isinstance(raw, Exception):
+        issues.append(("error", "unreadable", str(raw)))
+        return record
+    try:
+        entry = CODEC.loads(raw)
+    except ValueError as exc:
+        issues.append(("error", "unparseable", str(exc)))
+        return record
+    if not isinstance(entry, dict):
+        issues.append(("error", "not_an_object", type(entry).__name__))
+        return record
+    
+    for field in FSCK_REQUIRED_FIELDS:
+        if field not in entry:
+            issues.append(("error", "missing_field", field))
+    bad_types = [field for field in FSCK_TEXT_FIELDS if field in entry and not isinstance(entry[field], str)]
+    if "revision" in entry and (not isinstance(entry["revision"], int) or isinstance(entry["revision"], bool)):
+        bad_types.append("revision")
+    for field in bad_types:
+        issues.append(("error", "bad_type", f"{field} is {type(entry[field]).__name__}"))
+    if isinstance(entry.get("entry_id"), str):
+        record["id"] = entry["entry_id"]
+        if entry["entry_id"] != stem:
+            issues.append(("error", "id_filename_mismatch", f"{entry['entry_id']} stored as {stem}.json"))
+    if entry.get("angel", angel) != angel:
+        issues.append(("error", "angel_mismatch", f"{entry['angel']} filed under {angel}"))
+    
+    timestamp = parse_edmonton_timestamp(entry["timestamp"]) if isinstance(entry.get("timestamp"), str) else None
+    if "timestamp" in entry and timestamp is None:
+        issues.append(("error", "bad_timestamp", str(entry["timestamp"])))
+    match = FSCK_ENTRY_ID.fullmatch(record["id"])
+    if match is None:
+        issues.append(("error", "bad_id", record["id"]))
+    else:
+        if match.group(2) != angel:
+            issues.append(("error", "id_angel_mismatch", f"{record['id']} filed under {angel}"))
+        if timestamp is not None and timestamp.date().isoformat() != match.group(1):
+            issues.append(("warning", "id_date_mismatch", f"ID dated {match.group(1)}, timestamp {timestamp.date().isoformat()}"))
+    if "permission" in entry and entry["permission"] not in PERMISSION_TIERS:
+        issues.append(("error", "bad_permission", str(entry["permission"])))
+    if "architect_state" in entry and entry["architect_state"] not in ARCHITECT_STATES:
+        issues.append(("warning", "bad_architect_state", str(entry["architect_state"])))
+    if bad_types:
+        return record
+    
+    record["digest"] = zlib.crc32(raw)
+    entry['_angel'] = angel
+    record["row"] = EntryHeader.from_entry(entry, source).to_row()
+    document = EntryDocument(entry, "")
+    record["mirror"] = zlib.crc32(_mirror_body(EXPORT_FORMATS["Markdown"].journal_entry(document), document.entry_id).encode())
+    return record
+
+def _fsck_entry_task(angel: str, paths: list, segment: str = None) -> list:
+    """Worker: check a batch of hot entry files, or every member of one archive segment."""
+    return [_fsck_check_entry(angel, source, stem, raw) for source, stem, raw in _fsck_read_batch(paths, segment)]
+
+def _fsck_mirror_task(angel: str) -> dict:
+    """Worker: {entry_id: checksum of its latest block} for one angel's Markdown mirror."""
+    md_path = Path(f"{DATA_DIR}/journals/{angel}/{angel}_journal.md")
+    if not md_path.exists():
+        return {}
+    text = md_path.read_text()
+    headings = [m for m in MIRROR_HEADING.finditer(text) if FSCK_ENTRY_ID.fullmatch(m.group(1))]
+    blocks = {}
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() - len(MIRROR_BLOCK_SEP) if i + 1 < len(headings) else len(text)
+        blocks[heading.group(1)] = zlib.crc32(text[heading.end() + 1:end].encode())
+    return blocks
+
+def _fsck_merge_task() -> dict:
+    """Worker: validate merge records and recompute the merge index they imply."""
+    issues = []
+    sources = {}
+    index = {"merges": {}, "entries": {}}
+    merge_path = Path(f"{DATA_DIR}/council_merges")
+    json_files = sorted(merge_path.glob("*_COUNCIL_*.json"))
+    stems = {p.stem for p in json_files}
+    for md_file in sorted(merge_path.glob("*_COUNCIL_*.md")):
+        if md_file.stem not in stems:
+            issues.append(("warning", "legacy_merge", str(md_file), md_file.stem, "Markdown merge without a structured record"))
+    for json_file in json_files:
+        path = str(json_file)
+        try:
+            record = CODEC.load(json_file)
+        except (ValueError, OSError) as exc:
+            issues.append(("error", "unparseable", path, json_file.stem, str(exc)))
+            continue
+        if not isinstance(record, dict):
+            issues.append(("error", "not_an_object", path, json_file.stem, type(record).__name__))
+            continue
+        missing = [field for field in FSCK_MERGE_FIELDS if field not in record]
+        for field in missing:
+            issues.append(("error", "missing_field", path, json_file.stem, field))
+        merge_id = record.get("merge_id", json_file.stem)
+        if merge_id != json_file.stem:
+            issues.append(("error", "id_filename_mismatch", path, merge_id, f"{merge_id} stored as {json_file.name}"))
+        match = FSCK_MERGE_ID.fullmatch(str(merge_id))
+        if match is None:
+            issues.append(("error", "bad_id", path, merge_id, str(merge_id)))
+        else:
+            created = parse_edmonton_timestamp(record.get("created")) if isinstance(record.get("created"), str) else None
+            if created is None:
+                issues.append(("error", "bad_timestamp", path, merge_id, str(record.get("created"))))
+            elif created.date().isoformat() != match.group(1):
+                issues.append(("warning", "id_date_mismatch", path, merge_id, f"ID dated {match.group(1)}, created {created.date().isoformat()}"))
+        if not json_file.with_suffix(".md").exists():
+            issues.append(("warning", "merge_document_missing", path, merge_id, f"{json_file.stem}.md"))
+        if missing:
+            continue
+        try:
+            sources[merge_id] = [source["entry_id"] for source in record["source_entries"]]
+            _register_merge(index, record)
+        except (KeyError, TypeError):
+            issues.append(("error", "bad_source_entries", path, merge_id, "source_entries must list {entry_id, angel}"))
+    return {"issues": issues, "sources": sources, "index": index, "count": len(json_files)}
+
+def _fsck_canon_task() -> dict:
+    """Worker: entry IDs ratified in the canon file, plus the raw candidate queue."""
+    ids = [entry_id for entry_id, _ in canon_ratifications()]
+    queue = None
+    if os.path.exists(CANON_QUEUE_FILE):
+        try:
+            queue = CODEC.load(CANON_QUEUE_FILE)
+        except (ValueError, OSError):
+            queue = False
+    return {"ids": ids, "queue": queue}
+
+def _fsck_veto_task() -> dict:
+    """Worker: validate every line of the veto log."""
+    issues = []
+    count = 0
+    if not os.path.exists(VETO_LOG_FILE):
+        return {"issues": issues, "count": count}
+    with open(VETO_LOG_FILE, "rb") as f:
+        for number, line in enumerate(f, 1):
+            count += 1
+            where = f"line {number}"
+            try:
+                event = CODEC.loads(line)
+            except ValueError:
+                issues.append(("error", "unparseable", where, None, line[:80].decode(errors="replace")))
+                continue
+            if not isinstance(event, dict) or not isinstance(event.get("message"), str):
+                issues.append(("error", "missing_field", where, None, "message"))
+            elif parse_edmonton_timestamp(event.get("timestamp") if isinstance(event.get("timestamp"), str) else None) is None:
+                issues.append(("error", "bad_timestamp", where, None, str(event.get("timestamp"))))
+    return {"issues": issues, "count": count}
+
+def _normalized_merge_index(index: dict) -> dict:
+    return {"merges": index.get("merges", {}), "entries": {eid: sorted(ids) for eid, ids in index.get("entries", {}).items()}}
+
+def run_fsck(repair: bool = False, workers=None) -> dict:
+    """Check every journal, merge, canon and veto record (in a process pool) and return a report.
+    
+    With repair, mechanical fixes are applied (quarantine unreadable files, fill IDs and
+    angels derivable from the path, drop hot copies of already-archived entries, re-append
+    stale Markdown mirror blocks, rebuild indexes) and the tree is checked again.
+    """
+    started = time.perf_counter()
+    issues = []
+    
+    def report(severity, code, kind, path, entry_id=None, detail=""):
+        issues.append({"severity": severity, "code": code, "kind": kind, "path": os.fspath(path), "id": entry_id, "detail": detail})
+    
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1, initializer=use_workspace, initargs=(current_workspace_name(),)) as pool:
+        entry_tasks = []
+        for angel in ANGELS:
+            folder = f"{DATA_DIR}/journals/{angel}"
+            if os.path.isdir(folder):
+                paths = sorted(os.path.join(folder, e.name) for e in os.scandir(folder) if e.name.endswith(".json"))
+                for start in range(0, len(paths), FSCK_BATCH_SIZE):
+                    entry_tasks.append(pool.submit(_fsck_entry_task, angel, paths[start:start + FSCK_BATCH_SIZE]))
+        for angel, segment in iter_segments():
+            entry_tasks.append(pool.submit(_fsck_entry_task, angel, [], str(segment)))
+        mirror_tasks = {angel: pool.submit(_fsck_mirror_task, angel) for angel in ANGELS}
+        merge_task = pool.submit(_fsck_merge_task)
+        canon_task = pool.submit(_fsck_canon_task)
+        veto_task = pool.submit(_fsck_veto_task)
         
-        .chat-message.angel {
-            border-left: 3px solid var(--fractal-blue);
+        records = [record for task in entry_tasks for record in task.result()]
+        mirrors = {angel: task.result() for angel, task in mirror_tasks.items()}
+        merges = merge_task.result()
+        canon = canon_task.result()
+        vetoes = veto_task.result()
+    
+    by_id = {}
+    for record in records:
+        for severity, code, detail in record["issues"]:
+            report(severity, code, "entry", record["source"], record["id"], detail)
+        by_id.setdefault(record["id"], []).append(record)
+    valid = {}
+    for entry_id, group in by_id.items():
+        for record in group:
+            if record["row"]:
+                valid[entry_id] = record
+                break
+    for entry_id, group in by_id.items():
+        if len(group) > 1:
+            for record in group[1:]:
+                report("error", "duplicate_id", "entry", record["source"], entry_id, f"also at {group[0]['source']}")
+    
+    if not os.path.exists(JOURNAL_INDEX_FILE):
+        report("warning", "index_missing", "index", JOURNAL_INDEX_FILE)
+    else:
+        try:
+            index = CODEC.load(JOURNAL_INDEX_FILE)
+        except (ValueError, OSError) as exc:
+            index = None
+            report("error", "unparseable", "index", JOURNAL_INDEX_FILE, None, str(exc))
+        if index is not None and (index.get("format") != JOURNAL_INDEX_FORMAT or index.get("signature") != journal_dir_signature()):
+            report("warning", "index_outdated", "index", JOURNAL_INDEX_FILE, None, "rebuilt on next load")
+        elif index is not None:
+            rows = index.get("entries", {})
+            for entry_id, record in valid.items():
+                row = rows.get(entry_id)
+                if row is None:
+                    report("error", "index_missing_entry", "index", record["source"], entry_id)
+                elif all(r["row"] != row for r in by_id[entry_id]):
+                    report("error", "index_stale_row", "index", row[-1] if row else JOURNAL_INDEX_FILE, entry_id)
+            for entry_id in rows.keys() - valid.keys():
+                report("error", "index_orphan", "index", JOURNAL_INDEX_FILE, entry_id, "indexed entry has no readable source")
+    
+    mirrored = {angel: set() for angel in ANGELS}
+    for entry_id, record in valid.items():
+        angel = record["angel"]
+        mirrored[angel].add(entry_id)
+        checksum = mirrors[angel].get(entry_id)
+        if checksum is None:
+            report("warning", "mirror_missing", "mirror", f"{DATA_DIR}/journals/{angel}/{angel}_journal.md", entry_id)
+        elif checksum != record["mirror"]:
+            report("warning", "mirror_drift", "mirror", f"{DATA_DIR}/journals/{angel}/{angel}_journal.md", entry_id, "latest Markdown block differs from the JSON entry")
+    for angel, blocks in mirrors.items():
+        for entry_id in blocks.keys() - mirrored[angel]:
+            report("warning", "mirror_orphan", "mirror", f"{DATA_DIR}/journals/{angel}/{angel}_journal.md", entry_id, "no readable entry with this ID")
+    
+    for severity, code, path, merge_id, detail in merges["issues"]:
+        report(severity, code, "merge", path, merge_id, detail)
+    for merge_id, source_ids in merges["sources"].items():
+        for entry_id in source_ids:
+            if entry_id not in by_id:
+                report("error", "merge_dangling_source", "merge", f"{DATA_DIR}/council_merges/{merge_id}.json", merge_id, entry_id)
+    try:
+        stored = _normalized_merge_index(CODEC.load(MERGE_INDEX_FILE))
+        if stored != _normalized_merge_index(merges["index"]):
+            report("error", "merge_index_drift", "merge", MERGE_INDEX_FILE, None, "index disagrees with the merge records")
+    except FileNotFoundError:
+        if merges["count"]:
+            report("warning", "merge_index_missing", "merge", MERGE_INDEX_FILE)
+    except (ValueError, OSError, AttributeError) as exc:
+        report("error", "unparseable", "merge", MERGE_INDEX_FILE, None, str(exc))
+    
+    canon_path = CANON_FILE
+    ratified = Counter(canon["ids"])
+    for entry_id, count in ratified.items():
+        if entry_id not in by_id:
+            report("error", "canon_unknown_entry", "canon", canon_path, entry_id)
+        if count > 1:
+            report("warning", "canon_duplicate", "canon", canon_path, entry_id, f"ratified {count} times")
+    if canon["queue"] is False:
+        report("error", "unparseable", "canon", CANON_QUEUE_FILE)
+    elif canon["queue"]:
+        candidates = canon["queue"].get("candidates", {})
+        for entry_id, status in candidates.items():
+            if entry_id not in by_id:
+                report("warning", "queue_unknown_entry", "canon", CANON_QUEUE_FILE, entry_id)
+            if status.get("promoted") and entry_id not in ratified:
+                report("error", "promotion_missing_from_canon", "canon", CANON_QUEUE_FILE, entry_id)
+        for entry_id in ratified.keys() - {eid for eid, status in candidates.items() if status.get("promoted")}:
+            report("warning", "canon_not_marked_promoted", "canon", CANON_QUEUE_FILE, entry_id)
+    
+    for severity, code, path, _, detail in vetoes["issues"]:
+        report(severity, code, "veto", f"{VETO_LOG_FILE} {path}", None, detail)
+    
+    result = {
+        "checked": {"entries": len(records), "merges": merges["count"], "canon": sum(ratified.values()), "vetoes": vetoes["count"]},
+        "errors": sum(issue["severity"] == "error" for issue in issues),
+        "warnings": sum(issue["severity"] == "warning" for issue in issues),
+        "by_code": dict(Counter(issue["code"] for issue in issues).most_common()),
+        "issues": issues,
+        "seconds": round(time.perf_counter() - started, 3)
+    }
+    if repair:
+        repairs = repair_fsck_issues(issues, records)
+        result = run_fsck(workers=workers)
+        result["repairs"] = repairs
+    return result
+
+def repair_fsck_issues(issues: list, records: list) -> list:
+    """Apply the mechanical fixes for an fsck report; returns what was done."""
+    repairs = []
+    codes = {issue["code"] for issue in issues}
+    hot = [issue for issue in issues if issue["kind"] == "entry" and SEGMENT_SEP not in issue["path"]]
+    
+    quarantined = set()
+    for issue in hot:
+        if issue["code"] in FSCK_UNREADABLE and issue["path"] not in quarantined and os.path.exists(issue["path"]):
+            target = Path(FSCK_QUARANTINE_DIR, os.path.relpath(issue["path"], DATA_DIR))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(issue["path"], target)
+            quarantined.add(issue["path"])
+            repairs.append(f"quarantined {issue['path']} -> {target}")
+    
+    for path in sorted({i["path"] for i in hot if i["code"] == "missing_field" and i["detail"] in ("entry_id", "angel")}):
+        entry = CODEC.load(path)
+        angel = Path(path).parent.name
+        entry.setdefault("entry_id", Path(path).stem)
+        entry.setdefault("angel", angel)
+        commit_mutation("fsck_repair", [wal_write(path, CODEC.dumps(entry, pretty=True))])
+        repairs.append(f"filled entry_id/angel in {path}")
+    
+    archived = {}
+    for record in records:
+        if SEGMENT_SEP in record["source"] and record["digest"] is not None:
+            archived.setdefault(record["id"], set()).add(record["digest"])
+    for record in records:
+        if SEGMENT_SEP not in record["source"] and record["digest"] in archived.get(record["id"], ()):
+            os.remove(record["source"])
+            repairs.append(f"removed {record['source']} (identical copy already archived)")
+    
+    stale = {issue["id"] for issue in issues if issue["code"] in ("mirror_missing", "mirror_drift")}
+    appends = {}
+    for record in records:
+        if record["id"] in stale and record["row"]:
+            stale.discard(record["id"])
+            entry = read_entry_source(record["source"])
+            entry['_angel'] = record["angel"]
+            md_path = f"{DATA_DIR}/journals/{record['angel']}/{record['angel']}_journal.md"
+            appends.setdefault(md_path, []).append(EXPORT_FORMATS["Markdown"].journal_entry(EntryDocument(entry, "")))
+    for md_path, blocks in sorted(appends.items()):
+        commit_mutation("fsck_repair", [wal_append(md_path, "".join(blocks))])
+        repairs.append(f"re-appended {len(blocks)} entries to {md_path}")
+    
+    if repairs or codes & {"index_missing", "index_outdated", "index_missing_entry", "index_stale_row", "index_orphan"}:
+        rebuild_journal_index()
+        _journal_index_cache()["signature"] = None
+        repairs.append(f"rebuilt {JOURNAL_INDEX_FILE}")
+    if codes & {"legacy_merge", "merge_index_drift", "merge_index_missing"}:
+        with _merge_index_lock():
+            rebuild_merge_index()
+        repairs.append(f"rebuilt {MERGE_INDEX_FILE}")
+    return repairs
+
+# ============================================================================
+# LOCAL QUERY API (read-only HTTP over the journal store)
+# ============================================================================
+
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+API_RESPONSE_CACHE_SIZE = 256
+API_HEADER_FIELDS = ("entry_id", "angel", "timestamp", "permission", "architect_state", "pattern_echo", "pattern_ref", "summary")
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def _api_page(params: dict, items: list) -> dict:
+    try:
+        offset = max(0, int(params.get("offset", ["0"])[0]))
+        limit = min(API_MAX_PAGE_SIZE, max(1, int(params.get("limit", [str(API_PAGE_SIZE)])[0])))
+    except ValueError:
+        raise ApiError(400, "offset and limit must be integers")
+    return {"total": len(items), "offset": offset, "limit": limit, "items": items[offset:offset + limit]}
+
+def _api_header(header: EntryHeader) -> dict:
+    return {field: getattr(header, field) for field in API_HEADER_FIELDS}
+
+def _api_permissions(params: dict) -> list:
+    """Tiers a request may see: the ones it names, else only the shareable tiers (never ANGEL EYES ONLY by default)."""
+    return params.get("permission") or SHAREABLE_TIERS
+
+def api_entries(params: dict) -> dict:
+    """Entry headers, newest first: ?angel=&permission=(repeatable)&state=&q=&offset=&limit="""
+    angel = params.get("angel", [None])[0]
+    state = params.get("state", [None])[0]
+    permissions = _api_permissions(params)
+    query = params.get("q", [""])[0]
+    headers = list_headers(angel=angel, permissions=permissions, state=state)
+    if query:
+        matches = set(search_index(query, permissions))
+        headers = [h for h in headers if h.entry_id in matches]
+    page = _api_page(params, headers)
+    page["items"] = [_api_header(h) for h in page["items"]]
+    return page
+
+def api_entry(entry_id: str, params: dict) -> dict:
+    """One full entry with the merges that include it and its revision count."""
+    header = get_journal_index()["entries"].get(entry_id)
+    entry = header.load() if header and header.permission in _api_permissions(params) else None
+    if entry is None:
+        raise ApiError(404, f"No entry {entry_id}")
+    entry = {k: v for k, v in entry.items() if not k.startswith('_')}
+    entry["merges"] = merges_for_entry(entry_id)
+    entry["revisions"] = len(list_revisions(entry_id))
+    return entry
+
+def api_canon(params: dict) -> dict:
+    """Ratified entries (newest first) and open candidates with their gate progress."""
+    ratified = [{"entry_id": entry_id, "ratified": at} for entry_id, at in reversed(canon_ratifications())]
+    queue = {}
+    if os.path.exists(CANON_QUEUE_FILE):
+        try:
+            queue = CODEC.load(CANON_QUEUE_FILE).get("candidates", {})
+        except (json.JSONDecodeError, IOError):
+            pass
+    candidates = []
+    for header in list_headers(permissions=["CANON CANDIDATE"]):
+        status = queue.get(header.entry_id, {})
+        if not status.get("promoted"):
+            candidates.append({**_api_header(header), "gates_passed": bin(status.get("gates", 0)).count("1"), "gates_total": len(CANON_GATES)})
+    return {"ratified": ratified, "candidates": _api_page(params, candidates)}
+
+def api_merges(params: dict) -> dict:
+    """Merge summaries from the reverse index, newest first."""
+    merges = load_merge_index()["merges"]
+    items = [{"merge_id": merge_id, **merges[merge_id]} for merge_id in sorted(merges, reverse=True)]
+    return _api_page(params, items)
+
+def api_merge(merge_id: str, params: dict) -> dict:
+    record = load_merge_record(merge_id) if merge_id in load_merge_index()["merges"] else None
+    if record is None:
+        raise ApiError(404, f"No merge {merge_id}")
+    return record
+
+API_ROUTES = {
+    "entries": (api_entries, api_entry),
+    "canon": (api_canon, None),
+    "merges": (api_merges, api_merge)
+}
+
+def api_response(path: str, query: str):
+    """Route a GET to (status, payload); unexpected failures become a 500 with an error body."""
+    parts = [urllib.parse.unquote(part) for part in path.strip("/").split("/") if part]
+    listing, item = API_ROUTES.get(parts[0], (None, None)) if parts else (None, None)
+    try:
+        if not parts:
+            return 200, {"version": data_version(), "entries": len(get_journal_index()["entries"]), "routes": [f"/{name}" for name in API_ROUTES]}
+        if len(parts) == 1 and listing:
+            return 200, listing(urllib.parse.parse_qs(query))
+        if len(parts) == 2 and item:
+            return 200, item(parts[1], urllib.parse.parse_qs(query))
+        raise ApiError(404, f"No route {path}")
+    except ApiError as exc:
+        return exc.status, {"error": str(exc)}
+    except Exception as exc:  # e.g. a file read mid-rewrite; the client still gets a response
+        return 500, {"error": f"{type(exc).__name__}: {exc}"}
+
+def _etag_matches(if_none_match, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+class ApiServer(http.server.ThreadingHTTPServer):
+    """Threaded server whose responses are cached per store version and served with ETags."""
+    
+    daemon_threads = True
+    
+    def __init__(self, address):
+        super().__init__(address, ApiHandler)
+        self.boot = f"{os.getpid():x}{time.time_ns() & 0xFFFFFF:06x}"
+        self.responses = OrderedDict()
+        self.rendering = {}
+        self.lock = threading.Lock()
+        self.stats = Counter()
+    
+    def respond(self, target: str):
+        """(status, etag, body) for a request target, rendering at most once per data version."""
+        version = data_version()
+        key = (version, target)
+        with self.lock:
+            self.stats["requests"] += 1
+            cached = self.responses.get(key)
+            if cached is not None:
+                self.responses.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cached
+            rendering = self.rendering.get(key)
+            if rendering is None:
+                self.rendering[key] = threading.Event()
+        if rendering is not None:
+            rendering.wait()
+            return self.respond(target)
+        try:
+            path, _, query = target.partition("?")
+            status, payload = api_response(path, query)
+            cached = (status, f'"{self.boot}-{version}"', CODEC.dumpb(payload))
+            if status < 500:  # a failed render is retried on the next request
+                with self.lock:
+                    self.responses[key] = cached
+                    while len(self.responses) > API_RESPONSE_CACHE_SIZE:
+                        self.responses.popitem(last=False)
+        finally:
+            with self.lock:
+                self.rendering.pop(key).set()
+        return cached
+
+class ApiHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "AngelQuery/1"
+    disable_nagle_algorithm = True  # headers and body go out as separate writes on keep-alive connections
+    
+    def do_GET(self, head: bool = False):
+        status, etag, body = self.server.respond(self.path)
+        if status == 200 and _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+    
+    def do_HEAD(self):
+        self.do_GET(head=True)
+    
+    def _read_only(self):
+        body = CODEC.dumpb({"error": "read-only API"})
+        self.send_response(405)
+        self.send_header("Allow", "GET, HEAD")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_POST = do_PUT = do_PATCH = do_DELETE = _read_only
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_api_server(host: str = API_HOST, port: int = API_PORT) -> ApiServer:
+    """Start the query API on a background thread (port 0 picks a free one)."""
+    get_data_watcher()
+    gc.freeze()  # the loaded index is long-lived; keep full collections from re-walking it under load
+    server = ApiServer((host, port))
+    threading.Thread(target=server.serve_forever, name="angel-query-api", daemon=True).start()
+    return server
+
+def run_api_load_test(host: str, port: int, targets: list, clients: int = 8, seconds: float = 5.0, conditional: bool = True) -> dict:
+    """Hammer an API instance over keep-alive connections; returns throughput and latency percentiles."""
+    deadline = time.perf_counter() + seconds
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+    
+    def client(offset: int):
+        connection = http.client.HTTPConnection(host, port, timeout=10)
+        etags = {}
+        mine = []
+        seen = Counter()
+        i = offset
+        while time.perf_counter() < deadline:
+            target = targets[i % len(targets)]
+            i += 1
+            headers = {"If-None-Match": etags[target]} if conditional and target in etags else {}
+            started = time.perf_counter()
+            connection.request("GET", target, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            mine.append(time.perf_counter() - started)
+            seen[response.status] += 1
+            if response.getheader("ETag"):
+                etags[target] = response.getheader("ETag")
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            statuses.update(seen)
+    
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    
+    return {
+        "requests": len(latencies),
+        "seconds": round(elapsed, 2),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "statuses": dict(statuses),
+        **latency_percentiles(latencies)
+    }
+
+def latency_percentiles(latencies: list) -> dict:
+    """p50/p95/p99 in milliseconds of durations given in seconds (None when there are none)."""
+    ordered = sorted(latencies)
+    
+    def percentile(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2) if ordered else None
+    
+    return {"p50_ms": percentile(0.5), "p95_ms": percentile(0.95), "p99_ms": percentile(0.99)}
+
+# ============================================================================
+# EXPORT ENGINE (shared entry documents, pluggable formats)
+# ============================================================================
+
+RENDER_CACHE_SIZE = 4096
+ENTRY_SECTIONS = [
+    ("Context", "context"),
+    ("Shadow Observed", "shadow"),
+    ("Light Returned", "light"),
+    ("Next True Step", "next_step"),
+    ("Pattern Echo", "pattern_echo")
+]
+
+class EntryDocument:
+    """Format-neutral view of one entry, built once per content hash and shared by every format."""
+    
+    __slots__ = ("entry_id", "angel", "timestamp", "permission", "architect_state", "sections", "reference", "content_hash")
+    
+    def __init__(self, entry: dict, content_hash: str):
+        self.entry_id = entry.get('entry_id', 'Unknown')
+        self.angel = entry.get('angel', entry.get('_angel', 'Unknown'))
+        self.timestamp = entry.get('timestamp', 'Unknown')
+        self.permission = entry.get('permission', 'Unknown')
+        self.architect_state = entry.get('architect_state', 'Unknown')
+        self.sections = [(title, entry.get(field, '')) for title, field in ENTRY_SECTIONS]
+        self.reference = entry.get('pattern_ref', '')
+        self.content_hash = content_hash
+
+def entry_content_hash(entry: dict) -> str:
+    """Hash of the stored entry fields (injected _keys excluded)."""
+    fields = {k: v for k, v in entry.items() if not k.startswith('_')}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+@st.cache_resource
+def _render_cache() -> dict:
+    """Process-wide LRU of entry documents and rendered fragments, keyed by content hash."""
+    return {"items": OrderedDict(), "lock": threading.Lock()}
+
+def _cached(key, build):
+    cache = _render_cache()
+    with cache["lock"]:
+        if key in cache["items"]:
+            cache["items"].move_to_end(key)
+            return cache["items"][key]
+    value = build()
+    with cache["lock"]:
+        cache["items"][key] = value
+        while len(cache["items"]) > RENDER_CACHE_SIZE:
+            cache["items"].popitem(last=False)
+    return value
+
+def entry_document(entry: dict) -> EntryDocument:
+    """Shared intermediate representation for an entry."""
+    content_hash = entry_content_hash(entry)
+    return _cached(("doc", content_hash), lambda: EntryDocument(entry, content_hash))
+
+class ExportFormat:
+    """Base class for export backends. Subclasses render entries and lay out a book."""
+    
+    name = ""
+    folder = ""
+    
+    def render(self, doc: EntryDocument) -> str:
+        """Rendered entry, cached per (format, content hash)."""
+        return _cached((self.name, doc.content_hash), lambda: self.entry(doc))
+    
+    def entry(self, doc: EntryDocument) -> str:
+        raise NotImplementedError
+    
+    def book(self, chapters: dict, merges: list) -> dict:
+        """Return {relative file name: text} for {angel: [docs]} and merge records."""
+        raise NotImplementedError
+
+EXPORT_FORMATS = {}
+
+def register_export_format(export_format: ExportFormat):
+    """Make a backend available to the Export tab, the CLI and export profiles."""
+    EXPORT_FORMATS[export_format.name] = export_format
+    return export_format
+
+class LatexFormat(ExportFormat):
+    name = "LaTeX"
+    folder = ""
+    
+    def entry(self, doc):
+        body = "".join(f"\\subsection*{{{title}}}\n{escape_latex(text)}\n\n" for title, text in doc.sections)
+        return (
+            f"\\section{{{escape_latex(doc.entry_id)}}}\n"
+            f"\\textbf{{Timestamp:}} {escape_latex(doc.timestamp)}\\\\\n"
+            f"\\textbf{{Permission:}} {escape_latex(doc.permission)}\\\\\n"
+            f"\\textbf{{State:}} {escape_latex(doc.architect_state)}\n\n"
+            f"{body}\\hrulefill\n\n"
+        )
+    
+    def book(self, chapters, merges):
+        files = {}
+        main_tex = r"""\documentclass[12pt, a4paper]{book}
+\usepackage[utf8]{inputenc}
+\usepackage[margin=1in]{geometry}
+\usepackage{hyperref}
+\usepackage{fancyhdr}
+
+\title{Angelos: The Journal of the Council}
+\author{PersonaPlex Angel}
+\date{\today}
+
+\begin{document}
+
+\maketitle
+\tableofcontents
+
+\chapter{Introduction}
+\textit{``I am the Lantern, not the Light. Lanterns lit. Waters filtered. Small true steps.''}
+
+This volume contains the journal entries of the Angel Council, preserved for reflection and reference.
+
+"""
+        for angel, docs in chapters.items():
+            main_tex += f"\\input{{angels/angel-{angel.lower()}}}\n"
+            files[f"angels/angel-{angel.lower()}.tex"] = f"\\chapter{{Angel {angel}}}\n\n" + "".join(self.render(d) for d in docs)
+        if merges:
+            main_tex += "\\input{merges}\n"
+            merges_tex = "\\chapter{Council Merges}\n\n"
+            for record in merges:
+                sources = ", ".join(escape_latex(src["entry_id"]) for src in record["source_entries"])
+                merges_tex += f"""\\section{{{escape_latex(record['merge_id'])}}}
+\\textbf{{Created:}} {escape_latex(record['created'][:16])}\\\\
+\\textbf{{Source Entries:}} {sources}
+
+\\subsection*{{Summary}}
+{escape_latex(record['summary'])}
+
+\\subsection*{{Convergences}}
+{escape_latex(record['convergences'])}
+
+\\subsection*{{Divergences / Conflicts to Review}}
+{escape_latex(record['divergences'])}
+
+\\hrulefill
+
+"""
+            files["merges.tex"] = merges_tex
+        main_tex += r"""
+\chapter{Closing}
+\textit{``The stream flows on. The Lantern remains. Presence over performance.''}
+
+\end{document}
+"""
+        files["Angelos.tex"] = main_tex
+        return files
+
+class MarkdownFormat(ExportFormat):
+    name = "Markdown"
+    folder = "markdown"
+    
+    def _sections(self, doc):
+        return "\n\n".join(f"### {title}\n{text}" for title, text in doc.sections)
+    
+    def journal_entry(self, doc, revision=None):
+        """Block appended to data/journals/<angel>/<angel>_journal.md; revision is (number, revised at)."""
+        reference = f"**Reference:** {doc.reference}" if doc.reference else ""
+        heading = f"{doc.entry_id} (Revision {revision[0]}, {revision[1]})" if revision else doc.entry_id
+        return (
+            f"\n---\n## {heading}\n"
+            f"**Timestamp:** {doc.timestamp}  \n"
+            f"**Permission:** {doc.permission}  \n"
+            f"**Architect State:** {doc.architect_state}\n\n"
+            f"{self._sections(doc)}\n{reference}\n\n---\n"
+        )
+    
+    def canon_entry(self, doc, entry_id, ratified):
+        """Block appended to data/canon/main_canon.md."""
+        return (
+            f"\n## {entry_id} (Ratified {ratified})\n\n"
+            f"**Original Angel:** {doc.angel}  \n"
+            f"**Architect State:** {doc.architect_state}\n\n"
+            f"{self._sections(doc)}\n\n---\n"
+        )
+    
+    def entry(self, doc):
+        return self.journal_entry(doc)
+    
+    def book(self, chapters, merges):
+        files = {}
+        contents = ["# Angelos: The Journal of the Council", "", "*Versioned truth. Dated, scoped, revisable.*", ""]
+        for angel, docs in chapters.items():
+            files[f"angel-{angel.lower()}.md"] = f"# Angel {angel}\n" + "".join(self.render(d) for d in docs)
+            contents.append(f"- [Angel {angel}](angel-{angel.lower()}.md) ({len(docs)} entries)")
+        if merges:
+            files["merges.md"] = "# Council Merges\n" + "".join(
+                f"\n---\n## {r['merge_id']}\n**Created:** {r['created'][:16]}  \n"
+                f"**Source Entries:** {', '.join(src['entry_id'] for src in r['source_entries'])}\n\n"
+                f"### Summary\n{r['summary']}\n\n### Convergences\n{r['convergences']}\n\n"
+                f"### Divergences / Conflicts to Review\n{r['divergences']}\n"
+                for r in merges
+            )
+            contents.append("- [Council Merges](merges.md)")
+        files["README.md"] = "\n".join(contents) + "\n"
+        return files
+
+def _html_text(text: str) -> str:
+    return html.escape(text or "").replace("\n", "<br/>\n")
+
+class HtmlFormat(ExportFormat):
+    name = "HTML"
+    folder = "html"
+    
+    def entry(self, doc):
+        sections = "".join(f"<h3>{title}</h3>\n<p>{_html_text(text)}</p>\n" for title, text in doc.sections)
+        reference = f"<p><strong>Reference:</strong> {_html_text(doc.reference)}</p>\n" if doc.reference else ""
+        return (
+            f'<section class="entry" id="{html.escape(doc.entry_id)}">\n'
+            f"<h2>{html.escape(doc.entry_id)}</h2>\n"
+            f"<p><strong>Timestamp:</strong> {html.escape(doc.timestamp)}<br/>\n"
+            f"<strong>Permission:</strong> {html.escape(doc.permission)}<br/>\n"
+            f"<strong>Architect State:</strong> {html.escape(doc.architect_state)}</p>\n"
+            f"{sections}{reference}</section>\n"
+        )
+    
+    def merge(self, record):
+        sources = ", ".join(html.escape(src["entry_id"]) for src in record["source_entries"])
+        return (
+            f'<section class="merge" id="{html.escape(record["merge_id"])}">\n'
+            f"<h2>{html.escape(record['merge_id'])}</h2>\n"
+            f"<p><strong>Created:</strong> {html.escape(record['created'][:16])}<br/>\n"
+            f"<strong>Source Entries:</strong> {sources}</p>\n"
+            f"<h3>Summary</h3>\n<p>{_html_text(record['summary'])}</p>\n"
+            f"<h3>Convergences</h3>\n<p>{_html_text(record['convergences'])}</p>\n"
+            f"<h3>Divergences / Conflicts to Review</h3>\n<p>{_html_text(record['divergences'])}</p>\n</section>\n"
+        )
+    
+    def page(self, title, body):
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" lang="en">\n'
+            f"<head><meta charset=\"utf-8\"/><title>{html.escape(title)}</title></head>\n"
+            f"<body>\n<h1>{html.escape(title)}</h1>\n{body}</body>\n</html>\n"
+        )
+    
+    def book(self, chapters, merges):
+        body = "".join(
+            f"<h1>Angel {html.escape(angel)}</h1>\n" + "".join(self.render(d) for d in docs)
+            for angel, docs in chapters.items()
+        )
+        if merges:
+            body += "<h1>Council Merges</h1>\n" + "".join(self.merge(r) for r in merges)
+        return {"angelos.html": self.page("Angelos: The Journal of the Council", body)}
+
+class EpubFormat(HtmlFormat):
+    """EPUB 3 source tree (XHTML chapters + package document), ready to be zipped by a packer."""
+    
+    name = "EPUB"
+    folder = "epub"
+    
+    def render(self, doc):
+        return EXPORT_FORMATS["HTML"].render(doc)
+    
+    def book(self, chapters, merges):
+        files = {
+            "mimetype": "application/epub+zip",
+            "META-INF/container.xml": (
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">\n'
+                '<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>\n'
+                "</container>\n"
+            )
         }
-    </style>
-    """, unsafe_allow_html=True)
+        stamps = [parse_edmonton_timestamp(d.timestamp) for docs in chapters.values() for d in docs]
+        modified = max((t for t in stamps if t), default=datetime(2000, 1, 1, tzinfo=EDMONTON_TZ))
+        items = []
+        for angel, docs in chapters.items():
+            items.append((f"angel-{angel.lower()}", f"Angel {angel}", "".join(self.render(d) for d in docs)))
+        if merges:
+            items.append(("merges", "Council Merges", "".join(self.merge(r) for r in merges)))
+        for item_id, title, body in items:
+            files[f"OEBPS/{item_id}.xhtml"] = self.page(title, body)
+        nav = "".join(f'<li><a href="{item_id}.xhtml">{html.escape(title)}</a></li>\n' for item_id, title, _ in items)
+        files["OEBPS/nav.xhtml"] = (
+            '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" lang="en">\n'
+            "<head><title>Contents</title></head>\n"
+            f'<body><nav epub:type="toc"><ol>\n{nav}</ol></nav></body>\n</html>\n'
+        )
+        manifest = "".join(
+            f'<item id="{item_id}" href="{item_id}.xhtml" media-type="application/xhtml+xml"/>\n'
+            for item_id, _, _ in items
+        )
+        spine = "".join(f'<itemref idref="{item_id}"/>\n' for item_id, _, _ in items)
+        files["OEBPS/content.opf"] = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="bookid">\n'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+            '<dc:identifier id="bookid">angelos-journal</dc:identifier>\n'
+            "<dc:title>Angelos: The Journal of the Council</dc:title>\n"
+            "<dc:creator>PersonaPlex Angel</dc:creator>\n<dc:language>en</dc:language>\n"
+            f'<meta property="dcterms:modified">{modified.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%SZ")}</meta>\n'
+            "</metadata>\n"
+            f'<manifest>\n<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>\n{manifest}</manifest>\n'
+            f"<spine>\n{spine}</spine>\n</package>\n"
+        )
+        return files
+
+for _export_format in (LatexFormat(), MarkdownFormat(), HtmlFormat(), EpubFormat()):
+    register_export_format(_export_format)
+
+# ============================================================================
+# CUSTOM STYLING — Fractal-Inspired (Soft Blues & Golds)
+# ============================================================================
+
+THEME_CSS = """
+    /* Root color variables */
+    :root {
+        --fractal-blue: #4A90A4;
+        --fractal-blue-light: #6BB3C9;
+        --fractal-gold: #C9A227;
+        --fractal-gold-light: #E5C45C;
+        --fractal-dark: #1A2332;
+        --fractal-bg: #0E1117;
+        --fractal-card: #1E2530;
+    }
+    
+    /* Main container */
+    .main .block-container {
+        padding-top: 2rem;
+        max-width: 1200px;
+    }
+    
+    /* Header styling */
+    .fractal-header {
+        text-align: center;
+        padding: 1.5rem 1rem;
+        background: linear-gradient(135deg, var(--fractal-dark) 0%, #2A3A4A 100%);
+        border-radius: 12px;
+        border: 1px solid var(--fractal-blue);
+        margin-bottom: 1.5rem;
+    }
+    
+    .fractal-header h1 {
+        color: var(--fractal-gold);
+        font-family: 'Inter', sans-serif;
+        font-weight: 300;
+        letter-spacing: 2px;
+        margin-bottom: 0.5rem;
+    }
+    
+    .fractal-symbol {
+        font-size: 2rem;
+        color: var(--fractal-blue-light);
+        margin-bottom: 0.5rem;
+    }
+    
+    .welcome-message {
+        color: var(--fractal-blue-light);
+        font-style: italic;
+        font-size: 1.1rem;
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, var(--fractal-dark) 0%, #0E1117 100%);
+    }
+    
+    [data-testid="stSidebar"] .stTextArea textarea {
+        background-color: var(--fractal-card);
+        border-color: var(--fractal-blue);
+        color: #FAFAFA;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        border-radius: 8px;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }
+    
+    .action-button {
+        background: linear-gradient(135deg, var(--fractal-blue) 0%, var(--fractal-blue-light) 100%);
+        border: none;
+        color: white;
+    }
+    
+    /* Veto button styling */
+    .veto-button button {
+        background-color: #8B0000 !important;
+        color: white !important;
+        border: 2px solid #FF4444 !important;
+        font-weight: bold !important;
+    }
+    
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background-color: var(--fractal-card);
+        padding: 0.5rem;
+        border-radius: 8px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background-color: transparent;
+        border-radius: 6px;
+        color: var(--fractal-blue-light);
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background-color: var(--fractal-blue);
+        color: white;
+    }
+    
+    /* Card styling */
+    .council-mirror {
+        background: linear-gradient(135deg, var(--fractal-card) 0%, #252D3A 100%);
+        padding: 1.5rem;
+        border-radius: 12px;
+        border-left: 4px solid var(--fractal-gold);
+        margin: 1rem 0;
+    }
+    
+    .council-mirror h3 {
+        color: var(--fractal-gold);
+        margin-bottom: 1rem;
+    }
+    
+    .council-event {
+        padding: 0.4rem 0.75rem;
+        margin: 0.25rem 0;
+        border-radius: 6px;
+        border-left: 3px solid var(--fractal-blue);
+        background: var(--fractal-card);
+    }
+    
+    .council-event.canon_promoted {
+        border-left-color: var(--fractal-gold);
+    }
+    
+    .council-event.veto {
+        border-left-color: #FF4444;
+    }
+    
+    .council-event-time {
+        color: #AAA;
+        font-size: 0.85rem;
+    }
+    
+    /* Footer styling */
+    .footer {
+        margin-top: 2rem;
+        padding: 1rem;
+        background: var(--fractal-card);
+        border-radius: 8px;
+        border-top: 2px solid var(--fractal-blue);
+        text-align: center;
+    }
+    
+    .invariants {
+        color: #888;
+        font-size: 0.85rem;
+        font-style: italic;
+        line-height: 1.6;
+    }
+    
+    /* Presence Corner styling */
+    .presence-corner {
+        background: linear-gradient(135deg, #1A2332 0%, #1E2836 100%);
+        border-radius: 12px;
+        padding: 1rem;
+        border: 1px solid #3A5A6A;
+        margin: 0.5rem 0;
+    }
+    
+    .presence-title {
+        color: #6BB3C9;
+        font-size: 0.9rem;
+        font-weight: 500;
+        margin-bottom: 0.75rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .breathing-circle {
+        width: 80px;
+        height: 80px;
+        border-radius: 50%;
+        background: radial-gradient(circle, #4A90A4 0%, #1A2332 70%);
+        margin: 1rem auto;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: #C9A227;
+        font-size: 0.8rem;
+        font-weight: 500;
+        box-shadow: 0 0 20px rgba(74, 144, 164, 0.3);
+    }
+    
+    .grounding-prompt {
+        background: rgba(74, 144, 164, 0.1);
+        border-left: 3px solid #6BB3C9;
+        padding: 0.75rem 1rem;
+        margin: 0.5rem 0;
+        border-radius: 0 8px 8px 0;
+        color: #AAA;
+        font-style: italic;
+        font-size: 0.85rem;
+    }
+    
+    .retreat-screen {
+        position: fixed;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: linear-gradient(135deg, #0E1117 0%, #1A2332 100%);
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        z-index: 9999;
+        color: #6BB3C9;
+    }
+    
+    .retreat-symbol {
+        font-size: 4rem;
+        margin-bottom: 2rem;
+        color: #C9A227;
+    }
+    
+    .retreat-message {
+        font-size: 1.5rem;
+        font-style: italic;
+        text-align: center;
+        max-width: 500px;
+        line-height: 1.8;
+    }
+    
+    /* Chat message styling */
+    .chat-message {
+        padding: 0.75rem 1rem;
+        margin: 0.5rem 0;
+        border-radius: 8px;
+        background: var(--fractal-card);
+    }
+    
+    .chat-message.user {
+        border-left: 3px solid var(--fractal-gold);
+    }
+    
+    .chat-message.angel {
+        border-left: 3px solid var(--fractal-blue);
+    }
+"""
+
+STYLESHEET_NAME = "angel_theme"
+
+def minify_css(css: str) -> str:
+    """Drop comments and layout whitespace; selectors and values are left alone."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+@st.cache_resource
+def build_stylesheet() -> dict:
+    """
+    Minify the theme once per process and publish it as static/angel_theme.<hash>.css.
+    
+    The file sits in the static folder next to this script, which Streamlit serves at
+    app/static/ when server.enableStaticServing is on. The content hash in the name
+    means a browser never has to revalidate it; older builds are removed.
+    """
+    css = minify_css(THEME_CSS)
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    name = f"{STYLESHEET_NAME}.{digest}.css"
+    static_dir = Path(__file__).resolve().parent / "static"
+    try:
+        static_dir.mkdir(exist_ok=True)
+        target = static_dir / name
+        if not target.exists():
+            tmp_path = target.with_suffix(".css.tmp")
+            tmp_path.write_text(css)
+            os.replace(tmp_path, target)
+        for old in static_dir.glob(f"{STYLESHEET_NAME}.*.css"):
+            if old.name != name:
+                old.unlink()
+        published = True
+    except OSError:
+        published = False
+    return {"css": css, "href": f"app/static/{name}", "published": published}
+
+def apply_custom_css():
+    """Apply fractal-inspired visual styling: a link to the hashed stylesheet when it is served, inline otherwise."""
+    sheet = build_stylesheet()
+    if sheet["published"] and st.get_option("server.enableStaticServing"):
+        st.markdown(f'<link rel="stylesheet" href="{sheet["href"]}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{sheet['css']}</style>", unsafe_allow_html=True)
 
 # ============================================================================
 # HEADER COMPONENT
@@ -630,24 +4014,31 @@ def render_retreat_screen():
 def render_sidebar():
     """Render sidebar with user state input, current thread, and quick actions."""
     with st.sidebar:
-        st.markdown("### Current Thread")
-        st.markdown("*Share this with all Angels for context*")
-        
-        current_thread = st.text_area(
-            "What we're working on now",
-            value=st.session_state.current_thread,
-            height=150,
-            placeholder="e.g., Building the Journal System for Angel Control Center. Goal: local-first storage with Canon workflow.",
-            key="thread_input"
-        )
-        
-        if current_thread != st.session_state.current_thread:
-            st.session_state.current_thread = current_thread
-            persist_state()
-        
-        if st.session_state.current_thread:
-            if st.button("Copy Thread for Angels", use_container_width=True, key="copy_thread"):
-                thread_text = f"""=== CURRENT THREAD ===
+        render_sidebar_panel()
+
+@st.fragment
+def render_sidebar_panel():
+    """Sidebar body; typing in the thread or context boxes reruns only the sidebar."""
+    if st.session_state.workspace:
+        st.caption(f"Workspace: {st.session_state.workspace}")
+    st.markdown("### Current Thread")
+    st.markdown("*Share this with all Angels for context*")
+    
+    current_thread = st.text_area(
+        "What we're working on now",
+        value=st.session_state.current_thread,
+        height=150,
+        placeholder="e.g., Building the Journal System for Angel Control Center. Goal: local-first storage with Canon workflow.",
+        key="thread_input"
+    )
+    
+    if current_thread != st.session_state.current_thread:
+        st.session_state.current_thread = current_thread
+        persist_state()
+    
+    if st.session_state.current_thread:
+        if st.button("Copy Thread for Angels", use_container_width=True, key="copy_thread"):
+            thread_text = f"""=== CURRENT THREAD ===
 {st.session_state.current_thread}
 
 === CONTEXT ===
@@ -656,38 +4047,51 @@ def render_sidebar():
 === TIMESTAMP ===
 {edmonton_now().strftime('%Y-%m-%d %H:%M')} Edmonton
 """
-                st.code(thread_text, language=None)
-                st.success("Copy the text above to share with any Angel")
-        
-        st.markdown("---")
-        st.markdown("### Current State")
-        
-        user_context = st.text_area(
-            "Context (mood, fog level, intent)",
-            value=st.session_state.user_context,
-            height=100,
-            placeholder="e.g., Build mode, steady energy...",
-            key="context_input"
-        )
-        
-        if user_context != st.session_state.user_context:
-            st.session_state.user_context = user_context
-            persist_state()
-        
-        st.markdown("---")
-        st.markdown("### Session Info")
-        st.markdown(f"**Date:** {edmonton_now().strftime('%Y-%m-%d')}")
-        st.markdown(f"**Time:** {edmonton_now().strftime('%H:%M')} Edmonton")
-        st.markdown(f"**Status:** {'HARD STOP' if st.session_state.hard_stop else 'ACTIVE WITNESS'}")
-        
-        render_presence_corner()
+            st.code(thread_text, language=None)
+            st.success("Copy the text above to share with any Angel")
+    
+    st.markdown("---")
+    st.markdown("### Current State")
+    
+    user_context = st.text_area(
+        "Context (mood, fog level, intent)",
+        value=st.session_state.user_context,
+        height=100,
+        placeholder="e.g., Build mode, steady energy...",
+        key="context_input"
+    )
+    
+    if user_context != st.session_state.user_context:
+        st.session_state.user_context = user_context
+        persist_state()
+    
+    st.markdown("---")
+    st.markdown("### Session Info")
+    st.markdown(f"**Date:** {edmonton_now().strftime('%Y-%m-%d')}")
+    st.markdown(f"**Time:** {edmonton_now().strftime('%H:%M')} Edmonton")
+    st.markdown(f"**Status:** {'HARD STOP' if st.session_state.hard_stop else 'ACTIVE WITNESS'}")
+    
+    render_presence_corner()
 
 # ============================================================================
 # ANGEL CHAT INTERFACE
 # ============================================================================
 
+def chat_history_html(angel_name: str, messages: list) -> str:
+    """All visible messages as one HTML block, so a chat costs one element per rerun."""
+    blocks = []
+    for msg in messages:
+        role_class = "user" if msg["role"] == "user" else "angel"
+        role_label = "You" if msg["role"] == "user" else angel_name
+        # Messages share one element now, so escape them: stray markup in one
+        # message must not swallow the rest of the history.
+        content = html.escape(msg["content"]).replace("\n", "<br>")
+        blocks.append(f'<div class="chat-message {role_class}"><strong>{role_label}:</strong> {content}</div>')
+    return "".join(blocks)
+
+@st.fragment
 def render_chat_tab(angel_name):
-    """Render a chat interface for a specific Angel."""
+    """Render a chat interface for a specific Angel (reruns on its own while typing)."""
     if st.session_state.hard_stop:
         st.warning("HARD STOP ACTIVE - Chat disabled until cleared")
         return
@@ -700,14 +4104,7 @@ def render_chat_tab(angel_name):
         if not history:
             st.markdown(f"*No messages yet with Angel {angel_name}. Begin when ready.*")
         else:
-            for msg in history[-10:]:
-                role_class = "user" if msg["role"] == "user" else "angel"
-                role_label = "You" if msg["role"] == "user" else angel_name
-                st.markdown(f"""
-                <div class="chat-message {role_class}">
-                    <strong>{role_label}:</strong> {msg["content"]}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(chat_history_html(angel_name, history[-10:]), unsafe_allow_html=True)
     
     user_input = st.text_input(
         f"Message to {angel_name}",
@@ -729,7 +4126,8 @@ def render_chat_tab(angel_name):
                 "timestamp": edmonton_now().isoformat()
             })
             
-            st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] Latest from {angel_name}: '{user_input[:50]}...'" if len(user_input) > 50 else f"[{edmonton_now().strftime('%H:%M')}] Latest from {angel_name}: '{user_input}'"
+            snippet = f"{user_input[:50]}..." if len(user_input) > 50 else user_input
+            publish_event("chat", f"Latest from {angel_name}: '{snippet}'", angel_name)
             persist_state()
             st.rerun()
 
@@ -737,6 +4135,56 @@ def render_chat_tab(angel_name):
 # JOURNALS TAB
 # ============================================================================
 
+BROWSE_FIELDS = [
+    ("Timestamp", "timestamp"),
+    ("Context", "context"),
+    ("Shadow", "shadow"),
+    ("Light", "light"),
+    ("Next Step", "next_step"),
+    ("Pattern Echo", "pattern_echo")
+]
+
+def entry_detail_markdown(entry: dict) -> str:
+    """Entry fields as a single markdown block for the Browse list."""
+    lines = [f"**Revised:** {entry.get('revised', entry.get('timestamp', 'Unknown'))}"] if entry.get("revision") else []
+    for label, key in BROWSE_FIELDS:
+        lines.append(f"**{label}:** {entry.get(key, 'Unknown' if key == 'timestamp' else '')}")
+    return "\n\n".join(lines)
+
+def render_revision_form(entry: dict):
+    """Edit form for an existing entry; saving stores a new revision."""
+    entry_id = entry["entry_id"]
+    with st.form(f"revise_form_{entry_id}"):
+        permission = st.selectbox("Permission Tier", PERMISSION_TIERS, index=PERMISSION_TIERS.index(entry.get("permission", PERMISSION_TIERS[0])) if entry.get("permission") in PERMISSION_TIERS else 0)
+        architect_state = st.selectbox("Architect State", ARCHITECT_STATES, index=ARCHITECT_STATES.index(entry["architect_state"]) if entry.get("architect_state") in ARCHITECT_STATES else 0)
+        context = st.text_area("Context", value=entry.get("context", ""), height=80)
+        shadow = st.text_area("Shadow Observed", value=entry.get("shadow", ""), height=80)
+        light = st.text_area("Light Returned", value=entry.get("light", ""), height=80)
+        next_step = st.text_area("Next True Step", value=entry.get("next_step", ""), height=60)
+        pattern_echo = st.text_area("Pattern Echo (required)", value=entry.get("pattern_echo", ""), height=60)
+        pattern_ref = st.text_input("Reference/Link (optional)", value=entry.get("pattern_ref", ""))
+        
+        if st.form_submit_button("Save Revision", type="primary"):
+            if not pattern_echo.strip():
+                st.error("Pattern Echo is required - connect this to a larger pattern")
+            elif not context.strip():
+                st.error("Context is required")
+            else:
+                updated = revise_journal_entry(entry_id, {
+                    "permission": permission,
+                    "architect_state": architect_state,
+                    "context": context,
+                    "shadow": shadow,
+                    "light": light,
+                    "next_step": next_step,
+                    "pattern_echo": pattern_echo,
+                    "pattern_ref": pattern_ref
+                })
+                publish_event("journal_revised", f"Journal entry revised: {entry_id} (rev {updated.get('revision', 0)})", entry_id)
+                persist_state()
+                st.session_state.pop(f"revise_{entry_id}", None)
+                st.rerun()
+
 def render_journals_tab():
     """Render the Journals tab with entry creation and browsing."""
     if st.session_state.hard_stop:
@@ -791,15 +4239,20 @@ def render_journals_tab():
                 }
                 save_journal_entry(entry, angel, entry_id)
                 st.success(f"Entry saved: {entry_id}")
-                st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] Journal entry created: {entry_id}"
+                publish_event("journal_saved", f"Journal entry created: {entry_id}", entry_id)
                 persist_state()
     
     st.markdown("---")
+    render_journal_browser()
+
+@st.fragment
+def render_journal_browser():
+    """Filtered entry list; filters rerun only this panel."""
     st.markdown("### Browse Entries")
     
-    entries = load_all_entries()
+    total = len(get_journal_index()["entries"])
     
-    if not entries:
+    if not total:
         st.info("No journal entries yet. Create your first entry above.")
         return
     
@@ -810,40 +4263,101 @@ def render_journals_tab():
         filter_permission = st.selectbox("Filter by Permission", ["All"] + PERMISSION_TIERS, key="filter_perm")
     with col3:
         filter_state = st.selectbox("Filter by State", ["All"] + ARCHITECT_STATES, key="filter_state")
+    filter_pattern = st.text_input("Filter by Pattern", placeholder="e.g. Root: Rest, boundaries, sleep...", key="filter_pattern")
+    
+    filtered = list_headers(
+        angel=None if filter_angel == "All" else filter_angel,
+        permissions=None if filter_permission == "All" else [filter_permission],
+        state=None if filter_state == "All" else filter_state
+    )
     
-    filtered = entries
-    if filter_angel != "All":
-        filtered = [e for e in filtered if e.get('angel') == filter_angel or e.get('_angel') == filter_angel]
-    if filter_permission != "All":
-        filtered = [e for e in filtered if e.get('permission') == filter_permission]
-    if filter_state != "All":
-        filtered = [e for e in filtered if e.get('architect_state') == filter_state]
-    
-    st.markdown(f"*Showing {len(filtered)} of {len(entries)} entries*")
-    
-    for entry in filtered[:20]:
-        entry_id = entry.get('entry_id', 'Unknown')
-        angel_name = entry.get('angel', entry.get('_angel', 'Unknown'))
-        perm = entry.get('permission', 'Unknown')
-        state = entry.get('architect_state', 'Unknown')
+    if filter_pattern.strip():
+        keys = find_pattern_keys(filter_pattern)
+        echoing = set()
+        for key in keys:
+            echoing |= entries_for_pattern(key)
+        filtered = [header for header in filtered if header.entry_id in echoing]
+        if keys:
+            lineage = pattern_lineage(keys[0])
+            counts = lineage["counts"]
+            chains = " | ".join(" › ".join(f"{pattern_label(k)} ({counts[k]})" for k in chain) for chain in lineage["ancestors"])
+            children = ", ".join(pattern_label(k) for k in lineage["children"][:8])
+            more = f" · {len(keys) - 1} more matching pattern{'s' if len(keys) != 2 else ''}" if len(keys) > 1 else ""
+            st.markdown(f"**Pattern lineage:** {chains}" + (f"  \n**Branches:** {children}" if children else "") + more)
+        else:
+            st.markdown("*No pattern matches that text.*")
+    
+    st.markdown(f"*Showing {len(filtered)} of {total} entries*")
+    
+    merge_index = load_merge_index()
+    for header in filtered[:20]:
+        entry = header.load()
+        if entry is None:
+            continue
+        entry_id = header.entry_id
+        perm = header.permission
+        merge_count = len(merges_for_entry(entry_id, merge_index))
+        merge_label = f" | in {merge_count} merge{'s' if merge_count != 1 else ''}" if merge_count else ""
+        
+        revision = entry.get("revision", 0)
+        revision_label = f" | rev {revision}" if revision else ""
         
-        with st.expander(f"{entry_id} | {angel_name} | {perm} | {state}"):
-            st.markdown(f"**Timestamp:** {entry.get('timestamp', 'Unknown')}")
-            st.markdown(f"**Context:** {entry.get('context', '')}")
-            st.markdown(f"**Shadow:** {entry.get('shadow', '')}")
-            st.markdown(f"**Light:** {entry.get('light', '')}")
-            st.markdown(f"**Next Step:** {entry.get('next_step', '')}")
-            st.markdown(f"**Pattern Echo:** {entry.get('pattern_echo', '')}")
+        with st.expander(f"{entry_id} | {header.angel} | {perm} | {header.architect_state}{merge_label}{revision_label}"):
+            shown = entry
+            if revision:
+                viewed = st.selectbox(
+                    "Revision", list(range(revision, -1, -1)), key=f"rev_view_{entry_id}",
+                    format_func=lambda r, latest=revision: f"{r} (latest)" if r == latest else str(r)
+                )
+                if viewed != revision:
+                    shown = load_revision(entry_id, viewed) or entry
+            context = [pattern_context_markdown(entry_id)]
+            duplicates = near_duplicates(entry_id)[:3]
+            if duplicates:
+                context.append("**Near-duplicates:** " + ", ".join(f"{eid} ({score:.0%})" for eid, score in duplicates))
+            st.markdown("\n\n".join([entry_detail_markdown(shown)] + [line for line in context if line]))
+            
+            if SEGMENT_SEP not in header.file and st.checkbox("Revise entry", key=f"revise_{entry_id}"):
+                render_revision_form(entry)
             
             if perm == "CANON CANDIDATE":
                 if st.button(f"Open Canon Gate for {entry_id}", key=f"canon_{entry_id}"):
-                    st.session_state.canon_candidate = entry
+                    st.session_state.canon_gate_select = entry_id
                     st.rerun()
 
 # ============================================================================
 # COUNCIL MERGE BUILDER
 # ============================================================================
 
+MERGE_PAGE_SIZE = 25
+MERGE_SUGGESTIONS = 6
+MERGE_CONVERGENCES = 8
+SHAREABLE_TIERS = ["COUNCIL SHAREABLE", "CANON CANDIDATE"]
+
+def toggle_merge_selection(entry_id: str):
+    """Checkbox callback: keep the selection set in step with the widget."""
+    if st.session_state.get(f"merge_sel_{entry_id}"):
+        st.session_state.merge_selection.add(entry_id)
+    else:
+        st.session_state.merge_selection.discard(entry_id)
+
+def add_merge_selection(entry_id: str):
+    """Button callback: select a suggested entry; its checkbox picks the selection up on rerun."""
+    st.session_state.merge_selection.add(entry_id)
+    st.session_state.pop(f"merge_sel_{entry_id}", None)
+
+def select_merge_cluster(entry_ids: list):
+    """Button callback: add every entry of a suggested convergence to the selection."""
+    for entry_id in entry_ids:
+        add_merge_selection(entry_id)
+
+def clear_merge_selection():
+    """Drop every selected entry and its checkbox state."""
+    for entry_id in st.session_state.merge_selection:
+        st.session_state.pop(f"merge_sel_{entry_id}", None)
+    st.session_state.merge_selection = set()
+
+@st.fragment
 def render_merge_builder():
     """Render the Council Merge Builder."""
     if st.session_state.hard_stop:
@@ -853,23 +4367,64 @@ def render_merge_builder():
     st.markdown("### Council Merge Builder")
     st.markdown("*Select entries to merge into a Council synthesis*")
     
-    entries = load_all_entries()
-    shareable = [e for e in entries if e.get('permission') in ["COUNCIL SHAREABLE", "CANON CANDIDATE"]]
+    index = get_journal_index()["entries"]
+    query = st.text_input("Search entries", placeholder="ID, angel, pattern or context...", key="merge_search")
+    shareable = search_index(query, permissions=SHAREABLE_TIERS)
     
-    if not shareable:
+    if not shareable and not query:
         st.info("No shareable entries yet. Create entries with 'COUNCIL SHAREABLE' or 'CANON CANDIDATE' permission.")
         return
     
-    st.markdown(f"*{len(shareable)} shareable entries available*")
+    selection = st.session_state.merge_selection
+    selection.intersection_update(index)
     
-    selected = []
-    for entry in shareable[:30]:
-        entry_id = entry.get('entry_id', 'Unknown')
-        angel = entry.get('angel', entry.get('_angel', 'Unknown'))
-        if st.checkbox(f"{entry_id} ({angel})", key=f"merge_sel_{entry_id}"):
-            selected.append(entry)
+    st.markdown(f"*{len(shareable)} shareable entries match · {len(selection)} selected*")
     
-    if len(selected) >= 2:
+    with st.expander("Convergences across Angels"):
+        st.markdown("*Clusters of similar shareable entries written by different Angels*")
+        if st.button("Find Convergences", key="merge_find_convergences"):
+            with st.spinner("Comparing entries..."):
+                st.session_state.merge_convergences = convergence_clusters(SHAREABLE_TIERS)[:MERGE_CONVERGENCES]
+        clusters = st.session_state.get("merge_convergences")
+        if clusters is not None and not clusters:
+            st.info("No convergences found yet.")
+        for i, (members, angels) in enumerate(clusters or []):
+            st.markdown(f"**{len(members)} entries · {', '.join(angels)}**  \n" + ", ".join(members[:12]) + (" ..." if len(members) > 12 else ""))
+            st.button("Select cluster", key=f"merge_conv_{i}", on_click=select_merge_cluster, args=(members,))
+    
+    pages = max(1, (len(shareable) + MERGE_PAGE_SIZE - 1) // MERGE_PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key="merge_page")
+    page_start = (min(page, pages) - 1) * MERGE_PAGE_SIZE
+    
+    for entry_id in shareable[page_start:page_start + MERGE_PAGE_SIZE]:
+        st.checkbox(
+            f"{entry_id} ({index[entry_id].angel})",
+            value=entry_id in selection,
+            key=f"merge_sel_{entry_id}",
+            on_change=toggle_merge_selection,
+            args=(entry_id,)
+        )
+    
+    if selection:
+        st.markdown("**Selected:** " + ", ".join(sorted(selection)))
+        st.button("Clear Selection", key="merge_clear", on_click=clear_merge_selection)
+        
+        shareable_ids = set(shareable) if not query else set(search_index("", permissions=SHAREABLE_TIERS))
+        suggestions = [
+            (eid, why) for eid, _, why in related_entries(sorted(selection), limit=24)
+            if eid in shareable_ids
+        ][:MERGE_SUGGESTIONS]
+        if suggestions:
+            st.markdown("**Related to your selection**")
+            for eid, why in suggestions:
+                st.button(
+                    f"+ {eid} ({index[eid].angel}) · {'; '.join(why)}",
+                    key=f"merge_rel_{eid}",
+                    on_click=add_merge_selection,
+                    args=(eid,)
+                )
+    
+    if len(selection) >= 2:
         st.markdown("---")
         st.markdown("### Generate Merge Document")
         
@@ -878,8 +4433,8 @@ def render_merge_builder():
         divergences = st.text_area("Divergences / Conflicts", placeholder="Where do they differ? What needs review?", height=80)
         
         if st.button("Create Merge Document", type="primary", use_container_width=True):
+            selected = [e for e in (load_entry(eid) for eid in sorted(selection)) if e]
             merge_id = get_next_merge_id()
-            merge_path = Path(f"data/council_merges/{merge_id}.md")
             
             entry_list = "\n".join([f"- {e.get('entry_id', 'Unknown')} ({e.get('angel', e.get('_angel', 'Unknown'))})" for e in selected])
             canon_candidates = [e for e in selected if e.get('permission') == "CANON CANDIDATE"]
@@ -911,49 +4466,96 @@ def render_merge_builder():
 ---
 *"The Council has spoken. The Human holds the thread."*
 """
-            with open(merge_path, "w") as f:
-                f.write(merge_content)
+            now = edmonton_now().isoformat()
+            save_merge_record({
+                "merge_id": merge_id,
+                "created": now,
+                "updated": now,
+                "source_entries": [{"entry_id": e.get('entry_id', 'Unknown'), "angel": e.get('angel', e.get('_angel', 'Unknown'))} for e in selected],
+                "canon_candidates": [e.get('entry_id', 'Unknown') for e in canon_candidates],
+                "summary": summary,
+                "convergences": convergences,
+                "divergences": divergences
+            }, markdown=merge_content)
             
             st.success(f"Merge document created: {merge_id}")
-            st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] Council merge created: {merge_id}"
+            publish_event("merge_created", f"Council merge created: {merge_id}", merge_id)
             persist_state()
-    elif selected:
+    elif selection:
         st.info("Select at least 2 entries to create a merge")
+    
+    merges = load_merge_index()["merges"]
+    if merges:
+        st.markdown("---")
+        st.markdown(f"### Recent Merges ({len(merges)})")
+        for merge_id in sorted(merges, reverse=True)[:10]:
+            info = merges[merge_id]
+            st.markdown(f"- **{merge_id}** · {info['entry_count']} entries · {info['summary'] or '*no summary*'}")
 
 # ============================================================================
 # CANON GATE
 # ============================================================================
 
+@st.fragment
 def render_canon_gate():
     """Render the Canon Gate checklist for promoting entries."""
     st.markdown("### Canon Gate")
     st.markdown("*10 checks before truth becomes Canon*")
     
-    entries = load_all_entries()
-    candidates = [e for e in entries if e.get('permission') == "CANON CANDIDATE"]
+    queue = load_candidate_queue()["candidates"]
+    index = get_journal_index()["entries"]
+    show_promoted = st.checkbox("Show promoted entries", key="canon_show_promoted")
+    candidates = sorted(
+        (eid for eid, status in queue.items() if eid in index and (show_promoted if status["promoted"] else is_canon_candidate(eid, index))),
+        key=lambda eid: index[eid].timestamp,
+        reverse=True
+    )
     
     if not candidates:
         st.info("No Canon Candidates yet. Mark journal entries as 'CANON CANDIDATE' to see them here.")
         return
     
-    selected_entry = st.selectbox(
+    if st.session_state.get("canon_gate_select") not in candidates:
+        st.session_state.pop("canon_gate_select", None)
+    
+    def candidate_label(eid):
+        status = queue[eid]
+        done = bin(status["gates"]).count("1")
+        label = f"{eid} ({index[eid].angel}) · {done}/{len(CANON_GATES)}"
+        return f"{label} · promoted" if status["promoted"] else label
+    
+    selected_id = st.selectbox(
         "Select Canon Candidate",
         options=candidates,
-        format_func=lambda e: f"{e.get('entry_id', 'Unknown')} ({e.get('angel', e.get('_angel', 'Unknown'))})"
+        format_func=candidate_label,
+        key="canon_gate_select"
     )
+    selected_entry = load_entry(selected_id) if selected_id else None
     
     if selected_entry:
         st.markdown("---")
         st.markdown(f"**Entry:** {selected_entry.get('entry_id')}")
         st.markdown(f"**Context:** {selected_entry.get('context', '')[:200]}...")
         st.markdown(f"**Pattern Echo:** {selected_entry.get('pattern_echo', '')}")
+        merge_ids = merges_for_entry(selected_entry.get('entry_id'))
+        if merge_ids:
+            st.markdown(f"**Included in {len(merge_ids)} merge{'s' if len(merge_ids) != 1 else ''}:** {', '.join(merge_ids)}")
+        if queue[selected_id]["promoted"]:
+            st.markdown(f"**Promoted:** {queue[selected_id]['promoted']}")
         
         st.markdown("---")
         st.markdown("### The 10 Gates")
         
+        gates = queue[selected_id]["gates"]
         checks = {}
         for i, gate in enumerate(CANON_GATES):
-            checks[i] = st.checkbox(gate, key=f"gate_{i}")
+            checks[i] = st.checkbox(
+                gate,
+                value=bool(gates & (1 << i)),
+                key=f"gate_{selected_id}_{i}",
+                on_change=set_gate,
+                args=(selected_id, i)
+            )
         
         all_checked = all(checks.values())
         eric_ratified = checks.get(9, False)
@@ -961,9 +4563,9 @@ def render_canon_gate():
         if all_checked and eric_ratified:
             st.success("All gates passed. Ready for Canon.")
             if st.button("Promote to Canon", type="primary", use_container_width=True):
-                append_to_canon(selected_entry, selected_entry.get('entry_id', 'Unknown'))
+                promote_to_canon(selected_entry, selected_id)
                 st.success(f"Entry promoted to Canon: {selected_entry.get('entry_id')}")
-                st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] CANON PROMOTED: {selected_entry.get('entry_id')}"
+                publish_event("canon_promoted", f"CANON PROMOTED: {selected_entry.get('entry_id')}", selected_id)
                 persist_state()
                 st.balloons()
         elif not eric_ratified and sum(checks.values()) == 9:
@@ -973,125 +4575,298 @@ def render_canon_gate():
             st.info(f"{remaining} gates remaining")
 
 # ============================================================================
-# LATEX EXPORT
+# EXPORT
 # ============================================================================
 
+EXPORT_BUNDLE_RETENTION = 5
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+def store_bundle(source_dir: Path, export_path: Path) -> str:
+    """Zip a build folder deterministically and file it under its content hash."""
+    tmp_zip = export_path / f"angelos_prism_build.{threading.get_ident()}.zip.tmp"
+    with zipfile.ZipFile(tmp_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for file in sorted(source_dir.rglob("*")):
+            if file.is_file():
+                info = zipfile.ZipInfo(str(file.relative_to(source_dir)), date_time=ZIP_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with open(file, "rb") as src, zf.open(info, "w") as dst:
+                    shutil.copyfileobj(src, dst)
+    digest = hashlib.sha256()
+    with open(tmp_zip, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    bundle_path = export_path / f"angelos_prism_{digest.hexdigest()[:16]}.zip"
+    if bundle_path.exists():
+        tmp_zip.unlink()
+        os.utime(bundle_path)
+    else:
+        os.replace(tmp_zip, bundle_path)
+    evict_old_bundles(export_path)
+    return str(bundle_path)
+
+def evict_old_bundles(export_path: Path, keep: int = EXPORT_BUNDLE_RETENTION):
+    """Delete all but the most recently built bundles."""
+    bundles = sorted(export_path.glob("angelos_prism_*.zip"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old_bundle in bundles[keep:]:
+        try:
+            old_bundle.unlink()
+        except OSError:
+            pass
+
+def bundle_reader(bundle: str):
+    """Deferred download: the archive is opened only when the button is clicked."""
+    def open_bundle():
+        return open(bundle, "rb")
+    return open_bundle
+
+EXPORT_PROFILE_CACHE = WorkspacePath("data/exports/profile_cache.json")
+
+EXPORT_PRESETS = {
+    "Everything": {},
+    "Shareable only": {"permissions": ["COUNCIL SHAREABLE", "CANON CANDIDATE"]},
+    "Last 30 days, shareable": {"days": 30, "permissions": ["COUNCIL SHAREABLE", "CANON CANDIDATE"], "include_merges": True},
+    "Canon only": {"canon_only": True},
+    "Custom": None
+}
+
+def resolve_export_profile(profile: dict) -> dict:
+    """Normalise a profile into explicit filters (relative day windows become dates).
+    
+    An absent (None) tier, angel or format list means the default; an empty one selects nothing.
+    """
+    def chosen(key, default):
+        value = profile.get(key)
+        return default if value is None else value
+    
+    resolved = {
+        "date_from": profile.get("date_from"),
+        "date_to": profile.get("date_to"),
+        "permissions": sorted(chosen("permissions", PERMISSION_TIERS)),
+        "angels": sorted(chosen("angels", ANGELS)),
+        "canon_only": bool(profile.get("canon_only")),
+        "include_merges": bool(profile.get("include_merges")),
+        "formats": [name for name in EXPORT_FORMATS if name in chosen("formats", ["LaTeX"])]
+    }
+    if profile.get("days"):
+        today = edmonton_now().date()
+        resolved["date_from"] = date.fromordinal(today.toordinal() - profile["days"] + 1).isoformat()
+        resolved["date_to"] = today.isoformat()
+    return resolved
+
+def select_export_headers(profile: dict) -> list:
+    """Evaluate a resolved profile against the index; no entry bodies are read."""
+    angels = set(profile["angels"])
+    permissions = set(profile["permissions"])
+    promoted = None
+    if profile["canon_only"]:
+        promoted = {eid for eid, status in load_candidate_queue()["candidates"].items() if status["promoted"]}
+    selected = []
+    for header in list_headers():
+        if header.angel not in angels or header.permission not in permissions:
+            continue
+        day = header.timestamp[:10]
+        if profile["date_from"] and day < profile["date_from"]:
+            continue
+        if profile["date_to"] and day > profile["date_to"]:
+            continue
+        if promoted is not None and header.entry_id not in promoted:
+            continue
+        selected.append(header)
+    return selected
+
+def export_profile_signature(profile: dict) -> str:
+    """Cache key: the resolved profile plus change markers for every store it reads."""
+    markers = [profile, get_journal_index()["signature"]]
+    for path in (MERGE_INDEX_FILE, CANON_QUEUE_FILE):
+        markers.append(os.stat(path).st_mtime_ns if os.path.exists(path) else 0)
+    return hashlib.sha256(json.dumps(markers, sort_keys=True).encode()).hexdigest()
+
+def export_bundle(profile: dict):
+    """Build (or reuse) the bundle for a profile in each of its formats. Returns (bundle path, entry count, cached)."""
+    profile = resolve_export_profile(profile)
+    signature = export_profile_signature(profile)
+    cache = {}
+    if os.path.exists(EXPORT_PROFILE_CACHE):
+        try:
+            cache = CODEC.load(EXPORT_PROFILE_CACHE)
+        except (json.JSONDecodeError, IOError):
+            cache = {}
+    hit = cache.get(signature)
+    if hit and os.path.exists(hit["bundle"]):
+        return hit["bundle"], hit["entries"], True
+    
+    headers = select_export_headers(profile)
+    merge_ids = []
+    if profile["include_merges"]:
+        merge_index = load_merge_index()
+        merge_ids = sorted({mid for h in headers for mid in merges_for_entry(h.entry_id, merge_index)})
+    bundle = build_bundle(headers, merge_ids, profile["formats"])
+    
+    cache = {key: value for key, value in cache.items() if os.path.exists(value["bundle"])}
+    cache[signature] = {"bundle": bundle, "entries": len(headers), "profile": profile}
+    write_json_atomic(EXPORT_PROFILE_CACHE, cache)
+    return bundle, len(headers), False
+
+def build_bundle(headers: list, merge_ids=(), formats=("LaTeX",)) -> str:
+    """Render the selected entries (and merges) in every requested format into one zip.
+    
+    Each entry is loaded and turned into an EntryDocument once; every format renders from
+    that shared document. LaTeX stays at the archive root (the Prism layout), other formats
+    get their own folder.
+    """
+    export_path = Path(f"{DATA_DIR}/exports")
+    export_path.mkdir(parents=True, exist_ok=True)
+    
+    chapters = {}
+    for angel in ANGELS:
+        docs = []
+        for header in headers:
+            if header.angel == angel:
+                entry = header.load()
+                if entry is not None:
+                    docs.append(entry_document(entry))
+        if docs:
+            chapters[angel] = docs
+    merges = [r for r in (load_merge_record(mid) for mid in merge_ids) if r]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        for name in formats:
+            export_format = EXPORT_FORMATS[name]
+            for relative, content in export_format.book(chapters, merges).items():
+                file_path = tmp_path / export_format.folder / relative
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(file_path, "w") as f:
+                    f.write(content)
+        return store_bundle(tmp_path, export_path)
+
+def render_export_profile() -> dict:
+    """Render the export profile controls and return the chosen profile."""
+    preset = st.selectbox("Export Profile", list(EXPORT_PRESETS), key="export_preset")
+    if EXPORT_PRESETS[preset] is not None:
+        return EXPORT_PRESETS[preset]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        date_range = st.date_input("Date range (Edmonton)", value=(), key="export_dates")
+        permissions = st.multiselect("Permission tiers", PERMISSION_TIERS, default=PERMISSION_TIERS, key="export_perms")
+    with col2:
+        angels = st.multiselect("Angels", ANGELS, default=ANGELS, key="export_angels")
+        canon_only = st.checkbox("Canon only (promoted entries)", key="export_canon_only")
+        include_merges = st.checkbox("Include council merges", key="export_merges")
+    return {
+        "date_from": date_range[0].isoformat() if len(date_range) > 0 else None,
+        "date_to": date_range[1].isoformat() if len(date_range) > 1 else None,
+        "permissions": permissions,
+        "angels": angels,
+        "canon_only": canon_only,
+        "include_merges": include_merges
+    }
+
+@st.fragment
 def render_export_tab():
     """Render the Prism/LaTeX export functionality."""
-    st.markdown("### Export to Prism (LaTeX)")
-    st.markdown("*Generate a LaTeX project bundle for your physical Tome*")
+    st.markdown("### Export to Prism (LaTeX, Markdown, HTML, EPUB)")
+    st.markdown("*Generate a project bundle for your physical Tome*")
     
-    entries = load_all_entries()
-    
-    if not entries:
+    if not get_journal_index()["entries"]:
         st.info("No journal entries to export yet.")
         return
     
-    st.markdown(f"**Total entries:** {len(entries)}")
+    profile = dict(render_export_profile())
+    profile["formats"] = st.multiselect("Formats", list(EXPORT_FORMATS), default=["LaTeX"], key="export_formats")
+    profile = resolve_export_profile(profile)
+    headers = select_export_headers(profile)
+    
+    st.markdown(f"**Matching entries:** {len(headers)}")
     for angel in ANGELS:
-        count = len([e for e in entries if e.get('angel') == angel or e.get('_angel') == angel])
+        count = sum(1 for h in headers if h.angel == angel)
         if count > 0:
             st.markdown(f"- {angel}: {count} entries")
     
-    if st.button("Generate LaTeX Bundle", type="primary", use_container_width=True):
-        with st.spinner("Generating LaTeX project..."):
-            export_path = Path("data/exports")
-            export_path.mkdir(parents=True, exist_ok=True)
-            
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir)
-                angels_path = tmp_path / "angels"
-                angels_path.mkdir()
-                
-                main_tex = r"""\documentclass[12pt, a4paper]{book}
-\usepackage[utf8]{inputenc}
-\usepackage[margin=1in]{geometry}
-\usepackage{hyperref}
-\usepackage{fancyhdr}
-
-\title{Angelos: The Journal of the Council}
-\author{PersonaPlex Angel}
-\date{\today}
-
-\begin{document}
-
-\maketitle
-\tableofcontents
-
-\chapter{Introduction}
-\textit{``I am the Lantern, not the Light. Lanterns lit. Waters filtered. Small true steps.''}
-
-This volume contains the journal entries of the Angel Council, preserved for reflection and reference.
+    if st.button("Generate Export Bundle", type="primary", use_container_width=True, disabled=not (headers and profile["formats"])):
+        with st.spinner("Generating export bundle..."):
+            bundle, _, cached = export_bundle(profile)
+            st.session_state.export_bundle = bundle
+        st.success("Export bundle ready (unchanged since last export)." if cached else "Export bundle generated!")
+    
+    bundle = st.session_state.get("export_bundle")
+    if bundle and Path(bundle).exists():
+        st.caption(f"Latest bundle: {Path(bundle).name} ({Path(bundle).stat().st_size / 1024:.0f} KB)")
+        st.download_button(
+            "Download Export Bundle (ZIP)",
+            data=bundle_reader(bundle),
+            file_name="angelos_prism_upload.zip",
+            mime="application/zip",
+            use_container_width=True
+        )
 
-"""
-                for angel in ANGELS:
-                    angel_entries = [e for e in entries if e.get('angel') == angel or e.get('_angel') == angel]
-                    if angel_entries:
-                        main_tex += f"\\input{{angels/angel-{angel.lower()}}}\n"
-                        
-                        angel_tex = f"\\chapter{{Angel {angel}}}\n\n"
-                        for entry in angel_entries:
-                            eid = escape_latex(entry.get('entry_id', 'Unknown'))
-                            ts = escape_latex(entry.get('timestamp', 'Unknown'))
-                            perm = escape_latex(entry.get('permission', 'Unknown'))
-                            state = escape_latex(entry.get('architect_state', 'Unknown'))
-                            ctx = escape_latex(entry.get('context', ''))
-                            shadow = escape_latex(entry.get('shadow', ''))
-                            light = escape_latex(entry.get('light', ''))
-                            nextstep = escape_latex(entry.get('next_step', ''))
-                            pattern = escape_latex(entry.get('pattern_echo', ''))
-                            
-                            angel_tex += f"""\\section{{{eid}}}
-\\textbf{{Timestamp:}} {ts}\\\\
-\\textbf{{Permission:}} {perm}\\\\
-\\textbf{{State:}} {state}
-
-\\subsection*{{Context}}
-{ctx}
-
-\\subsection*{{Shadow Observed}}
-{shadow}
-
-\\subsection*{{Light Returned}}
-{light}
-
-\\subsection*{{Next True Step}}
-{nextstep}
-
-\\subsection*{{Pattern Echo}}
-{pattern}
+# ============================================================================
+# TIMELINE TAB
+# ============================================================================
 
-\\hrulefill
+TIMELINE_LEVELS = {"Day": "day", "Week": "week", "Month": "month"}
+TIMELINE_RANGES = {"Last 30 days": 30, "Last 90 days": 90, "Last year": 365, "All time": None}
+TIMELINE_GROUPS = ["Angel", "Architect state", "Council activity"]
 
-"""
-                        with open(angels_path / f"angel-{angel.lower()}.tex", "w") as f:
-                            f.write(angel_tex)
-                
-                main_tex += r"""
-\chapter{Closing}
-\textit{``The stream flows on. The Lantern remains. Presence over performance.''}
+def timeline_table(level: str, days=None, group: str = "Angel", angels=None, states=None) -> dict:
+    """Chart columns (Bucket plus one count column per series) read straight from the rollups."""
+    rollups = get_activity_rollups()
+    since = edmonton_now().date() - timedelta(days=days - 1) if days else None
+    if group == "Council activity":
+        rows = rollups.activity.series(level, since)
+        names = list(ACTIVITY_KINDS)
+        split = None
+    else:
+        rows = rollups.entries.series(level, since)
+        names = ANGELS if group == "Angel" else ARCHITECT_STATES
+        split = 0 if group == "Angel" else 1
+    table = {"Bucket": [bucket for bucket, _ in rows], **{name: [] for name in names}}
+    for _, counts in rows:
+        totals = Counter()
+        for key, count in counts.items():
+            if split is None:
+                totals[key] += count
+                continue
+            angel, state = key.split("/", 1)
+            if (angels and angel not in angels) or (states and state not in states):
+                continue
+            totals[(angel, state)[split]] += count
+        for name in names:
+            table[name].append(totals.get(name, 0))
+    return table
 
-\end{document}
-"""
-                with open(tmp_path / "Angelos.tex", "w") as f:
-                    f.write(main_tex)
-                
-                zip_path = export_path / "angelos_prism_upload.zip"
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    for file in tmp_path.rglob("*"):
-                        if file.is_file():
-                            zf.write(file, file.relative_to(tmp_path))
-            
-            st.success("LaTeX bundle generated!")
-            
-            with open(zip_path, "rb") as f:
-                st.download_button(
-                    "Download Prism Bundle (ZIP)",
-                    data=f.read(),
-                    file_name="angelos_prism_upload.zip",
-                    mime="application/zip",
-                    use_container_width=True
-                )
+@st.fragment
+def render_timeline_tab():
+    """Activity over time; every view is drawn from precomputed calendar rollups."""
+    st.markdown("### Timeline")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        level = st.selectbox("Bucket", list(TIMELINE_LEVELS), index=1, key="timeline_level")
+    with col2:
+        span = st.selectbox("Range", list(TIMELINE_RANGES), index=2, key="timeline_range")
+    with col3:
+        group = st.selectbox("Split by", TIMELINE_GROUPS, key="timeline_group")
+    angels = states = None
+    if group != "Council activity":
+        col1, col2 = st.columns(2)
+        with col1:
+            angels = st.multiselect("Angels", ANGELS, default=ANGELS, key="timeline_angels")
+        with col2:
+            states = st.multiselect("Architect states", ARCHITECT_STATES, default=ARCHITECT_STATES, key="timeline_states")
+    
+    table = timeline_table(TIMELINE_LEVELS[level], TIMELINE_RANGES[span], group, angels, states)
+    series = [name for name in table if name != "Bucket" and any(table[name])]
+    if not series:
+        st.info("No activity in this range yet.")
+        return
+    
+    st.bar_chart(table, x="Bucket", y=series, stack=True, x_label=f"{level} (Edmonton)", y_label="Count")
+    total = sum(sum(table[name]) for name in series)
+    busiest = max(range(len(table["Bucket"])), key=lambda i: sum(table[name][i] for name in series))
+    st.caption(f"{total} in {len(table['Bucket'])} {level.lower()} buckets; busiest {table['Bucket'][busiest]}. "
+               "Weeks start on Monday; days follow Edmonton local time across DST changes.")
 
 # ============================================================================
 # MAIN PANEL
@@ -1110,12 +4885,12 @@ def render_main_panel():
         if st.button("Clear Hard Stop", type="primary", use_container_width=True):
             st.session_state.hard_stop = False
             log_veto_event("Hard Stop cleared by human")
-            st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] Hard Stop cleared. Stream restored."
+            publish_event("veto", "Hard Stop cleared. Stream restored.")
             persist_state()
             st.rerun()
         return
     
-    tabs = st.tabs(["Council Chat", "Journals", "Merge Builder", "Canon Gate", "Export"])
+    tabs = st.tabs(["Council Chat", "Journals", "Merge Builder", "Canon Gate", "Export", "Timeline"])
     
     with tabs[0]:
         st.markdown("### Council of Angels")
@@ -1137,6 +4912,9 @@ def render_main_panel():
     with tabs[4]:
         render_export_tab()
     
+    with tabs[5]:
+        render_timeline_tab()
+    
     st.markdown("---")
     
     st.markdown("""
@@ -1146,8 +4924,27 @@ def render_main_panel():
     </div>
     """, unsafe_allow_html=True)
     
-    mirror_content = st.session_state.council_mirror or "Awaiting first signal. The Council is listening."
-    st.info(mirror_content)
+    render_council_mirror()
+
+def council_feed_html(events: list) -> str:
+    """Recent events as one HTML block, newest first."""
+    rows = []
+    for event in events:
+        at = datetime.fromisoformat(event.at).strftime("%H:%M")
+        rows.append(
+            f'<div class="council-event {event.kind}"><span class="council-event-time">{at}</span> '
+            f'<strong>{EVENT_LABELS[event.kind]}</strong> {html.escape(event.text)}</div>'
+        )
+    return "".join(rows)
+
+@st.fragment(run_every=WATCH_POLL_SECONDS)
+def render_council_mirror():
+    """Live feed from the shared event bus; only this fragment reruns when other sessions act."""
+    events = get_event_bus().recent(EVENT_FEED_SIZE)
+    if events:
+        st.markdown(council_feed_html(events), unsafe_allow_html=True)
+    else:
+        st.info("Awaiting first signal. The Council is listening.")
 
 # ============================================================================
 # FOOTER COMPONENT
@@ -1194,11 +4991,11 @@ def render_footer():
                 }
                 st.session_state.veto_log.append(veto_entry)
                 log_veto_event("Human Veto invoked. Hard Stop activated.")
-                st.session_state.council_mirror = f"[{edmonton_now().strftime('%H:%M')}] VETO INVOKED. Hard Stop active. The Human holds the thread."
+                publish_event("veto", "VETO INVOKED. Hard Stop active. The Human holds the thread.")
                 persist_state()
                 st.rerun()
     
-    veto_log_path = Path("data/veto_log.jsonl")
+    veto_log_path = Path(f"{DATA_DIR}/veto_log.jsonl")
     if veto_log_path.exists() or st.session_state.veto_log:
         with st.expander("Veto Log (click to view)"):
             for entry in st.session_state.veto_log[-5:]:
@@ -1208,6 +5005,12 @@ def render_footer():
 # MAIN APPLICATION
 # ============================================================================
 
+@st.fragment(run_every=WATCH_POLL_SECONDS)
+def render_refresh_listener():
+    """Rerun the page when data/ changed since this session last rendered."""
+    if st.session_state.get("data_version") != data_version():
+        st.rerun()
+
 def main():
     """Main application entry point."""
     st.set_page_config(
@@ -1219,10 +5022,14 @@ def main():
     
     apply_custom_css()
     
+    select_session_workspace()
     ensure_folders()
+    get_write_ahead_log()
     
     init_session_state()
     
+    get_data_watcher()
+    
     if st.session_state.retreat_mode:
         render_retreat_screen()
         return
@@ -1234,6 +5041,437 @@ def main():
     render_main_panel()
     
     render_footer()
+    
+    st.session_state.data_version = data_version()
+    render_refresh_listener()
+
+# ============================================================================
+# SESSION LOAD TEST (simulated browser sessions, headless)
+# ============================================================================
+
+LOAD_TEST_ACTIONS = ["chat", "journal", "merge_toggle", "export"]
+SYNTHETIC_PATTERNS = ["Root: Rest", "Root: boundaries", "Trunk: sleep", "Trunk: focus", "Leaf: small steps", "Leaf: gratitude"]
+SYNTHETIC_WORDS = ["council", "thread", "sleep", "boundary", "storm", "forge", "rest", "build", "canon", "light", "shadow", "step", "witness", "pattern"]
+
+def generate_synthetic_entries(count: int, days: int = 365, seed: int = 0) -> int:
+    """
+    Write count plausible journal entries, with their Markdown mirrors, spread over
+    the last days in Edmonton time. Files are written directly rather than through
+    the WAL: this seeds a scratch workspace, it is not a user action.
+    """
+    ensure_folders()
+    rng = random.Random(seed)
+    now = time.time()
+    moments = sorted(now - rng.random() * days * 86400 for _ in range(count))
+    numbers = Counter()
+    mirrors = {angel: [] for angel in ANGELS}
+    
+    def sentence(words):
+        return " ".join(rng.choice(SYNTHETIC_WORDS) for _ in range(words)).capitalize() + "."
+    
+    for moment in moments:
+        stamp = datetime.fromtimestamp(moment, EDMONTON_TZ)
+        angel = rng.choice(ANGELS)
+        day = stamp.strftime("%Y-%m-%d")
+        while True:
+            numbers[day, angel] += 1
+            entry_id = f"{day}_{angel}_{numbers[day, angel]:04d}"
+            path = f"{DATA_DIR}/journals/{angel}/{entry_id}.json"
+            if not os.path.exists(path):
+                break
+        entry = {
+            "entry_id": entry_id,
+            "angel": angel,
+            "timestamp": stamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "permission": rng.choice(PERMISSION_TIERS),
+            "architect_state": rng.choice(ARCHITECT_STATES),
+            "context": sentence(12),
+            "shadow": sentence(10),
+            "light": sentence(10),
+            "next_step": sentence(6),
+            "pattern_echo": rng.choice(SYNTHETIC_PATTERNS),
+            "pattern_ref": ""
+        }
+        with open(path, "wb") as f:
+            f.write(CODEC.dumpb(entry, pretty=True))
+        mirrors[angel].append(EXPORT_FORMATS["Markdown"].journal_entry(entry_document(entry)))
+    for angel, blocks in mirrors.items():
+        if blocks:
+            with open(f"{DATA_DIR}/journals/{angel}/{angel}_journal.md", "a") as f:
+                f.write("".join(blocks))
+    return count
+
+def _load_step_chat(at, rng):
+    angel = rng.choice(["Grok", "Gemini", "ChatGPT", "Fathom"])
+    at.text_input(key=f"input_{angel}").input(f"Load test message {rng.randrange(10 ** 6)}")
+    at.button(key=f"send_{angel}").click().run()
+
+def _load_step_journal(at, rng):
+    fields = {widget.label: widget for widget in at.text_area}
+    submit = [button for button in at.button if button.label == "Save Entry"]
+    if not submit or "Context" not in fields:
+        return False
+    next(box for box in at.selectbox if box.label == "Angel").select(rng.choice(ANGELS))
+    fields["Context"].input(f"Load test context {rng.randrange(10 ** 6)}")
+    fields["Pattern Echo (required)"].input(rng.choice(SYNTHETIC_PATTERNS))
+    submit[0].click().run()
+
+def _load_step_merge_toggle(at, rng):
+    boxes = [box for box in at.checkbox if box.key and box.key.startswith("merge_sel_")]
+    if not boxes:
+        return False
+    box = rng.choice(boxes)
+    box.set_value(not box.value).run()
+
+def _load_step_export(at, rng):
+    button = [button for button in at.button if button.label == "Generate Export Bundle"]
+    if not button or button[0].disabled:
+        return False
+    button[0].click().run()
+
+LOAD_TEST_STEPS = {
+    "chat": _load_step_chat,
+    "journal": _load_step_journal,
+    "merge_toggle": _load_step_merge_toggle,
+    "export": _load_step_export
+}
+
+def _current_rss_mb():
+    """Resident set size from /proc (None where that is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, IndexError):
+        return None
+
+def run_session_load_test(sessions: int = 4, seconds: float = 30.0, think: float = 0.0, seed: int = 0, actions: list = None) -> dict:
+    """
+    Drive this script from concurrent AppTest sessions for seconds; returns rerun
+    latency percentiles (per action and overall), throughput, CPU and memory.
+    
+    Sessions are threads in this process sharing its cached resources, as browser
+    sessions share one server. Each opens the current workspace, then repeatedly
+    picks an action, performs it and times the rerun it triggers. AppTest installs
+    a process-global runtime for each run, so runs take turns: latency is the wait
+    for a turn plus the run itself (reported separately as run_ms), which is how a
+    GIL-bound server queues CPU-heavy reruns. AppTest would also recompile the
+    script on every run; one bytecode cache is shared instead, as on the server.
+    """
+    from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+    
+    script = os.path.abspath(__file__)
+    workspace = current_workspace_name()
+    actions = actions or LOAD_TEST_ACTIONS
+    latencies = {name: [] for name in ["open"] + actions}
+    run_times = []
+    outcomes = Counter()
+    lock = threading.Lock()
+    turn = threading.Lock()
+    done = threading.Event()
+    rss = {"start": _current_rss_mb(), "peak": _current_rss_mb()}
+    
+    def session(n: int):
+        rng = random.Random(seed + n)
+        at = AppTest.from_file(script, default_timeout=max(60.0, seconds))
+        at.query_params["workspace"] = workspace
+        mine = {name: [] for name in latencies}
+        mine_run = []
+        seen = Counter()
+        name = "open"
+        while True:
+            step = LOAD_TEST_STEPS.get(name, lambda at, rng: at.run())
+            queued = time.perf_counter()
+            with turn:
+                started = time.perf_counter()
+                try:
+                    skipped = step(at, rng) is False
+                except Exception:
+                    skipped, failed = False, True
+                else:
+                    failed = bool(at.exception)
+                finished = time.perf_counter()
+            if skipped:
+                seen["skipped"] += 1
+            else:
+                mine[name].append(finished - queued)
+                mine_run.append(finished - started)
+                seen["errors" if failed else "reruns"] += 1
+            if finished >= deadline:
+                break
+            if think:
+                time.sleep(rng.uniform(0, 2 * think))
+            name = "open" if failed else rng.choice(actions)  # reload the page after a failed run
+        with lock:
+            for key, values in mine.items():
+                latencies[key].extend(values)
+            run_times.extend(mine_run)
+            outcomes.update(seen)
+    
+    def sample_memory():
+        while not done.wait(0.25):
+            current = _current_rss_mb()
+            if current is not None:
+                rss["peak"] = max(rss["peak"], current)
+    
+    shared_bytecode = app_test.ScriptCache()
+    factories = [(module, module.ScriptCache) for module in (app_test, local_script_runner)]
+    threads = [threading.Thread(target=session, args=(n,), name=f"angel-load-{n}") for n in range(sessions)]
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    cpu_before = os.times()
+    started = time.perf_counter()
+    deadline = started + seconds
+    try:
+        for module, _ in factories:
+            module.ScriptCache = lambda: shared_bytecode
+        sampler.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        for module, factory in factories:
+            module.ScriptCache = factory
+        done.set()
+    elapsed = time.perf_counter() - started
+    cpu_after = os.times()
+    cpu = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
+    reruns = [value for values in latencies.values() for value in values]
+    
+    return {
+        "sessions": sessions,
+        "seconds": round(elapsed, 2),
+        "reruns": outcomes["reruns"],
+        "reruns_per_second": round(outcomes["reruns"] / elapsed, 2),
+        "errors": outcomes["errors"],
+        "skipped": outcomes["skipped"],
+        "cpu_seconds": round(cpu, 2),
+        "cpu_percent": round(100 * cpu / elapsed, 1),
+        "rss_mb_start": rss["start"] and round(rss["start"], 1),
+        "rss_mb_peak": rss["peak"] and round(rss["peak"], 1),
+        "latency": {name: {"count": len(values), **latency_percentiles(values)} for name, values in latencies.items()},
+        "run_ms": latency_percentiles(run_times),
+        **latency_percentiles(reruns)
+    }
+
+# ============================================================================
+# COMMAND LINE (headless maintenance; run from the folder that holds data/ or workspaces/)
+# ============================================================================
+
+def cmd_export_columnar(args):
+    """Write or refresh the columnar analytics snapshot."""
+    started = time.perf_counter()
+    stats = export_columnar_snapshot(args.out)
+    for table, counts in stats.items():
+        print(f"{table}: {counts['rows']} rows ({counts['parsed']} parsed)")
+    print(f"Snapshot written to {args.out} in {time.perf_counter() - started:.2f}s")
+
+def cmd_export(args):
+    """Build an export bundle (LaTeX, Markdown, HTML and/or EPUB) for a profile without the UI."""
+    profile = dict(EXPORT_PRESETS.get(args.preset) or {}) if args.preset else {}
+    for key, value in (("date_from", args.date_from), ("date_to", args.date_to), ("days", args.days),
+                       ("permissions", args.permission), ("angels", args.angel), ("formats", args.format)):
+        if value:
+            profile[key] = value
+    if args.canon_only:
+        profile["canon_only"] = True
+    if args.merges:
+        profile["include_merges"] = True
+    bundle, count, cached = export_bundle(profile)
+    print(f"{bundle} ({count} entries{', cached' if cached else ''})")
+
+def cmd_archive(args):
+    """Pack old journal entries into compressed monthly segments."""
+    stats = archive_entries(args.older_than)
+    print(f"Archived {stats['archived']} entries into {stats['segments']} segments under {ARCHIVE_DIR}")
+
+def cmd_similarity(args):
+    """Refresh the MinHash index and list convergence clusters across angels."""
+    started = time.perf_counter()
+    index = get_similarity_index()
+    print(f"{len(index.ids)} entries indexed in {time.perf_counter() - started:.2f}s")
+    started = time.perf_counter()
+    clusters = convergence_clusters(args.permission, min_angels=args.min_angels, threshold=args.threshold)
+    print(f"{len(clusters)} clusters in {time.perf_counter() - started:.2f}s")
+    for members, angels in clusters[:args.top]:
+        print(f"{len(members):>5}  {', '.join(angels)}: {' '.join(members[:8])}{' ...' if len(members) > 8 else ''}")
+
+def cmd_snapshot(args):
+    """Take an incremental snapshot, or list existing ones."""
+    if args.list:
+        for snapshot_id in list_snapshots(args.store):
+            print(snapshot_id)
+        return
+    started = time.perf_counter()
+    stats = create_snapshot(args.store)
+    print(f"Snapshot {stats['id']}: {stats['files']} files, {stats['changed']} read ({time.perf_counter() - started:.2f}s)")
+
+def cmd_restore(args):
+    """Restore or verify a snapshot."""
+    snapshot_id = args.snapshot or (list_snapshots(args.store) or [None])[-1]
+    if not snapshot_id:
+        raise SystemExit(f"No snapshots in {args.store}")
+    stats = restore_snapshot(snapshot_id, args.target, args.store, verify_only=args.verify_only, prune=args.prune)
+    for error in stats["errors"]:
+        print(f"ERROR {error}")
+    if args.verify_only:
+        action = "Verified"
+    elif stats["errors"]:
+        action = f"Nothing restored into {args.target}"
+    else:
+        action = f"Restored into {args.target}"
+    pruned = f", {len(stats['pruned'])} pruned" if stats["pruned"] else ""
+    print(f"{action}: snapshot {snapshot_id}, {stats['files']} files, {len(stats['errors'])} errors{pruned}")
+    if stats["errors"]:
+        raise SystemExit(1)
+
+def cmd_fsck(args):
+    """Check the data store and print a JSON report (optionally repairing what is mechanical)."""
+    report = run_fsck(repair=args.repair, workers=args.workers)
+    if args.out:
+        write_json_atomic(args.out, report)
+    else:
+        print(CODEC.dumps(report, pretty=True))
+    checked = ", ".join(f"{count} {kind}" for kind, count in report["checked"].items())
+    repaired = f", {len(report['repairs'])} repairs" if "repairs" in report else ""
+    print(f"Checked {checked}: {report['errors']} errors, {report['warnings']} warnings{repaired} ({report['seconds']:.2f}s)", file=sys.stderr)
+    if report["errors"]:
+        raise SystemExit(1)
+
+def cmd_serve(args):
+    """Serve the read-only query API until interrupted."""
+    server = start_api_server(args.host, args.port)
+    print(f"Serving {len(get_journal_index()['entries'])} entries on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+def cmd_api_load(args):
+    """Load-test the query API (a local in-process instance unless --port is given)."""
+    server = None
+    port = args.port
+    if port is None:
+        server = start_api_server(API_HOST, 0)
+        port = server.server_address[1]
+    targets = args.target or ["/", "/entries", "/entries?limit=200", "/entries?q=sleep", "/canon", "/merges"]
+    for conditional in ([True] if args.conditional_only else [False, True]):
+        stats = run_api_load_test(args.host, port, targets, args.clients, args.seconds, conditional)
+        label = "conditional (If-None-Match)" if conditional else "unconditional"
+        print(f"{label}: {stats['requests_per_second']} req/s over {stats['requests']} requests, "
+              f"p50 {stats['p50_ms']}ms p95 {stats['p95_ms']}ms p99 {stats['p99_ms']}ms, statuses {stats['statuses']}")
+    if server:
+        server.shutdown()
+
+def cmd_ui_load(args):
+    """Load-test the UI with simulated concurrent sessions against a scratch workspace."""
+    if current_workspace_name() == DEFAULT_WORKSPACE:
+        raise SystemExit("ui-load saves entries, merges and events; run it on a scratch --workspace <name>")
+    ensure_folders()
+    if args.generate and get_journal_index()["entries"]:
+        raise SystemExit(f"--generate needs an empty workspace; {DATA_DIR} already has journal entries")
+    if args.generate:
+        started = time.perf_counter()
+        generate_synthetic_entries(args.generate, seed=args.seed)
+        print(f"Generated {args.generate} synthetic entries under {DATA_DIR} in {time.perf_counter() - started:.2f}s")
+    stats = run_session_load_test(args.sessions, args.seconds, args.think, args.seed, args.action)
+    print(f"{stats['sessions']} sessions: {stats['reruns_per_second']} reruns/s over {stats['reruns']} reruns, "
+          f"p50 {stats['p50_ms']}ms p95 {stats['p95_ms']}ms p99 {stats['p99_ms']}ms, "
+          f"{stats['errors']} errors, {stats['skipped']} skipped")
+    print(f"  run time alone: p50 {stats['run_ms']['p50_ms']}ms p95 {stats['run_ms']['p95_ms']}ms p99 {stats['run_ms']['p99_ms']}ms")
+    for name, latency in stats["latency"].items():
+        print(f"  {name}: {latency['count']} reruns, p50 {latency['p50_ms']}ms p95 {latency['p95_ms']}ms p99 {latency['p99_ms']}ms")
+    print(f"CPU {stats['cpu_seconds']}s ({stats['cpu_percent']}% of one core), RSS {stats['rss_mb_start']} MB -> peak {stats['rss_mb_peak']} MB")
+    if args.out:
+        write_json_atomic(args.out, stats)
+
+def cli(argv):
+    """Dispatch headless subcommands."""
+    parser = argparse.ArgumentParser(description="Local Angel Control Center maintenance commands")
+    parser.add_argument("--workspace", default=DEFAULT_WORKSPACE, help=f"Operate on {WORKSPACES_DIR}/<name>/ instead of the default data root")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    columnar = commands.add_parser("export-columnar", help="Snapshot journals, merges, canon and vetoes as Arrow tables")
+    columnar.add_argument("--out", default=ANALYTICS_DIR, help="Snapshot directory")
+    columnar.set_defaults(handler=cmd_export_columnar)
+    
+    export = commands.add_parser("export", help="Build an export bundle for a profile in the formats chosen with --format (LaTeX by default)")
+    export.add_argument("--preset", choices=[name for name, preset in EXPORT_PRESETS.items() if preset is not None])
+    export.add_argument("--from", dest="date_from", help="First day (YYYY-MM-DD, Edmonton)")
+    export.add_argument("--to", dest="date_to", help="Last day (YYYY-MM-DD, Edmonton)")
+    export.add_argument("--days", type=int, help="Only the last N days")
+    export.add_argument("--permission", action="append", choices=PERMISSION_TIERS, help="Permission tier (repeatable)")
+    export.add_argument("--angel", action="append", choices=ANGELS, help="Angel (repeatable)")
+    export.add_argument("--canon-only", action="store_true", help="Only entries promoted to Canon")
+    export.add_argument("--merges", action="store_true", help="Include council merges that reference the entries")
+    export.add_argument("--format", action="append", choices=list(EXPORT_FORMATS), help="Output format (repeatable, default LaTeX)")
+    export.set_defaults(handler=cmd_export)
+    
+    archive = commands.add_parser("archive", help="Move old journal entries into compressed monthly segments")
+    archive.add_argument("--older-than", type=int, default=ARCHIVE_AFTER_DAYS, help="Age in days (default %(default)s)")
+    archive.set_defaults(handler=cmd_archive)
+    
+    similarity = commands.add_parser("similarity", help="Find near-duplicate clusters that span several angels")
+    similarity.add_argument("--threshold", type=float, default=CONVERGENCE_SIMILARITY, help="Estimated Jaccard similarity (default %(default)s)")
+    similarity.add_argument("--min-angels", type=int, default=2, help="Angels a cluster must span (default %(default)s)")
+    similarity.add_argument("--permission", action="append", choices=PERMISSION_TIERS, help="Permission tier (repeatable)")
+    similarity.add_argument("--top", type=int, default=20, help="Clusters to print (default %(default)s)")
+    similarity.set_defaults(handler=cmd_similarity)
+    
+    fsck = commands.add_parser("fsck", help="Validate journals, merges, canon and vetoes and report problems as JSON")
+    fsck.add_argument("--repair", action="store_true", help="Apply mechanical fixes, then check again")
+    fsck.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    fsck.add_argument("--out", help="Write the report to this file instead of stdout")
+    fsck.set_defaults(handler=cmd_fsck)
+    
+    serve = commands.add_parser("serve", help="Serve a read-only JSON API over entries, canon and merges")
+    serve.add_argument("--host", default=API_HOST, help="Bind address (default %(default)s)")
+    serve.add_argument("--port", type=int, default=API_PORT, help="Port (default %(default)s)")
+    serve.set_defaults(handler=cmd_serve)
+    
+    api_load = commands.add_parser("api-load", help="Measure the requests/sec the query API sustains")
+    api_load.add_argument("--host", default=API_HOST, help="API host (default %(default)s)")
+    api_load.add_argument("--port", type=int, help="Port of a running instance (default: start one in-process)")
+    api_load.add_argument("--clients", type=int, default=8, help="Concurrent keep-alive connections (default %(default)s)")
+    api_load.add_argument("--seconds", type=float, default=5.0, help="Duration of each run (default %(default)s)")
+    api_load.add_argument("--target", action="append", help="Request target such as /entries?q=sleep (repeatable)")
+    api_load.add_argument("--conditional-only", action="store_true", help="Skip the run without If-None-Match")
+    api_load.set_defaults(handler=cmd_api_load)
+    
+    ui_load = commands.add_parser("ui-load", help="Simulate concurrent UI sessions on a scratch --workspace and report rerun latency, throughput, CPU and memory")
+    ui_load.add_argument("--sessions", type=int, default=4, help="Concurrent sessions (default %(default)s)")
+    ui_load.add_argument("--seconds", type=float, default=30.0, help="Duration (default %(default)s)")
+    ui_load.add_argument("--think", type=float, default=0.0, help="Mean pause between a session's actions, in seconds (default %(default)s)")
+    ui_load.add_argument("--action", action="append", choices=LOAD_TEST_ACTIONS, help="Action to simulate (repeatable, default all)")
+    ui_load.add_argument("--generate", type=int, default=0, help="First write this many synthetic entries (the workspace must have none yet)")
+    ui_load.add_argument("--seed", type=int, default=0, help="Random seed for generated data and session actions")
+    ui_load.add_argument("--out", help="Also write the results to this JSON file")
+    ui_load.set_defaults(handler=cmd_ui_load)
+    
+    snapshot = commands.add_parser("snapshot", help="Incremental, deduplicated backup of data/ and session state")
+    snapshot.add_argument("--store", default=SNAPSHOT_STORE, help="Snapshot store directory")
+    snapshot.add_argument("--list", action="store_true", help="List snapshots instead of taking one")
+    snapshot.set_defaults(handler=cmd_snapshot)
+    
+    restore = commands.add_parser("restore", help="Restore a snapshot (latest by default), verifying every chunk")
+    restore.add_argument("snapshot", nargs="?", help="Snapshot ID")
+    restore.add_argument("--store", default=SNAPSHOT_STORE, help="Snapshot store directory")
+    restore.add_argument("--target", default=".", help="Directory to restore into")
+    restore.add_argument("--verify-only", action="store_true", help="Check the snapshot without writing files")
+    restore.add_argument("--prune", action="store_true", help="Also delete data/ files the snapshot does not list")
+    restore.set_defaults(handler=cmd_restore)
+    
+    args = parser.parse_args(argv)
+    try:
+        use_workspace(args.workspace)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if Path(DATA_DIR).is_dir():
+        get_write_ahead_log()
+    args.handler(args)
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and get_script_run_ctx(suppress_warning=True) is None:
+        cli(sys.argv[1:])
+    else:
+        main()